@@ -1,17 +1,22 @@
 from __future__ import annotations
+import csv
+import io
+import json
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase, APIRequestFactory
 
 from items.models import Category
+from matches.metrics import registry as matching_metrics
 from matches.models import Match
 from reports.models import Report
 
-from .views import AdminStatsView, IsAdmin
+from .views import AdminStatsView, IsAdmin, MatchingMetricsView
 
 User = get_user_model()
 
@@ -107,6 +112,9 @@ class IsAdminPermissionTest(TestCase):
         self.assertTrue(self.permission.has_permission(request, None))
 
 
+# Fixtures create their Match rows explicitly; keep the post_save signal from
+# matching the same pairs first.
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class AdminStatsViewTest(APITestCase):
     """Test cases for the AdminStatsView."""
 
@@ -456,6 +464,7 @@ class AdminStatsViewTest(APITestCase):
             self.assertGreaterEqual(category['count'], 0)
 
 
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class AdminPanelIntegrationTest(APITestCase):
     """Integration tests for the adminpanel module."""
 
@@ -677,6 +686,197 @@ class AdminPanelIntegrationTest(APITestCase):
             self.assertEqual(responses[0], responses[i])
 
 
+class MatchingMetricsViewTest(APITestCase):
+    """Test cases for the MatchingMetricsView."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="testpass123",
+            role=User.Roles.ADMIN
+        )
+
+        self.regular_user = User.objects.create_user(
+            username="user",
+            email="user@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        matching_metrics.reset()
+        matching_metrics.record({"candidates": 2.0, "scoring": 1.0}, {"candidates_scanned": 5})
+
+    def test_admin_reads_metrics(self):
+        """Test that admins get the registry snapshot."""
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(reverse('admin-matching-metrics'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["runs"], 1)
+        self.assertEqual(response.data["counters"], {"candidates_scanned": 5})
+        self.assertEqual(response.data["stages"]["candidates"]["total_ms"], 2.0)
+
+    def test_admin_resets_metrics(self):
+        """Test that DELETE clears the registry."""
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.delete(reverse('admin-matching-metrics'))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(matching_metrics.snapshot()["runs"], 0)
+
+    def test_regular_user_denied(self):
+        """Test that regular users cannot read matching metrics."""
+        self.client.force_authenticate(user=self.regular_user)
+        response = self.client.get(reverse('admin-matching-metrics'))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ReportImportViewTest(APITestCase):
+    """Test cases for the ReportImportView."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="testpass123",
+            role=User.Roles.ADMIN
+        )
+        self.regular_user = User.objects.create_user(
+            username="user",
+            email="user@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.url = reverse('admin-report-import')
+
+    def upload(self, name, content):
+        return SimpleUploadedFile(name, content.encode(), content_type="application/octet-stream")
+
+    def test_admin_imports_csv(self):
+        """Test that valid rows are created and invalid rows reported by line."""
+        content = (
+            "title,description,category,report_type,location,date_lost_found\n"
+            "Black Wallet,Leather wallet,Electronics,found,Gym,2025-11-01\n"
+            "Blue Umbrella,Folding umbrella,Umbrellas,found,Library,2025-11-02\n"
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(self.url, {"file": self.upload("nightly.csv", content)}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["errors"][0]["line"], 3)
+        self.assertIn("category", response.data["errors"][0]["errors"])
+        report = Report.objects.get(title="Black Wallet")
+        self.assertEqual(report.reported_by, self.admin_user)
+        self.assertEqual(report.category, self.category)
+
+    def test_format_override(self):
+        """Test that ?file_format= overrides detection from the file name."""
+        content = '{"title": "Black Wallet", "description": "Leather", "category": "Electronics", ' \
+            '"report_type": "found", "location": "Gym", "date_lost_found": "2025-11-01"}\n'
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(
+            f"{self.url}?file_format=ndjson", {"file": self.upload("nightly.txt", content)}, format="multipart"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 1)
+
+    def test_unknown_format_rejected(self):
+        """Test that files of an unknown format are refused."""
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(self.url, {"file": self.upload("nightly.txt", "x")}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_regular_user_denied(self):
+        """Test that regular users cannot import reports."""
+        self.client.force_authenticate(user=self.regular_user)
+        response = self.client.post(self.url, {"file": self.upload("nightly.csv", "")}, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(MATCHING_QUEUE_MODE="queue")
+class DataExportViewTest(APITestCase):
+    """Test cases for the DataExportView."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.admin_user = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="testpass123",
+            role=User.Roles.ADMIN
+        )
+        self.regular_user = User.objects.create_user(
+            username="user",
+            email="user@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.lost = self.create_report("Lost Laptop", Report.ReportType.LOST)
+        self.found = self.create_report("Found Laptop", Report.ReportType.FOUND)
+        self.match = Match.objects.create(lost_report=self.lost, found_report=self.found, confidence_score=0.8)
+
+    def create_report(self, title, report_type):
+        return Report.objects.create(
+            title=title,
+            description="Grey laptop",
+            category=self.category,
+            report_type=report_type,
+            location="Library",
+            date_lost_found=timezone.now().date(),
+            reported_by=self.regular_user
+        )
+
+    def export(self, kind, **params):
+        response = self.client.get(reverse('admin-export', args=[kind]), params)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_reports_ndjson_with_browse_filters(self):
+        """Test that report exports stream NDJSON and honour the browse filters."""
+        self.client.force_authenticate(user=self.admin_user)
+        response, body = self.export("reports", type="lost")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row["id"] for row in rows], [self.lost.id])
+        self.assertEqual(rows[0]["category_id"], self.category.id)
+
+    def test_matches_csv(self):
+        """Test that match exports stream CSV with a header row."""
+        self.client.force_authenticate(user=self.admin_user)
+        response, body = self.export("matches", file_format="csv", min_confidence="0.5")
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["lost_report_id"], str(self.lost.id))
+
+    def test_invalid_parameters(self):
+        """Test that unknown exports and formats are refused before streaming."""
+        self.client.force_authenticate(user=self.admin_user)
+        self.assertEqual(self.client.get(reverse('admin-export', args=["users"])).status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(reverse('admin-export', args=["reports"]), {"file_format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(reverse('admin-export', args=["matches"]), {"min_confidence": "high"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_regular_user_denied(self):
+        """Test that regular users cannot export data."""
+        self.client.force_authenticate(user=self.regular_user)
+        response = self.client.get(reverse('admin-export', args=["reports"]))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
 class AdminPanelURLTest(TestCase):
     """Test cases for adminpanel URLs."""
 
@@ -693,4 +893,11 @@ class AdminPanelURLTest(TestCase):
         resolver = resolve('/api/admin/stats/')
         self.assertEqual(resolver.view_name, 'admin-stats')
         # Check that it resolves to the correct view class
-        self.assertEqual(resolver.func.view_class, AdminStatsView)
\ No newline at end of file
+        self.assertEqual(resolver.func.view_class, AdminStatsView)
+
+    def test_matching_metrics_url_resolves(self):
+        """Test that the matching metrics URL resolves to its view."""
+        from django.urls import resolve
+
+        self.assertEqual(reverse('admin-matching-metrics'), '/api/admin/matching-metrics/')
+        self.assertEqual(resolve('/api/admin/matching-metrics/').func.view_class, MatchingMetricsView)
@@ -1,9 +1,12 @@
 from django.urls import path
 
-from .views import AdminStatsView
+from .views import AdminStatsView, DataExportView, MatchingMetricsView, ReportImportView
 
 urlpatterns = [
     path("stats/", AdminStatsView.as_view(), name="admin-stats"),
+    path("matching-metrics/", MatchingMetricsView.as_view(), name="admin-matching-metrics"),
+    path("reports/import/", ReportImportView.as_view(), name="admin-report-import"),
+    path("export/<str:kind>/", DataExportView.as_view(), name="admin-export"),
 ]
 
 
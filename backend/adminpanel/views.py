@@ -1,9 +1,13 @@
 from __future__ import annotations
 from django.db.models import Count
-from rest_framework import permissions
+from django.http import StreamingHttpResponse
+from rest_framework import parsers, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from matches.metrics import registry as matching_metrics
 from matches.models import Match
+from reports.export import CONTENT_TYPES, EXPORTS, FORMATS as EXPORT_FORMATS, export_lines
+from reports.importer import FORMATS, detect_format, import_reports
 from reports.models import Report
 
 
@@ -40,3 +44,75 @@ class AdminStatsView(APIView):
         )
 
 
+class MatchingMetricsView(APIView):
+    """Per-stage matching timings and counters collected by this process."""
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        return Response(matching_metrics.snapshot())
+
+    def delete(self, request):
+        matching_metrics.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ReportImportView(APIView):
+    """Bulk-import reports from an uploaded CSV or NDJSON ``file``.
+
+    The upload is parsed as a stream and inserted in batches, with matching
+    scheduled once per batch. ``?file_format=`` overrides detection from the file
+    name or content type.
+    """
+
+    permission_classes = [IsAdmin]
+    parser_classes = [parsers.MultiPartParser]
+
+    def post(self, request):
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response({"detail": "Upload a CSV or NDJSON file as 'file'."}, status=status.HTTP_400_BAD_REQUEST)
+        fmt = request.query_params.get("file_format") or detect_format(upload.name, upload.content_type or "")
+        if fmt not in FORMATS:
+            return Response({"detail": f"Format must be one of: {', '.join(FORMATS)}."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            batch_size = max(1, int(request.query_params.get("batch_size", 500)))
+        except ValueError:
+            return Response({"detail": "batch_size must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = import_reports(upload, fmt, request.user, batch_size)
+        return Response(
+            {
+                "rows": result.rows,
+                "created": result.created,
+                "batches": result.batches,
+                "errors": [{"line": line, "errors": errors} for line, errors in result.errors],
+            },
+            status=status.HTTP_201_CREATED if result.created else status.HTTP_200_OK,
+        )
+
+
+class DataExportView(APIView):
+    """Stream every report or match as NDJSON (default) or CSV.
+
+    Reports accept the browse filters of ``ReportViewSet``; matches accept
+    ``status``, ``category``, ``min_confidence`` and the created date range.
+    ``?file_format=csv`` switches the encoding.
+    """
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request, kind):
+        if kind not in EXPORTS:
+            return Response({"detail": f"Export must be one of: {', '.join(EXPORTS)}."}, status=status.HTTP_404_NOT_FOUND)
+        fmt = request.query_params.get("file_format", "ndjson")
+        if fmt not in EXPORT_FORMATS:
+            return Response({"detail": f"Format must be one of: {', '.join(EXPORT_FORMATS)}."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            lines = export_lines(kind, request.query_params, fmt)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(lines, content_type=CONTENT_TYPES[fmt])
+        response["Content-Disposition"] = f'attachment; filename="{kind}.{fmt}"'
+        return response
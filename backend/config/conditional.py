@@ -0,0 +1,96 @@
+"""Conditional GET (ETag / Last-Modified) for API views.
+
+Validators come from one aggregate query per request (row count plus the
+latest ``updated_at`` of everything the response renders) rather than from
+hashing the body, so an unchanged resource answers 304 before the queryset is
+serialized. Counts catch deletions, which never move ``max(updated_at)``.
+"""
+from __future__ import annotations
+import hashlib
+from datetime import datetime, timezone as dt_timezone
+from functools import wraps
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max, QuerySet
+from django.http import Http404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def aggregate_validators(queryset: QuerySet, fields: tuple[str, ...] = ("updated_at",), **extra) -> tuple:
+    """``(count, latest, *extra)`` for ``queryset`` in a single query.
+
+    ``latest`` is the newest value across ``fields``; ``extra`` are additional
+    aggregates folded into the ETag, e.g. an unread count.
+    """
+    aggregates = {f"last_{i}": Max(field) for i, field in enumerate(fields)}
+    row = queryset.order_by().aggregate(validator_count=Count("pk"), **aggregates, **extra)
+    stamps = [row[f"last_{i}"] for i in range(len(fields)) if row[f"last_{i}"] is not None]
+    return (row["validator_count"], max(stamps) if stamps else None, *(row[key] for key in extra))
+
+
+def conditional_response(request, validators: tuple, render):
+    """Return 304/412 when ``validators`` match the request, else ``render()`` with validator headers.
+
+    ``validators`` is ``(count, latest, ...)`` as from ``aggregate_validators``.
+    The ETag also covers the full path and the user, since both change what
+    the same rows render as.
+    """
+    latest = validators[1] if len(validators) > 1 else None
+    user_id = getattr(getattr(request, "user", None), "pk", None)
+    key = "|".join(str(part) for part in (request.get_full_path(), user_id, *validators))
+    etag = quote_etag(hashlib.md5(key.encode(), usedforsecurity=False).hexdigest())
+    last_modified = None
+    if isinstance(latest, datetime):
+        if timezone.is_naive(latest):
+            latest = timezone.make_aware(latest, dt_timezone.utc)
+        last_modified = int(latest.timestamp())
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = render()
+    if request.method in ("GET", "HEAD") and response.status_code in (200, 304):
+        response.headers["ETag"] = etag
+        if last_modified is not None:
+            response.headers["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def conditional(validators_func):
+    """Decorator form of ``conditional_response`` for function views.
+
+    ``validators_func`` receives the view's arguments and returns the
+    validator tuple. Place it below ``@api_view`` so the user is authenticated.
+    """
+    def decorator(view):
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            validators = validators_func(request, *args, **kwargs)
+            return conditional_response(request, validators, lambda: view(request, *args, **kwargs))
+        return inner
+    return decorator
+
+
+class ConditionalGetMixin:
+    """Conditional ``list`` and ``retrieve`` for model viewsets.
+
+    ``validator_fields`` lists the timestamp lookups the serialized output
+    depends on, e.g. nested reports' ``updated_at`` for a match detail.
+    """
+
+    validator_fields: tuple[str, ...] = ("updated_at",)
+    retrieve_validator_fields: tuple[str, ...] | None = None
+
+    def list(self, request, *args, **kwargs):
+        validators = aggregate_validators(self.filter_queryset(self.get_queryset()), self.validator_fields)
+        return conditional_response(request, validators, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(**{self.lookup_field: kwargs[lookup]})
+        except (TypeError, ValueError, ValidationError):
+            # Same as DRF's get_object_or_404: a malformed pk is a missing object.
+            raise Http404
+        validators = aggregate_validators(queryset, self.retrieve_validator_fields or self.validator_fields)
+        return conditional_response(request, validators, lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
 
@@ -89,6 +90,33 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+
+# Cache backend: "locmem" (per process), "file" (shared between processes on
+# one host) or a dotted backend path with CACHE_LOCATION, e.g. Redis. The
+# browse cache is invalidated by bumping a version key, and find_matches
+# memoizes and rate-limits through the cache, so every worker must see the
+# same cache: the default is "file". Use "locmem" only with a single process,
+# and a shared backend such as Redis once workers span several hosts. Tests
+# use "locmem" so nothing outlives the test run.
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "locmem" if TESTING else "file")
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+}
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS.get(CACHE_BACKEND, CACHE_BACKEND),
+        "LOCATION": os.environ.get(
+            "CACHE_LOCATION", str(BASE_DIR / ".cache") if CACHE_BACKEND == "file" else "lost-and-found"
+        ),
+        # Past MAX_ENTRIES the file and locmem backends cull entries, and the
+        # file backend picks them at random; keep it well above the number of
+        # distinct browse pages so live entries are rarely culled.
+        "OPTIONS": {"MAX_ENTRIES": int(os.environ.get("CACHE_MAX_ENTRIES", 10000))},
+    }
+}
+
 AUTH_USER_MODEL = "users.User"
 
 REST_FRAMEWORK = {
@@ -117,7 +145,44 @@ MATCHING_WEIGHTS = {
     "category": float(os.environ.get("MATCHING_WEIGHT_CATEGORY", 0.6)),
     "keyword": float(os.environ.get("MATCHING_WEIGHT_KEYWORD", 0.4)),
     "date_boost": float(os.environ.get("MATCHING_WEIGHT_DATE_BOOST", 0.05)),
+    # Keyword scorer: "jaccard" (plain overlap) or "bm25" (IDF-weighted)
+    "scorer": os.environ.get("MATCHING_KEYWORD_SCORER", "jaccard"),
 }
+MATCHING_MAX_MATCHES_PER_REPORT = int(os.environ.get("MATCHING_MAX_MATCHES_PER_REPORT", 10))
+MATCHING_MIN_SHARED_TOKENS = int(os.environ.get("MATCHING_MIN_SHARED_TOKENS", 1))
+MATCHING_BULK_BATCH_SIZE = int(os.environ.get("MATCHING_BULK_BATCH_SIZE", 500))
+# MinHash/LSH candidate pruning for large categories; 0 bands disables it.
+# b bands of r rows make pairs above roughly (1/b) ** (1/r) Jaccard collide.
+# Run `manage.py rebuild_match_index` after enabling or changing these.
+MATCHING_LSH_BANDS = int(os.environ.get("MATCHING_LSH_BANDS", 0))
+MATCHING_LSH_ROWS = int(os.environ.get("MATCHING_LSH_ROWS", 2))
+MATCHING_LSH_MIN_CATEGORY_SIZE = int(os.environ.get("MATCHING_LSH_MIN_CATEGORY_SIZE", 5000))
+
+# Report `?q=` search: "fts5" uses the SQLite full-text index (other databases
+# fall back to the token filter), "tokens" always uses the token filter.
+REPORTS_SEARCH_BACKEND = os.environ.get("REPORTS_SEARCH_BACKEND", "fts5")
+
+# Matching queue: "sync" runs inline in the request, "async" hands jobs to the
+# in-process worker pool, "queue" only persists them for `manage.py run_match_worker`.
+MATCHING_QUEUE_MODE = os.environ.get("MATCHING_QUEUE_MODE", "sync" if TESTING else "async")
+MATCHING_WORKER_THREADS = int(os.environ.get("MATCHING_WORKER_THREADS", 2))
+MATCHING_JOB_MAX_ATTEMPTS = int(os.environ.get("MATCHING_JOB_MAX_ATTEMPTS", 3))
+MATCHING_JOB_LOCK_TIMEOUT = int(os.environ.get("MATCHING_JOB_LOCK_TIMEOUT", 300))
+
+# Seconds anonymous report browse responses stay cached; 0 disables. Off under
+# tests, where the cache outlives each test's database rollback.
+REPORTS_BROWSE_CACHE_TIMEOUT = int(os.environ.get("REPORTS_BROWSE_CACHE_TIMEOUT", 0 if TESTING else 60))
+REPORTS_FACETS_CACHE_TIMEOUT = int(os.environ.get("REPORTS_FACETS_CACHE_TIMEOUT", 0 if TESTING else 30))
+# On-demand re-matches (POST /api/reports/<id>/find_matches/): runs allowed per
+# user, and how long a run is remembered for an unchanged candidate pool.
+REPORTS_FIND_MATCHES_RATE = os.environ.get("REPORTS_FIND_MATCHES_RATE", "10/hour")
+REPORTS_FIND_MATCHES_CACHE_TIMEOUT = int(os.environ.get("REPORTS_FIND_MATCHES_CACHE_TIMEOUT", 86400))
+# manage.py archive_reports: pending reports older than this many days, and
+# claimed reports not updated for this many days, move to the archive tables.
+REPORTS_ARCHIVE_PENDING_DAYS = int(os.environ.get("REPORTS_ARCHIVE_PENDING_DAYS", 180))
+REPORTS_ARCHIVE_CLAIMED_DAYS = int(os.environ.get("REPORTS_ARCHIVE_CLAIMED_DAYS", 0))
+# Rows fetched per database round trip by the streaming exports.
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", 2000))
 
 # CORS (dev)
 # For Live Server origins like http://127.0.0.1:5500 or http://localhost:5500
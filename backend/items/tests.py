@@ -520,6 +520,20 @@ class CategoryAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['name'], 'Partially Updated')
 
+    def test_category_list_conditional_get(self):
+        """Test ETag revalidation of the category list."""
+        url = reverse('category-list')
+        first = self.client.get(url)
+        self.assertIn('ETag', first)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.category.name = "Gadgets"
+        self.category.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
 
 class SubCategoryAPITest(APITestCase):
     """Test cases for the SubCategory API views."""
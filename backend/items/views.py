@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from rest_framework import viewsets
 
+from config.conditional import ConditionalGetMixin
 from users.permissions import IsAdminOrReadOnly
 from .models import Category, SubCategory
 from .serializers import CategorySerializer, SubCategorySerializer
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all().order_by("name")
     serializer_class = CategorySerializer
     permission_classes = [IsAdminOrReadOnly]
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Match
+from .models import ArchivedMatch, Match, MatchJob
 
 
 @admin.register(Match)
@@ -9,3 +9,15 @@ class MatchAdmin(admin.ModelAdmin):
     search_fields = ("lost_report__title", "found_report__title")
 
 
+
+
+@admin.register(MatchJob)
+class MatchJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "report", "status", "attempts", "run_after", "updated_at")
+    list_filter = ("status",)
+
+
+@admin.register(ArchivedMatch)
+class ArchivedMatchAdmin(admin.ModelAdmin):
+    list_display = ("id", "lost_report_id", "found_report_id", "confidence_score", "status", "archived_at")
+    list_filter = ("status",)
@@ -0,0 +1,216 @@
+from __future__ import annotations
+import json
+import math
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from items.models import Category
+from matches.services import matching_config, rebuild_token_index, run_matching_for_report, score_report
+from reports.models import Report
+
+
+CATEGORIES_FIXTURE = Path(settings.BASE_DIR) / "items" / "fixtures" / "categories.json"
+
+COLORS = ["black", "white", "blue", "red", "green", "grey", "silver", "gold", "brown", "pink", "navy", "purple"]
+PLACES = ["library", "cafeteria", "gym", "lab", "hostel", "lecture hall", "parking lot", "bus stop", "chapel", "field"]
+# Nouns and descriptors per fixture category; anything unknown falls back to "Others".
+VOCABULARY = {
+    "Electronics": {
+        "items": ["phone", "laptop", "charger", "earbuds", "airpods", "tablet", "calculator", "powerbank", "headphones"],
+        "words": ["iphone", "samsung", "hp", "dell", "lenovo", "cracked", "screen", "case", "cable", "usb", "pro"],
+    },
+    "Clothing": {
+        "items": ["jacket", "hoodie", "sweater", "cap", "scarf", "raincoat", "shoes", "sneakers"],
+        "words": ["nike", "adidas", "wool", "leather", "size", "medium", "large", "zip", "hood", "striped"],
+    },
+    "Documents": {
+        "items": ["id card", "passport", "student card", "certificate", "transcript", "license", "atm card"],
+        "words": ["name", "photo", "laminated", "expired", "faculty", "number", "bank", "envelope"],
+    },
+    "Accessories": {
+        "items": ["wallet", "watch", "backpack", "umbrella", "glasses", "bracelet", "ring", "handbag"],
+        "words": ["leather", "strap", "zipper", "casio", "rolex", "polarized", "engraved", "small", "pocket"],
+    },
+    "Keys": {
+        "items": ["keys", "car key", "keychain", "room key", "padlock key"],
+        "words": ["toyota", "honda", "ring", "tag", "three", "two", "remote", "brass", "lanyard"],
+    },
+    "Stationery": {
+        "items": ["notebook", "textbook", "pen", "pencil case", "file", "ruler", "novel"],
+        "words": ["calculus", "physics", "chemistry", "spiral", "edition", "notes", "highlighter", "math"],
+    },
+    "Others": {
+        "items": ["bottle", "lunchbox", "ball", "umbrella", "bag", "mug", "toy"],
+        "words": ["plastic", "metal", "sticker", "small", "large", "named", "used", "new"],
+    },
+}
+
+
+def fixture_category_names() -> list[str]:
+    with open(CATEGORIES_FIXTURE) as fh:
+        return [row["fields"]["name"] for row in json.load(fh) if row["model"] == "items.category"]
+
+
+def _report_text(rng: random.Random, vocab: dict, report_type: str) -> tuple[str, str]:
+    item = rng.choice(vocab["items"])
+    color = rng.choice(COLORS)
+    verb = "Lost" if report_type == Report.ReportType.LOST else "Found"
+    title = f"{verb} {color} {item}"
+    words = rng.sample(vocab["words"], k=min(len(vocab["words"]), rng.randint(2, 6)))
+    serial = f" serial {rng.randint(10000, 99999)}" if rng.random() < 0.1 else ""
+    description = f"{color} {item} {' '.join(words)} near the {rng.choice(PLACES)}{serial}"
+    return title, description
+
+
+def generate_corpus(n_reports: int, seed: int = 0, days: int = 365, batch_size: int = 5000) -> list[int]:
+    """Bulk-insert ``n_reports`` synthetic lost/found reports and index them.
+
+    Signals are bypassed, so tokens are computed here and the token index is
+    rebuilt once at the end. Returns the ids of the generated lost reports.
+    """
+    rng = random.Random(seed)
+    User = get_user_model()
+    user, _ = User.objects.get_or_create(username="bench-matching", defaults={"email": "bench@example.com"})
+    categories = [Category.objects.get_or_create(name=name)[0] for name in fixture_category_names()]
+    today = timezone.now().date()
+
+    batch: list[Report] = []
+    for _ in range(n_reports):
+        category = rng.choice(categories)
+        vocab = VOCABULARY.get(category.name, VOCABULARY["Others"])
+        report_type = rng.choice([Report.ReportType.LOST, Report.ReportType.FOUND])
+        title, description = _report_text(rng, vocab, report_type)
+        report = Report(
+            title=title,
+            description=description,
+            category=category,
+            report_type=report_type,
+            reported_by=user,
+            location=rng.choice(PLACES),
+            date_lost_found=today - timedelta(days=rng.randrange(days)),
+        )
+        report.search_tokens = report.compute_search_tokens()
+        batch.append(report)
+        if len(batch) >= batch_size:
+            Report.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        Report.objects.bulk_create(batch)
+
+    rebuild_token_index()
+    return list(
+        Report.objects.filter(reported_by=user, report_type=Report.ReportType.LOST).values_list("id", flat=True)
+    )
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _probe(report_ids: list[int]) -> tuple[list[float], int, int]:
+    latencies: list[float] = []
+    total_queries = 0
+    total_matches = 0
+    for report in Report.objects.filter(id__in=report_ids):
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            matches = run_matching_for_report(report)
+            latencies.append((time.perf_counter() - start) * 1000)
+        total_queries += len(ctx.captured_queries)
+        total_matches += len(matches)
+    return latencies, total_queries, total_matches
+
+
+def measure_lsh_recall(report_ids: list[int]) -> dict:
+    """Compare LSH-pruned scoring against the exact candidate scan for ``report_ids``.
+
+    Recall is the share of the exact top-K matches the LSH path also returns,
+    averaged over reports that have any exact match.
+    """
+    recalls: list[float] = []
+    exact_ms: list[float] = []
+    lsh_ms: list[float] = []
+    for report in Report.objects.filter(id__in=report_ids):
+        start = time.perf_counter()
+        exact = {candidate.id for _, candidate in score_report(report, use_lsh=False)}
+        exact_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        pruned = {candidate.id for _, candidate in score_report(report, use_lsh=True)}
+        lsh_ms.append((time.perf_counter() - start) * 1000)
+        if exact:
+            recalls.append(len(exact & pruned) / len(exact))
+    return {
+        "recall": round(statistics.fmean(recalls), 4) if recalls else None,
+        "exact_p50_ms": round(percentile(exact_ms, 50), 3),
+        "lsh_p50_ms": round(percentile(lsh_ms, 50), 3),
+    }
+
+
+def run_benchmark(
+    n_reports: int,
+    samples: int = 100,
+    seed: int = 0,
+    memory_samples: int = 10,
+    keep: bool = False,
+) -> dict:
+    """Generate a corpus, time ``run_matching_for_report`` on sampled lost reports.
+
+    Everything runs in one transaction that is rolled back unless ``keep``.
+    With LSH enabled, recall against the exact scan is reported too. Peak
+    memory is measured on a separate set of probes so tracemalloc does not
+    skew the latency figures.
+    """
+    with transaction.atomic():
+        start = time.perf_counter()
+        lost_ids = generate_corpus(n_reports, seed=seed)
+        generate_seconds = time.perf_counter() - start
+
+        rng = random.Random(seed + 1)
+        probes = rng.sample(lost_ids, k=min(len(lost_ids), samples + memory_samples))
+        latency_probes, memory_probes = probes[:samples], probes[samples:]
+
+        latencies, total_queries, total_matches = _probe(latency_probes)
+        lsh = measure_lsh_recall(latency_probes) if matching_config()["lsh"]["enabled"] else None
+
+        tracemalloc.start()
+        _probe(memory_probes)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        if not keep:
+            transaction.set_rollback(True)
+
+    runs = len(latencies) or 1
+    return {
+        "reports": n_reports,
+        "samples": len(latencies),
+        "seed": seed,
+        "generated_on": date.today().isoformat(),
+        "config": matching_config(),
+        "generate_seconds": round(generate_seconds, 3),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 3),
+            "p90": round(percentile(latencies, 90), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "mean": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+            "max": round(max(latencies), 3) if latencies else 0.0,
+        },
+        "queries_per_run": round(total_queries / runs, 2),
+        "queries_per_match": round(total_queries / total_matches, 2) if total_matches else None,
+        "matches_per_run": round(total_matches / runs, 2),
+        "peak_memory_kb": round(peak_bytes / 1024, 1),
+        "lsh": lsh,
+    }
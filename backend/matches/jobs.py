@@ -0,0 +1,201 @@
+from __future__ import annotations
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Lock, Timer
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from matches.models import MatchJob
+from matches.services import rematch_edited_report, run_matching_for_report
+from reports.models import Report
+
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = Lock()
+
+
+def queue_mode() -> str:
+    return getattr(settings, "MATCHING_QUEUE_MODE", "async")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "MATCHING_WORKER_THREADS", 2),
+                thread_name_prefix="match-worker",
+            )
+        return _executor
+
+
+def _submit(job_id: int) -> None:
+    _get_executor().submit(_run_in_thread, job_id)
+
+
+def _schedule_retry(job_id: int, delay: float) -> None:
+    timer = Timer(delay, _submit, args=(job_id,))
+    timer.daemon = True
+    timer.start()
+
+
+def run_matching_job(report: Report, kind: str = MatchJob.Kind.NEW, previous_tokens: str = "") -> None:
+    if kind == MatchJob.Kind.EDIT:
+        rematch_edited_report(report, previous_tokens=set(previous_tokens.split()))
+    elif kind == MatchJob.Kind.RESCAN:
+        rematch_edited_report(report)
+    else:
+        run_matching_for_report(report)
+
+
+def enqueue_matching(report: Report, kind: str = MatchJob.Kind.NEW, previous_tokens: str = "") -> MatchJob | None:
+    """Schedule matching for ``report``.
+
+    In ``sync`` mode matching runs inline and no job row is written. Otherwise a
+    durable job is queued; in ``async`` mode it is also handed to the in-process
+    worker pool once the surrounding transaction commits, and failed attempts
+    are resubmitted there after their backoff. Jobs left behind by a crashed
+    process are picked up by ``manage.py run_match_worker``.
+    """
+    mode = queue_mode()
+    if mode == "sync":
+        run_matching_job(report, kind, previous_tokens)
+        return None
+
+    job = MatchJob.objects.create(
+        report=report,
+        kind=kind,
+        previous_tokens=previous_tokens,
+        run_after=timezone.now(),
+    )
+    if mode == "async":
+        transaction.on_commit(lambda: _submit(job.pk))
+    return job
+
+
+def enqueue_matching_batch(reports: list[Report]) -> list[MatchJob]:
+    """Schedule matching for freshly inserted ``reports`` with one job INSERT.
+
+    For bulk loads that bypass ``post_save``. In ``sync`` mode the reports are
+    matched inline, one after another.
+    """
+    mode = queue_mode()
+    if mode == "sync":
+        for report in reports:
+            run_matching_job(report)
+        return []
+
+    now = timezone.now()
+    jobs = MatchJob.objects.bulk_create(
+        [MatchJob(report=report, kind=MatchJob.Kind.NEW, run_after=now) for report in reports]
+    )
+    if mode == "async":
+        job_ids = [job.pk for job in jobs]
+        transaction.on_commit(lambda: [_submit(job_id) for job_id in job_ids])
+    return jobs
+
+
+def _run_in_thread(job_id: int) -> bool:
+    close_old_connections()
+    try:
+        return process_job(job_id)
+    finally:
+        close_old_connections()
+
+
+def claim_job(job_id: int) -> bool:
+    claimed = MatchJob.objects.filter(
+        pk=job_id,
+        status=MatchJob.Status.QUEUED,
+        run_after__lte=timezone.now(),
+    ).update(
+        status=MatchJob.Status.RUNNING,
+        attempts=F("attempts") + 1,
+        locked_at=timezone.now(),
+    )
+    return claimed == 1
+
+
+def process_job(job_id: int) -> bool:
+    """Claim and run a single job. Returns False if another worker got it first.
+
+    In ``async`` mode a failed attempt is resubmitted to the in-process pool
+    once its backoff has passed, so retries do not depend on a worker process.
+    """
+    if not claim_job(job_id):
+        return False
+
+    job = MatchJob.objects.select_related("report").get(pk=job_id)
+    try:
+        run_matching_job(job.report, job.kind, job.previous_tokens)
+    except Exception as exc:
+        max_attempts = getattr(settings, "MATCHING_JOB_MAX_ATTEMPTS", 3)
+        logger.exception("Matching job %s failed (attempt %s/%s)", job.pk, job.attempts, max_attempts)
+        job.last_error = repr(exc)
+        job.locked_at = None
+        if job.attempts >= max_attempts:
+            job.status = MatchJob.Status.FAILED
+        else:
+            job.status = MatchJob.Status.QUEUED
+            job.run_after = timezone.now() + timedelta(seconds=2 ** job.attempts)
+        job.save(update_fields=["status", "last_error", "locked_at", "run_after", "updated_at"])
+        if job.status == MatchJob.Status.QUEUED and queue_mode() == "async":
+            _schedule_retry(job.pk, 2 ** job.attempts)
+        return True
+
+    job.status = MatchJob.Status.DONE
+    job.locked_at = None
+    job.save(update_fields=["status", "locked_at", "updated_at"])
+    return True
+
+
+def requeue_stale_jobs() -> int:
+    """Return jobs stuck in ``running`` (e.g. after a crash) to the queue."""
+    timeout = getattr(settings, "MATCHING_JOB_LOCK_TIMEOUT", 300)
+    return MatchJob.objects.filter(
+        status=MatchJob.Status.RUNNING,
+        locked_at__lt=timezone.now() - timedelta(seconds=timeout),
+    ).update(status=MatchJob.Status.QUEUED, locked_at=None)
+
+
+def job_failed_or_stuck(job: MatchJob) -> bool:
+    """True once ``job`` failed for good, or sat queued or running past the lock timeout."""
+    if job.status == MatchJob.Status.FAILED:
+        return True
+    cutoff = timezone.now() - timedelta(seconds=getattr(settings, "MATCHING_JOB_LOCK_TIMEOUT", 300))
+    if job.status == MatchJob.Status.RUNNING:
+        return job.locked_at is not None and job.locked_at < cutoff
+    return job.status == MatchJob.Status.QUEUED and job.run_after < cutoff
+
+
+def ready_job_ids(limit: int) -> list[int]:
+    return list(
+        MatchJob.objects.filter(status=MatchJob.Status.QUEUED, run_after__lte=timezone.now())
+        .order_by("run_after", "id")
+        .values_list("id", flat=True)[:limit]
+    )
+
+
+def drain_queue(threads: int = 1, batch_size: int = 50) -> int:
+    """Process ready jobs until none are left. Returns the number processed.
+
+    With a single thread jobs run on the calling thread and connection.
+    """
+    processed = 0
+    requeue_stale_jobs()
+    pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="match-worker") if threads > 1 else None
+    try:
+        while True:
+            job_ids = ready_job_ids(batch_size)
+            if not job_ids:
+                break
+            results = pool.map(_run_in_thread, job_ids) if pool else map(process_job, job_ids)
+            processed += sum(1 for handled in results if handled)
+    finally:
+        if pool:
+            pool.shutdown()
+    return processed
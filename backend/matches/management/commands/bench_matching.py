@@ -0,0 +1,47 @@
+import json
+from django.core.management.base import BaseCommand
+from matches.benchmark import run_benchmark
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the matching engine on synthetic lost/found corpora'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reports', type=int, nargs='+', default=[10000], help='Corpus sizes to benchmark')
+        parser.add_argument('--samples', type=int, default=100, help='Lost reports to time per corpus')
+        parser.add_argument('--memory-samples', type=int, default=10, help='Extra probes run under tracemalloc')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='Write JSON results to this file')
+        parser.add_argument('--keep', action='store_true', help='Commit the generated corpus instead of rolling back')
+
+    def handle(self, *args, **options):
+        results = []
+        for n_reports in options['reports']:
+            self.stdout.write(f'Benchmarking {n_reports} reports...')
+            result = run_benchmark(
+                n_reports,
+                samples=options['samples'],
+                seed=options['seed'],
+                memory_samples=options['memory_samples'],
+                keep=options['keep'],
+            )
+            latency = result['latency_ms']
+            self.stdout.write(
+                f"  p50 {latency['p50']}ms, p99 {latency['p99']}ms, "
+                f"{result['queries_per_run']} queries/run, {result['matches_per_run']} matches/run, "
+                f"peak {result['peak_memory_kb']} KiB"
+            )
+            if result['lsh']:
+                lsh = result['lsh']
+                self.stdout.write(
+                    f"  LSH recall {lsh['recall']}, p50 {lsh['lsh_p50_ms']}ms vs {lsh['exact_p50_ms']}ms exact"
+                )
+            results.append(result)
+
+        payload = json.dumps({'results': results}, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as fh:
+                fh.write(payload)
+            self.stdout.write(self.style.SUCCESS(f"Wrote results to {options['output']}"))
+        else:
+            self.stdout.write(payload)
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from matches.services import rebuild_token_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the inverted token index used for match candidate retrieval'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        indexed = rebuild_token_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} open reports'))
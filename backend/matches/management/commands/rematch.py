@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from matches.rematch import rematch
+
+
+class Command(BaseCommand):
+    help = 'Re-run matching over all open reports with the current settings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help='Scoring processes')
+        parser.add_argument('--bucket-days', type=int, default=30, help='Width of each date partition')
+        parser.add_argument('--category', type=int, action='append', dest='categories', help='Limit to category id (repeatable)')
+        parser.add_argument('--dry-run', action='store_true', help='Score and report stats without writing')
+
+    def handle(self, *args, **options):
+        stats = rematch(
+            workers=options['workers'],
+            bucket_days=options['bucket_days'],
+            category_ids=options['categories'],
+            dry_run=options['dry_run'],
+        )
+        prefix = '[dry run] ' if options['dry_run'] else ''
+        self.stdout.write(
+            f'{prefix}{stats.partitions} partitions, {stats.lost_reports} lost reports, '
+            f'{stats.pairs_scored} pairs scored, {stats.candidates} above threshold'
+        )
+        for category_id, count in sorted(stats.per_category.items()):
+            self.stdout.write(f'  category {category_id}: {count} candidate matches')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{prefix}{stats.created} created, {stats.updated} updated, {stats.unchanged} unchanged, '
+                f'{stats.retired} retired'
+            )
+        )
@@ -0,0 +1,23 @@
+import time
+from django.core.management.base import BaseCommand
+from matches.jobs import drain_queue
+
+
+class Command(BaseCommand):
+    help = 'Process queued matching jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=2)
+        parser.add_argument('--batch-size', type=int, default=50)
+        parser.add_argument('--poll-interval', type=float, default=2.0)
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+
+    def handle(self, *args, **options):
+        self.stdout.write('Match worker started')
+        while True:
+            processed = drain_queue(threads=options['threads'], batch_size=options['batch_size'])
+            if processed:
+                self.stdout.write(f'Processed {processed} matching jobs')
+            if options['once']:
+                break
+            time.sleep(options['poll_interval'])
@@ -0,0 +1,103 @@
+from __future__ import annotations
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Iterator
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageStats:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class MetricsRegistry:
+    """Process-wide totals of matching runs; each worker process keeps its own."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.runs = 0
+            self.stages: dict[str, StageStats] = {}
+            self.counters: Counter = Counter()
+
+    def record(self, timings: dict[str, float], counters: dict[str, int]) -> None:
+        with self._lock:
+            self.runs += 1
+            for stage, elapsed_ms in timings.items():
+                self.stages.setdefault(stage, StageStats()).add(elapsed_ms)
+            self.counters.update(counters)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "stages": {stage: stats.as_dict() for stage, stats in self.stages.items()},
+                "counters": dict(self.counters),
+            }
+
+
+registry = MetricsRegistry()
+
+
+@dataclass
+class MatchingRun:
+    """Per-stage timers and counters for one ``run_matching_for_report`` call."""
+
+    report_id: int | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    counters: Counter = field(default_factory=Counter)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] += value
+
+    def finish(self) -> None:
+        """Log the run as one structured record and add it to the registry."""
+        registry.record(self.timings, self.counters)
+        total_ms = sum(self.timings.values())
+        logger.info(
+            "matching report=%s total_ms=%.3f %s %s",
+            self.report_id,
+            total_ms,
+            " ".join(f"{stage}_ms={ms:.3f}" for stage, ms in self.timings.items()),
+            " ".join(f"{name}={value}" for name, value in self.counters.items()),
+            extra={
+                "matching": {
+                    "report_id": self.report_id,
+                    "total_ms": total_ms,
+                    "stages": dict(self.timings),
+                    "counters": dict(self.counters),
+                }
+            },
+        )
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+from reports.tokens import tokenize
+
+
+def index_open_reports(apps, schema_editor):
+    # Candidate retrieval switches to the index as soon as it has any rows,
+    # so reports that predate it must be in it from the start.
+    Report = apps.get_model('reports', 'Report')
+    ReportToken = apps.get_model('matches', 'ReportToken')
+    batch = []
+    open_reports = Report.objects.filter(status__in=['pending', 'unclaimed']).only('id', 'title', 'description')
+    for report in open_reports.iterator(chunk_size=500):
+        batch.extend(
+            ReportToken(token=token, report_id=report.id)
+            for token in {t[:64] for t in tokenize(f'{report.title} {report.description}')}
+        )
+        if len(batch) >= 500:
+            ReportToken.objects.bulk_create(batch)
+            batch = []
+    ReportToken.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matches', '0001_initial'),
+        ('reports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64)),
+                ('report', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='index_tokens', to='reports.report')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('token', 'report'), name='unique_report_token')],
+            },
+        ),
+        migrations.RunPython(index_open_reports, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+
+
+def populate_frequencies(apps, schema_editor):
+    Report = apps.get_model('reports', 'Report')
+    ReportToken = apps.get_model('matches', 'ReportToken')
+    TokenDocumentFrequency = apps.get_model('matches', 'TokenDocumentFrequency')
+    CategoryTokenStats = apps.get_model('matches', 'CategoryTokenStats')
+
+    ReportToken.objects.update(
+        category_id=Subquery(Report.objects.filter(pk=OuterRef('report_id')).values('category_id')[:1])
+    )
+    TokenDocumentFrequency.objects.bulk_create(
+        [
+            TokenDocumentFrequency(category_id=row['category_id'], token=row['token'], doc_count=row['n'])
+            for row in ReportToken.objects.values('category_id', 'token').annotate(n=Count('id'))
+        ],
+        batch_size=500,
+    )
+    CategoryTokenStats.objects.bulk_create(
+        [
+            CategoryTokenStats(category_id=row['category_id'], document_count=row['docs'], total_tokens=row['n'])
+            for row in ReportToken.objects.values('category_id').annotate(
+                docs=Count('report_id', distinct=True), n=Count('id')
+            )
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0002_subcategory'),
+        ('matches', '0003_match_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryTokenStats',
+            fields=[
+                ('category', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='items.category')),
+                ('document_count', models.PositiveIntegerField(default=0)),
+                ('total_tokens', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='reporttoken',
+            name='category',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='items.category'),
+        ),
+        migrations.CreateModel(
+            name='TokenDocumentFrequency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64)),
+                ('doc_count', models.PositiveIntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='items.category')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('category', 'token'), name='unique_category_token_df')],
+            },
+        ),
+        migrations.RunPython(populate_frequencies, migrations.RunPython.noop),
+    ]
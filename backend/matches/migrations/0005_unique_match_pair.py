@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:03
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+CHUNK_SIZE = 500
+
+# Resolved matches carry user decisions, so they win over pending duplicates.
+STATUS_PRIORITY = {'confirmed': 0, 'rejected': 1, 'pending': 2}
+
+
+def collapse_duplicate_matches(apps, schema_editor):
+    Match = apps.get_model('matches', 'Match')
+    Notification = apps.get_model('notifications', 'Notification')
+
+    duplicate_pairs = (
+        Match.objects.values('lost_report_id', 'found_report_id')
+        .annotate(n=Count('id'), first_id=Min('id'))
+        .filter(n__gt=1)
+        .order_by('first_id')
+    )
+    last_id = 0
+    while True:
+        chunk = list(duplicate_pairs.filter(first_id__gt=last_id)[:CHUNK_SIZE])
+        if not chunk:
+            break
+        last_id = chunk[-1]['first_id']
+        for pair in chunk:
+            rows = list(
+                Match.objects.filter(
+                    lost_report_id=pair['lost_report_id'], found_report_id=pair['found_report_id']
+                ).values_list('id', 'status')
+            )
+            rows.sort(key=lambda row: (STATUS_PRIORITY.get(row[1], 3), row[0]))
+            keep_id = rows[0][0]
+            drop_ids = [row[0] for row in rows[1:]]
+            Notification.objects.filter(related_match_id__in=drop_ids).update(related_match_id=keep_id)
+            Match.objects.filter(id__in=drop_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matches', '0004_token_document_frequency'),
+        ('notifications', '0001_initial'),
+        ('reports', '0002_report_search_tokens'),
+    ]
+
+    operations = [
+        migrations.RunPython(collapse_duplicate_matches, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='match',
+            constraint=models.UniqueConstraint(fields=('lost_report', 'found_report'), name='unique_match_pair'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matches', '0005_unique_match_pair'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='matchjob',
+            name='kind',
+            field=models.CharField(choices=[('new', 'New report'), ('edit', 'Edited text'), ('rescan', 'Edited category or date')], default='new', max_length=8),
+        ),
+        migrations.AddField(
+            model_name='matchjob',
+            name='previous_tokens',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name='match',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('confirmed', 'Confirmed'), ('rejected', 'Rejected'), ('retired', 'Retired')], default='pending', max_length=16),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0002_subcategory'),
+        ('matches', '0006_incremental_rematch'),
+        ('reports', '0002_report_search_tokens'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.BigIntegerField()),
+                ('category', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='items.category')),
+                ('report', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lsh_buckets', to='reports.report')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['category', 'bucket'], name='report_bucket_lookup_idx')],
+            },
+        ),
+    ]
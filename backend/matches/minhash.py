@@ -0,0 +1,58 @@
+from __future__ import annotations
+import random
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Iterable
+
+
+# Mersenne prime modulus for the universal hash family (a * x + b) mod P.
+_PRIME = (1 << 61) - 1
+_MAX_HASH = _PRIME - 1
+_SEED = 1729
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+@lru_cache(maxsize=8)
+def _permutations(num_perm: int) -> tuple[tuple[int, int], ...]:
+    # Fixed seed: signatures must be comparable across processes and restarts.
+    rng = random.Random(_SEED)
+    return tuple((rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm))
+
+
+def minhash_signature(tokens: Iterable[str], num_perm: int) -> tuple[int, ...]:
+    """MinHash signature of a token set; empty sets get an all-max signature."""
+    hashes = [_hash64(token) for token in set(tokens)]
+    if not hashes:
+        return (_MAX_HASH,) * num_perm
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _permutations(num_perm))
+
+
+def estimate_jaccard(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+    if not sig_a:
+        return 0.0
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def band_keys(signature: tuple[int, ...], bands: int, rows: int) -> list[int]:
+    """One signed 64-bit bucket key per band, salted with the band number."""
+    keys = []
+    for band in range(bands):
+        chunk = signature[band * rows:(band + 1) * rows]
+        digest = blake2b(f"{band}:{','.join(map(str, chunk))}".encode(), digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "big", signed=True))
+    return keys
+
+
+def lsh_keys(tokens: Iterable[str], bands: int, rows: int) -> list[int]:
+    tokens = set(tokens)
+    if not tokens:
+        return []
+    return band_keys(minhash_signature(tokens, bands * rows), bands, rows)
+
+
+def collision_probability(similarity: float, bands: int, rows: int) -> float:
+    """Chance that two sets with Jaccard ``similarity`` share at least one bucket."""
+    return 1 - (1 - similarity ** rows) ** bands
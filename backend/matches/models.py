@@ -1,5 +1,6 @@
 from __future__ import annotations
 from django.db import models
+from items.models import Category
 from reports.models import Report
 
 
@@ -8,15 +9,137 @@ class Match(models.Model):
         PENDING = "pending", "Pending"
         CONFIRMED = "confirmed", "Confirmed"
         REJECTED = "rejected", "Rejected"
+        # Pending match whose score dropped below threshold after a report edit
+        RETIRED = "retired", "Retired"
 
     lost_report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name="lost_matches")
     found_report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name="found_matches")
     confidence_score = models.FloatField()
     status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     resolved_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["lost_report", "found_report"], name="unique_match_pair"),
+        ]
+
     def __str__(self) -> str: 
         return f"Match {self.pk} ({self.confidence_score:.2f})"
 
 
+class ArchivedMatch(models.Model):
+    """A match moved to cold storage together with one of its reports.
+
+    Report ids are plain integers: either side may be archived or still live.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    lost_report_id = models.BigIntegerField(db_index=True)
+    found_report_id = models.BigIntegerField(db_index=True)
+    confidence_score = models.FloatField()
+    status = models.CharField(max_length=16, choices=Match.Status.choices)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    resolved_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"Archived match {self.pk} ({self.confidence_score:.2f})"
+
+
+class ReportToken(models.Model):
+    """Inverted index entry: one row per (token, open report)."""
+
+    token = models.CharField(max_length=64)
+    report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name="index_tokens")
+    # Denormalized from the report so document frequencies can follow category edits.
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, null=True, related_name="+")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["token", "report"], name="unique_report_token"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.token} -> {self.report_id}"
+
+
+class TokenDocumentFrequency(models.Model):
+    """Number of indexed reports in a category containing ``token``."""
+
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name="+")
+    token = models.CharField(max_length=64)
+    doc_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["category", "token"], name="unique_category_token_df"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.token} ({self.doc_count})"
+
+
+class CategoryTokenStats(models.Model):
+    """Corpus totals per category, used for BM25 IDF and length normalisation."""
+
+    category = models.OneToOneField(Category, on_delete=models.CASCADE, primary_key=True, related_name="+")
+    document_count = models.PositiveIntegerField(default=0)
+    total_tokens = models.PositiveIntegerField(default=0)
+
+    @property
+    def average_length(self) -> float:
+        return self.total_tokens / self.document_count if self.document_count else 0.0
+
+
+class ReportBucket(models.Model):
+    """LSH index entry: one row per band of an open report's MinHash signature."""
+
+    report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name="lsh_buckets")
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, null=True, related_name="+")
+    bucket = models.BigIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["category", "bucket"], name="report_bucket_lookup_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.bucket} -> {self.report_id}"
+
+
+class MatchJob(models.Model):
+    """Durable queue entry for running the matching pipeline outside the request."""
+
+    class Kind(models.TextChoices):
+        NEW = "new", "New report"
+        EDIT = "edit", "Edited text"
+        RESCAN = "rescan", "Edited category or date"
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name="match_jobs")
+    kind = models.CharField(max_length=8, choices=Kind.choices, default=Kind.NEW)
+    # Token set before an EDIT, so only pairs touched by the change are scored.
+    previous_tokens = models.TextField(blank=True)
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    run_after = models.DateTimeField()
+    locked_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="match_job_ready_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"MatchJob {self.pk} ({self.status})"
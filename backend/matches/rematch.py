@@ -0,0 +1,267 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Iterator
+import django
+from django.db import transaction
+from django.utils import timezone
+from matches.models import Match
+from matches.services import (
+    OPEN_STATUSES,
+    CorpusStats,
+    TokenBlock,
+    TopK,
+    get_scorer_class,
+    matching_config,
+    notify_users_for_matches,
+    report_tokens,
+    score_block,
+)
+from reports.counters import refresh_user_counters
+from reports.models import Report
+
+
+# (report id, tokens, date_lost_found)
+ReportRow = tuple[int, frozenset, date]
+
+
+@dataclass
+class Partition:
+    """Lost reports of one category and date bucket, plus every found report they can reach.
+
+    Only plain data, so it can be shipped to a worker process.
+    """
+
+    category_id: int
+    bucket_start: date
+    lost: list[ReportRow]
+    found: list[ReportRow]
+    corpus: CorpusStats
+    config: dict
+
+
+@dataclass
+class RematchStats:
+    partitions: int = 0
+    lost_reports: int = 0
+    pairs_scored: int = 0
+    candidates: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    retired: int = 0
+    per_category: Counter = field(default_factory=Counter)
+
+
+def _bucket_start(day: date, bucket_days: int) -> date:
+    return date.fromordinal(day.toordinal() - day.toordinal() % bucket_days)
+
+
+def build_partitions(
+    bucket_days: int = 30,
+    category_ids: list[int] | None = None,
+    reports: dict[int, Report] | None = None,
+) -> Iterator[Partition]:
+    """Yield one partition per (category, lost-date bucket), one category at a time.
+
+    Buckets with no found report in reach are still yielded, so stale matches
+    of their lost reports get retired. When ``reports`` is given it is filled with the loaded rows, keyed by id, so
+    results can be written without re-fetching.
+    """
+    config = matching_config()
+    window = timedelta(days=config["window_days"])
+    open_reports = Report.objects.filter(status__in=OPEN_STATUSES)
+    if category_ids:
+        open_reports = open_reports.filter(category_id__in=category_ids)
+    categories = open_reports.order_by("category_id").values_list("category_id", flat=True).distinct()
+    needs_corpus = get_scorer_class(config["weights"].get("scorer", "jaccard")).needs_corpus
+
+    for category_id in categories:
+        rows = (
+            open_reports.filter(category_id=category_id)
+            .only("id", "title", "description", "search_tokens", "report_type", "reported_by", "date_lost_found")
+            .order_by("date_lost_found", "id")
+        )
+        lost_buckets: dict[date, list[ReportRow]] = {}
+        found: list[ReportRow] = []
+        for report in rows.iterator(chunk_size=1000):
+            if reports is not None:
+                reports[report.id] = report
+            row = (report.id, frozenset(report_tokens(report)), report.date_lost_found)
+            if report.report_type == Report.ReportType.LOST:
+                lost_buckets.setdefault(_bucket_start(report.date_lost_found, bucket_days), []).append(row)
+            else:
+                found.append(row)
+        if not lost_buckets:
+            continue
+
+        corpus = CorpusStats.load(category_id) if needs_corpus else CorpusStats()
+        found_dates = [row[2] for row in found]
+        for bucket_start, lost in sorted(lost_buckets.items()):
+            lo = bisect_left(found_dates, bucket_start - window)
+            hi = bisect_right(found_dates, bucket_start + timedelta(days=bucket_days - 1) + window)
+            yield Partition(category_id, bucket_start, lost, found[lo:hi], corpus, config)
+
+
+def score_partition(partition: Partition) -> tuple[int, list[int], list[tuple[int, int, float]], int]:
+    """Score every lost report in ``partition`` against the found reports in its window.
+
+    Runs without touching the database. Returns the category id, the ids of
+    the lost reports scored, the ``(lost_id, found_id, confidence)`` results
+    (top K per lost report) and the number of pairs scored.
+    """
+    config = partition.config
+    window = config["window_days"]
+    scorer_class = get_scorer_class(config["weights"].get("scorer", "jaccard"))
+    found_dates = [row[2] for row in partition.found]
+    # Found reports are encoded once and shared by every lost report's window.
+    block = TokenBlock.build(partition.found)
+    results: list[tuple[int, int, float]] = []
+    pairs = 0
+
+    for lost_id, lost_tokens, lost_date in partition.lost:
+        scorer = scorer_class(set(lost_tokens), partition.corpus)
+        best = TopK(config["max_matches"])
+        lo = bisect_left(found_dates, lost_date - timedelta(days=window))
+        hi = bisect_right(found_dates, lost_date + timedelta(days=window))
+        pairs += hi - lo
+        for confidence, found_id in score_block(scorer, lost_tokens, lost_date, block, config, start=lo, stop=hi):
+            best.push(confidence, found_id, found_id)
+        results.extend((lost_id, found_id, confidence) for confidence, found_id in best.items())
+
+    return partition.category_id, [row[0] for row in partition.lost], results, pairs
+
+
+def apply_results(
+    results: list[tuple[int, int, float]],
+    reports: dict[int, Report],
+    lost_ids: list[int],
+    dry_run: bool = False,
+) -> tuple[int, int, int, int]:
+    """Upsert scored pairs for ``lost_ids``. Returns (created, updated, unchanged, retired).
+
+    Existing pending matches get their score refreshed, and retired ones that
+    scored again return to pending. Pending matches of ``lost_ids`` missing
+    from ``results`` (below threshold or out of the top K) are retired, as in
+    ``rescore_pending_matches``. Confirmed or rejected matches are left alone.
+    Only newly created matches notify users.
+    """
+    if not lost_ids:
+        return 0, 0, 0, 0
+    pair_matches = Match.objects.filter(lost_report_id__in=lost_ids)
+    existing = {
+        (m.lost_report_id, m.found_report_id): m
+        for m in pair_matches.only("id", "lost_report_id", "found_report_id", "confidence_score", "status")
+    }
+    # bulk_update skips auto_now.
+    now = timezone.now()
+    to_create: list[Match] = []
+    to_update: list[Match] = []
+    reactivated: list[Match] = []
+    unchanged = 0
+    for lost_id, found_id, confidence in results:
+        match = existing.get((lost_id, found_id))
+        if match is None:
+            to_create.append(Match(
+                lost_report=reports[lost_id],
+                found_report=reports[found_id],
+                confidence_score=confidence,
+            ))
+        elif match.status == Match.Status.RETIRED or (
+            match.status == Match.Status.PENDING and abs(match.confidence_score - confidence) > 1e-9
+        ):
+            if match.status == Match.Status.RETIRED:
+                reactivated.append(match)
+            match.status = Match.Status.PENDING
+            match.confidence_score = confidence
+            match.updated_at = now
+            to_update.append(match)
+        else:
+            unchanged += 1
+    scored_pairs = {(lost_id, found_id) for lost_id, found_id, _ in results}
+    to_retire = [
+        match for pair, match in existing.items()
+        if match.status == Match.Status.PENDING and pair not in scored_pairs
+    ]
+    for match in to_retire:
+        match.status = Match.Status.RETIRED
+        match.updated_at = now
+
+    if not dry_run:
+        with transaction.atomic():
+            if to_update:
+                Match.objects.bulk_update(to_update, ["status", "confidence_score", "updated_at"], batch_size=500)
+            if to_retire:
+                Match.objects.bulk_update(to_retire, ["status", "updated_at"], batch_size=500)
+            if to_retire or reactivated:
+                # bulk_update skips the counter signals.
+                report_ids = {m.lost_report_id for m in to_retire + reactivated}
+                report_ids |= {m.found_report_id for m in to_retire + reactivated}
+                refresh_user_counters(Report.objects.filter(pk__in=report_ids).values_list("reported_by_id", flat=True))
+            if to_create:
+                # Conflicts mean a concurrent writer got there first; skip them
+                # and read back only the rows this run inserted.
+                Match.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
+                new_pairs = {(m.lost_report_id, m.found_report_id) for m in to_create}
+                existing_ids = [m.id for m in existing.values()]
+                created = [
+                    m for m in pair_matches.exclude(id__in=existing_ids)
+                    if (m.lost_report_id, m.found_report_id) in new_pairs
+                ]
+                for match in created:
+                    match.lost_report = reports[match.lost_report_id]
+                    match.found_report = reports[match.found_report_id]
+                notify_users_for_matches(created)
+    return len(to_create), len(to_update), unchanged, len(to_retire)
+
+
+def _bounded_map(pool: ProcessPoolExecutor, fn, items, in_flight: int):
+    """Like ``pool.map`` but only keeps ``in_flight`` partitions queued at a time."""
+    pending = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def rematch(
+    workers: int = 1,
+    bucket_days: int = 30,
+    category_ids: list[int] | None = None,
+    dry_run: bool = False,
+) -> RematchStats:
+    """Re-score all open reports and upsert the resulting matches."""
+    stats = RematchStats()
+    reports: dict[int, Report] = {}
+    partitions = build_partitions(bucket_days, category_ids, reports)
+
+    def consume(scored):
+        for category_id, lost_ids, results, pairs in scored:
+            created, updated, unchanged, retired = apply_results(results, reports, lost_ids, dry_run=dry_run)
+            stats.partitions += 1
+            stats.pairs_scored += pairs
+            stats.candidates += len(results)
+            stats.created += created
+            stats.updated += updated
+            stats.unchanged += unchanged
+            stats.retired += retired
+            stats.per_category[category_id] += len(results)
+
+    def counted(parts):
+        for partition in parts:
+            stats.lost_reports += len(partition.lost)
+            yield partition
+
+    if workers > 1:
+        # Workers only score plain data; django.setup makes model imports safe
+        # under the spawn start method too.
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+            consume(_bounded_map(pool, score_partition, counted(partitions), workers * 2))
+    else:
+        consume(map(score_partition, counted(partitions)))
+    return stats
@@ -1,19 +1,28 @@
 from __future__ import annotations
-import re
-from datetime import timedelta
+import hashlib
+import heapq
+import json
+import math
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
 from typing import Iterable
 from django.conf import settings
-from matches.models import Match
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Count, F, Max
+from django.utils import timezone
+from matches.metrics import MatchingRun
+from matches.minhash import lsh_keys
+from matches.models import CategoryTokenStats, Match, ReportBucket, ReportToken, TokenDocumentFrequency
 from notifications.models import Notification
+from reports.counters import refresh_user_counters
 from reports.models import Report
+from reports.tokens import STOPWORDS, tokenize  # noqa: F401
 
 
-STOPWORDS = {"the", "a", "an", "and", "or", "with", "of", "in", "on", "for", "to"}
-
-
-def tokenize(text: str) -> set[str]:
-    tokens = set(re.findall(r"[a-z0-9]+", (text or "").lower()))
-    return {t for t in tokens if t not in STOPWORDS and len(t) > 1}
+OPEN_STATUSES = (Report.Status.PENDING, Report.Status.UNCLAIMED)
+INDEX_TOKEN_MAX_LENGTH = ReportToken._meta.get_field("token").max_length
 
 
 def compute_overlap(a: Iterable[str], b: Iterable[str]) -> float:
@@ -26,61 +35,755 @@ def compute_overlap(a: Iterable[str], b: Iterable[str]) -> float:
     return len(inter) / len(union)
 
 
-def notify_users_for_match(match: Match) -> None:
-    Notification.objects.create(
-        user=match.lost_report.reported_by,
-        message=f"Potential match found for your lost item: {match.found_report.title}",
-        related_match=match,
+@dataclass
+class CorpusStats:
+    """Per-category corpus statistics in plain Python, safe to send to worker processes."""
+
+    document_count: int = 0
+    average_length: float = 0.0
+    frequencies: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, category_id: int, tokens: Iterable[str] | None = None) -> CorpusStats:
+        """Load stats for ``category_id``; restrict frequencies to ``tokens`` when given."""
+        stats = CategoryTokenStats.objects.filter(category_id=category_id).first()
+        frequencies = TokenDocumentFrequency.objects.filter(category_id=category_id, doc_count__gt=0)
+        if tokens is not None:
+            frequencies = frequencies.filter(token__in=_index_terms(tokens))
+        return cls(
+            document_count=stats.document_count if stats else 0,
+            average_length=stats.average_length if stats else 0.0,
+            frequencies=dict(frequencies.values_list("token", "doc_count")),
+        )
+
+    def doc_count(self, token: str) -> int:
+        return self.frequencies.get(token[:INDEX_TOKEN_MAX_LENGTH], 0)
+
+
+class JaccardScorer:
+    """Plain set overlap; every shared token weighs the same."""
+
+    needs_corpus = False
+
+    def __init__(self, query_tokens: set[str], corpus: CorpusStats | None = None):
+        self.query_tokens = query_tokens
+
+    def score(self, tokens: set[str]) -> float:
+        return compute_overlap(self.query_tokens, tokens)
+
+    def score_block(self, block: TokenBlock, query_mask: int, shared: list[int], start: int, stop: int) -> list[float]:
+        query_length = len(self.query_tokens)
+        if not query_length:
+            return [0.0] * (stop - start)
+        # |A & B| / |A | B| with the union size derived from the counts.
+        return [
+            n / (query_length + length - n) if length else 0.0
+            for n, length in zip(shared, block.lengths[start:stop])
+        ]
+
+
+class BM25Scorer:
+    """BM25 over token sets, normalised against the query's self-score.
+
+    IDF comes from the per-category ``TokenDocumentFrequency`` table via
+    ``CorpusStats``, loaded up front, so each lookup while scoring is a dict hit.
+    """
+
+    needs_corpus = True
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self, query_tokens: set[str], corpus: CorpusStats):
+        self.query_tokens = query_tokens
+        self.document_count = corpus.document_count
+        self.average_length = corpus.average_length or float(len(query_tokens) or 1)
+        self.idf = {token: self._idf(corpus.doc_count(token)) for token in query_tokens}
+        self.max_score = self._raw_score(query_tokens, len(query_tokens))
+
+    def _idf(self, doc_count: int) -> float:
+        return math.log(1 + (self.document_count - doc_count + 0.5) / (doc_count + 0.5))
+
+    def _raw_score(self, shared: Iterable[str], length: int) -> float:
+        return self._weighted(math.fsum(self.idf[token] for token in shared), length)
+
+    def _weighted(self, idf_sum: float, length: int) -> float:
+        # Token sets carry no term frequency, so tf is 1 for every shared token.
+        norm = self.k1 * (1 - self.b + self.b * length / self.average_length)
+        return idf_sum * (self.k1 + 1) / (1 + norm)
+
+    def score(self, tokens: set[str]) -> float:
+        if not self.max_score or not tokens:
+            return 0.0
+        return min(1.0, self._raw_score(self.query_tokens & tokens, len(tokens)) / self.max_score)
+
+    def score_block(self, block: TokenBlock, query_mask: int, shared: list[int], start: int, stop: int) -> list[float]:
+        if not self.max_score:
+            return [0.0] * (stop - start)
+        idf_by_bit = {bit: self.idf[token] for token, bit in block.bits.items() if token in self.idf}
+        # Overlaps repeat a lot within a block, so memoise IDF sums per shared mask.
+        idf_sums: dict[int, float] = {}
+        scores = []
+        for n, mask, length in zip(shared, block.masks[start:stop], block.lengths[start:stop]):
+            if not n:
+                scores.append(0.0)
+                continue
+            overlap = mask & query_mask
+            idf_sum = idf_sums.get(overlap)
+            if idf_sum is None:
+                # fsum is exact, so the bit order cannot change the result.
+                idf_sum = idf_sums[overlap] = math.fsum(idf_by_bit[bit] for bit in _set_bits(overlap))
+            scores.append(min(1.0, self._weighted(idf_sum, length) / self.max_score))
+        return scores
+
+
+KEYWORD_SCORERS = {
+    "jaccard": JaccardScorer,
+    "bm25": BM25Scorer,
+}
+
+
+def get_scorer_class(name: str):
+    try:
+        return KEYWORD_SCORERS[name]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"Unknown MATCHING_WEIGHTS['scorer'] {name!r}; expected one of {sorted(KEYWORD_SCORERS)}"
+        )
+
+
+def get_keyword_scorer(name: str, query_tokens: set[str], category_id: int, corpus: CorpusStats | None = None):
+    scorer_class = get_scorer_class(name)
+    if scorer_class.needs_corpus and corpus is None:
+        corpus = CorpusStats.load(category_id, query_tokens)
+    return scorer_class(query_tokens, corpus)
+
+
+def matching_config() -> dict:
+    """Snapshot of the matching settings as a plain, picklable dict."""
+    return {
+        "threshold": getattr(settings, "MATCHING_CONF_THRESHOLD", 0.35),
+        "window_days": getattr(settings, "MATCHING_DATE_WINDOW_DAYS", 14),
+        "weights": getattr(settings, "MATCHING_WEIGHTS", {"category": 0.6, "keyword": 0.4, "date_boost": 0.05}),
+        "max_matches": getattr(settings, "MATCHING_MAX_MATCHES_PER_REPORT", 10),
+        "min_shared": getattr(settings, "MATCHING_MIN_SHARED_TOKENS", 1),
+        "lsh": lsh_config(),
+    }
+
+
+def lsh_config() -> dict:
+    bands = getattr(settings, "MATCHING_LSH_BANDS", 0)
+    rows = getattr(settings, "MATCHING_LSH_ROWS", 2)
+    return {
+        "enabled": bands > 0 and rows > 0,
+        "bands": bands,
+        "rows": rows,
+        "min_category_size": getattr(settings, "MATCHING_LSH_MIN_CATEGORY_SIZE", 5000),
+    }
+
+
+def score_pair(
+    scorer,
+    tokens_new: set[str],
+    date_new: date,
+    tokens_other: set[str],
+    date_other: date,
+    config: dict,
+    same_category: bool = True,
+) -> float | None:
+    """Confidence for one candidate, or None if it fails the keyword gate or threshold."""
+    if len(tokens_new & tokens_other) < config["min_shared"]:
+        return None
+    weights = config["weights"]
+    keyword_overlap = scorer.score(tokens_other)
+    category_match = 1.0 if same_category else 0.0
+    date_diff = abs((date_other - date_new).days)
+    date_boost = weights.get("date_boost", 0.05) if date_diff <= 3 else 0.0
+
+    confidence = weights.get("category", 0.6) * category_match + weights.get("keyword", 0.4) * keyword_overlap
+    confidence = min(1.0, confidence + date_boost)
+    return confidence if confidence >= config["threshold"] else None
+
+
+def _set_bits(mask: int) -> Iterable[int]:
+    while mask:
+        low = mask & -mask
+        yield low
+        mask ^= low
+
+
+@dataclass
+class TokenBlock:
+    """A block of candidates with token sets encoded as bitmasks over the block's vocabulary.
+
+    Encoding happens once, so scoring a query against the block (or against
+    many queries, as re-matching does) reduces to integer AND and popcount per
+    candidate. Candidates must be ordered by date when slices are scored.
+    """
+
+    ids: list[int]
+    masks: list[int]
+    lengths: list[int]
+    ordinals: list[int]
+    bits: dict[str, int]
+
+    @classmethod
+    def build(cls, rows: Iterable[tuple[int, Iterable[str], date]]) -> TokenBlock:
+        bits: dict[str, int] = {}
+        ids, masks, lengths, ordinals = [], [], [], []
+        for row_id, tokens, day in rows:
+            mask = 0
+            for token in tokens:
+                bit = bits.get(token)
+                if bit is None:
+                    bit = bits[token] = 1 << len(bits)
+                mask |= bit
+            ids.append(row_id)
+            masks.append(mask)
+            lengths.append(mask.bit_count())
+            ordinals.append(day.toordinal())
+        return cls(ids, masks, lengths, ordinals, bits)
+
+    def encode(self, tokens: Iterable[str]) -> int:
+        """Mask of ``tokens`` restricted to the block vocabulary."""
+        mask = 0
+        for token in tokens:
+            mask |= self.bits.get(token, 0)
+        return mask
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def score_block(
+    scorer,
+    tokens_new: set[str],
+    date_new: date,
+    block: TokenBlock,
+    config: dict,
+    same_category: bool = True,
+    start: int = 0,
+    stop: int | None = None,
+) -> list[tuple[float, int]]:
+    """``score_pair`` for every candidate in ``block[start:stop]`` at once.
+
+    Returns ``(confidence, candidate id)`` for candidates passing the keyword
+    gate and threshold, with the same scores ``score_pair`` would give.
+    """
+    stop = len(block) if stop is None else stop
+    query_mask = block.encode(tokens_new)
+    shared = [(query_mask & mask).bit_count() for mask in block.masks[start:stop]]
+    keyword = scorer.score_block(block, query_mask, shared, start, stop)
+
+    weights = config["weights"]
+    category_term = weights.get("category", 0.6) * (1.0 if same_category else 0.0)
+    keyword_weight = weights.get("keyword", 0.4)
+    boost = weights.get("date_boost", 0.05)
+    threshold = config["threshold"]
+    min_shared = config["min_shared"]
+    ordinal_new = date_new.toordinal()
+
+    results = []
+    for n, keyword_overlap, ordinal, candidate_id in zip(
+        shared, keyword, block.ordinals[start:stop], block.ids[start:stop]
+    ):
+        if n < min_shared:
+            continue
+        date_boost = boost if abs(ordinal - ordinal_new) <= 3 else 0.0
+        confidence = min(1.0, category_term + keyword_weight * keyword_overlap + date_boost)
+        if confidence >= threshold:
+            results.append((confidence, candidate_id))
+    return results
+
+
+class TopK:
+    """Min-heap holding the best K items seen so far (K of 0 disables the cap).
+
+    Ties prefer the lower id, i.e. the older report.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: list[tuple[float, int, object]] = []
+
+    def push(self, confidence: float, item_id: int, item) -> None:
+        entry = (confidence, -item_id, item)
+        if not self.k or len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> list[tuple[float, object]]:
+        return [(confidence, item) for confidence, _, item in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+
+def report_tokens(report: Report) -> set[str]:
+    if report.search_tokens:
+        return set(report.search_tokens.split())
+    # Rows saved before the column existed and not yet backfilled.
+    return tokenize(f"{report.title} {report.description}")
+
+
+def _index_terms(tokens: Iterable[str]) -> set[str]:
+    return {t[:INDEX_TOKEN_MAX_LENGTH] for t in tokens}
+
+
+def _adjust_frequencies(category_id: int, tokens: set[str], delta: int) -> None:
+    if delta > 0:
+        TokenDocumentFrequency.objects.bulk_create(
+            [TokenDocumentFrequency(category_id=category_id, token=token) for token in tokens],
+            ignore_conflicts=True,
+        )
+    TokenDocumentFrequency.objects.filter(category_id=category_id, token__in=tokens).update(
+        doc_count=F("doc_count") + delta
     )
-    Notification.objects.create(
-        user=match.found_report.reported_by,
-        message=f"Your found item may match: {match.lost_report.title}",
-        related_match=match,
+    stats, _ = CategoryTokenStats.objects.get_or_create(category_id=category_id)
+    CategoryTokenStats.objects.filter(pk=stats.pk).update(
+        document_count=F("document_count") + delta,
+        total_tokens=F("total_tokens") + delta * len(tokens),
     )
 
 
-def run_matching_for_report(new_report: Report) -> list[Match]:
-    threshold = getattr(settings, "MATCHING_CONF_THRESHOLD", 0.35)
-    window_days = getattr(settings, "MATCHING_DATE_WINDOW_DAYS", 14)
-    weights = getattr(settings, "MATCHING_WEIGHTS", {"category": 0.6, "keyword": 0.4, "date_boost": 0.05})
+def index_report(report: Report) -> None:
+    """Bring the inverted token index for ``report`` in line with its current state.
+
+    Only open reports are indexed, so a report that moves to matched or claimed
+    drops out of candidate retrieval. Per-category document frequencies, and
+    LSH buckets when enabled, are adjusted in the same transaction.
+    """
+    tokens = report_tokens(report) if report.status in OPEN_STATUSES else set()
+    wanted = _index_terms(tokens)
+    rows = list(ReportToken.objects.filter(report=report).values_list("token", "category_id"))
+    existing = {token for token, _ in rows}
+    old_category_id = rows[0][1] if rows else report.category_id
+    if wanted == existing and old_category_id == report.category_id:
+        return
+
+    with transaction.atomic():
+        lsh = lsh_config()
+        if lsh["enabled"]:
+            ReportBucket.objects.filter(report=report).delete()
+            ReportBucket.objects.bulk_create(
+                ReportBucket(report=report, category_id=report.category_id, bucket=key)
+                for key in lsh_keys(tokens, lsh["bands"], lsh["rows"])
+            )
+        ReportToken.objects.filter(report=report).delete()
+        if wanted:
+            ReportToken.objects.bulk_create(
+                [ReportToken(token=token, report=report, category_id=report.category_id) for token in wanted],
+                ignore_conflicts=True,
+            )
+        # Frequencies count documents, so a token set change is modelled as the
+        # old document leaving and the new one arriving.
+        if existing and old_category_id is not None:
+            _adjust_frequencies(old_category_id, existing, -1)
+        if wanted:
+            _adjust_frequencies(report.category_id, wanted, 1)
+
+
+def _index_rows(report: Report, tokens: set[str], lsh: dict) -> tuple[list[ReportToken], list[ReportBucket]]:
+    rows = [
+        ReportToken(token=token, report_id=report.id, category_id=report.category_id)
+        for token in _index_terms(tokens)
+    ]
+    buckets = [
+        ReportBucket(report_id=report.id, category_id=report.category_id, bucket=key)
+        for key in lsh_keys(tokens, lsh["bands"], lsh["rows"])
+    ] if lsh["enabled"] else []
+    return rows, buckets
+
+
+def index_new_reports(reports: list[Report]) -> None:
+    """Index freshly inserted ``reports`` with batched writes.
+
+    For bulk loads, whose reports have no index rows yet. Token and bucket rows
+    go in with ``bulk_create``; frequencies take one UPDATE per category and
+    distinct per-batch count instead of several queries per report.
+    """
+    lsh = lsh_config()
+    batch_size = _bulk_batch_size()
+    rows: list[ReportToken] = []
+    buckets: list[ReportBucket] = []
+    frequencies: dict[int, Counter] = defaultdict(Counter)
+    documents: Counter = Counter()
+    for report in reports:
+        if report.status not in OPEN_STATUSES:
+            continue
+        report_rows, report_buckets = _index_rows(report, report_tokens(report), lsh)
+        rows.extend(report_rows)
+        buckets.extend(report_buckets)
+        if report_rows:
+            frequencies[report.category_id].update(row.token for row in report_rows)
+            documents[report.category_id] += 1
+    if not rows and not buckets:
+        return
+
+    with transaction.atomic():
+        ReportToken.objects.bulk_create(rows, batch_size=batch_size, ignore_conflicts=True)
+        ReportBucket.objects.bulk_create(buckets, batch_size=batch_size)
+        TokenDocumentFrequency.objects.bulk_create(
+            [TokenDocumentFrequency(category_id=category_id, token=token)
+             for category_id, counts in frequencies.items() for token in counts],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        CategoryTokenStats.objects.bulk_create(
+            [CategoryTokenStats(category_id=category_id) for category_id in frequencies], ignore_conflicts=True
+        )
+        for category_id, counts in frequencies.items():
+            by_count: dict[int, list[str]] = defaultdict(list)
+            for token, n in counts.items():
+                by_count[n].append(token)
+            for n, tokens in by_count.items():
+                for start in range(0, len(tokens), batch_size):
+                    TokenDocumentFrequency.objects.filter(
+                        category_id=category_id, token__in=tokens[start:start + batch_size]
+                    ).update(doc_count=F("doc_count") + n)
+            CategoryTokenStats.objects.filter(category_id=category_id).update(
+                document_count=F("document_count") + documents[category_id],
+                total_tokens=F("total_tokens") + sum(counts.values()),
+            )
+
+
+def unindex_reports(report_ids: list[int]) -> None:
+    """Drop reports from the token index ahead of deleting them, keeping frequencies in step.
+
+    Cascading deletes would remove the ``ReportToken`` rows but leave the
+    per-category document frequencies counting them.
+    """
+    tokens = ReportToken.objects.filter(report_id__in=report_ids)
+    with transaction.atomic():
+        for row in tokens.values("category_id", "token").annotate(n=Count("id")).order_by():
+            TokenDocumentFrequency.objects.filter(category_id=row["category_id"], token=row["token"]).update(
+                doc_count=F("doc_count") - row["n"]
+            )
+        for row in tokens.values("category_id").annotate(docs=Count("report_id", distinct=True), n=Count("id")).order_by():
+            CategoryTokenStats.objects.filter(category_id=row["category_id"]).update(
+                document_count=F("document_count") - row["docs"],
+                total_tokens=F("total_tokens") - row["n"],
+            )
+        tokens.delete()
+        ReportBucket.objects.filter(report_id__in=report_ids).delete()
+
+
+def rebuild_token_index(batch_size: int = 500) -> int:
+    """Drop and rebuild the inverted index, document frequencies and LSH buckets.
+
+    Returns the number of reports indexed.
+    """
+    lsh = lsh_config()
+    with transaction.atomic():
+        ReportToken.objects.all().delete()
+        TokenDocumentFrequency.objects.all().delete()
+        CategoryTokenStats.objects.all().delete()
+        ReportBucket.objects.all().delete()
+
+        indexed = 0
+        batch: list[ReportToken] = []
+        buckets: list[ReportBucket] = []
+        open_reports = Report.objects.filter(status__in=OPEN_STATUSES).only(
+            "id", "category_id", "title", "description", "search_tokens"
+        )
+        for report in open_reports.iterator(chunk_size=batch_size):
+            report_rows, report_buckets = _index_rows(report, report_tokens(report), lsh)
+            batch.extend(report_rows)
+            buckets.extend(report_buckets)
+            indexed += 1
+            if len(batch) >= batch_size:
+                ReportToken.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+            if len(buckets) >= batch_size:
+                ReportBucket.objects.bulk_create(buckets)
+                buckets = []
+        if batch:
+            ReportToken.objects.bulk_create(batch, ignore_conflicts=True)
+        if buckets:
+            ReportBucket.objects.bulk_create(buckets)
+
+        TokenDocumentFrequency.objects.bulk_create(
+            [
+                TokenDocumentFrequency(category_id=row["category_id"], token=row["token"], doc_count=row["n"])
+                for row in ReportToken.objects.values("category_id", "token").annotate(n=Count("id")).iterator()
+            ],
+            batch_size=batch_size,
+        )
+        CategoryTokenStats.objects.bulk_create(
+            [
+                CategoryTokenStats(category_id=row["category_id"], document_count=row["docs"], total_tokens=row["n"])
+                for row in ReportToken.objects.values("category_id").annotate(
+                    docs=Count("report_id", distinct=True), n=Count("id")
+                )
+            ]
+        )
+    return indexed
+
+
+def token_index_available() -> bool:
+    return ReportToken.objects.exists()
+
+
+def _bulk_batch_size() -> int:
+    return getattr(settings, "MATCHING_BULK_BATCH_SIZE", 500)
+
 
+def notify_users_for_matches(matches: list[Match]) -> list[Notification]:
+    """Notify both report owners of every match with batched INSERTs."""
+    notifications: list[Notification] = []
+    for match in matches:
+        notifications.append(Notification(
+            user_id=match.lost_report.reported_by_id,
+            message=f"Potential match found for your lost item: {match.found_report.title}",
+            related_match=match,
+        ))
+        notifications.append(Notification(
+            user_id=match.found_report.reported_by_id,
+            message=f"Your found item may match: {match.lost_report.title}",
+            related_match=match,
+        ))
+    created = Notification.objects.bulk_create(notifications, batch_size=_bulk_batch_size())
+    # bulk_create skips the counter signals; new matches and notifications
+    # touch exactly the notified owners.
+    refresh_user_counters({notification.user_id for notification in notifications})
+    return created
+
+
+def notify_users_for_match(match: Match) -> None:
+    notify_users_for_matches([match])
+
+
+def run_matching_for_report(new_report: Report, only_tokens: set[str] | None = None) -> list[Match]:
+    """Score ``new_report`` against open opposite-type reports and store the best matches.
+
+    ``only_tokens`` limits indexed retrieval to candidates sharing one of those
+    tokens; incremental re-matching passes the tokens an edit introduced. Stage
+    timings and counters go to the ``matches.metrics`` log and registry.
+    """
+    run = MatchingRun(report_id=new_report.id)
+    try:
+        return save_matches_for_report(new_report, score_report(new_report, only_tokens, run=run), run=run)
+    finally:
+        run.finish()
+
+
+def _use_lsh(category_id: int, lsh: dict) -> bool:
+    if not lsh["enabled"]:
+        return False
+    size = CategoryTokenStats.objects.filter(category_id=category_id).values_list("document_count", flat=True)
+    return (size.first() or 0) >= lsh["min_category_size"]
+
+
+def candidate_queryset(new_report: Report, window_days: int):
+    """Open opposite-type reports in ``new_report``'s category and date window.
+
+    The filter shape matches ``report_match_lookup_idx``.
+    """
     opposite_type = Report.ReportType.FOUND if new_report.report_type == Report.ReportType.LOST else Report.ReportType.LOST
     date_min = new_report.date_lost_found - timedelta(days=window_days)
     date_max = new_report.date_lost_found + timedelta(days=window_days)
-
-    candidates = (
+    return (
         Report.objects.filter(
             report_type=opposite_type,
             category=new_report.category,
             date_lost_found__range=(date_min, date_max),
-            status__in=[Report.Status.PENDING, Report.Status.UNCLAIMED],
+            status__in=OPEN_STATUSES,
         )
         .exclude(id=new_report.id)
     )
 
-    tokens_new = tokenize(f"{new_report.title} {new_report.description}")
-    matches: list[Match] = []
 
-    for candidate in candidates:
-        tokens_other = tokenize(f"{candidate.title} {candidate.description}")
-        keyword_overlap = compute_overlap(tokens_new, tokens_other)
-        category_match = 1.0 if candidate.category_id == new_report.category_id else 0.0
-        date_diff = abs((candidate.date_lost_found - new_report.date_lost_found).days)
-        date_boost = weights.get("date_boost", 0.05) if date_diff <= 3 else 0.0
+def matching_state_version(report: Report) -> str:
+    """Fingerprint of everything a re-match of ``report`` depends on.
 
-        confidence = weights.get("category", 0.6) * category_match + weights.get("keyword", 0.4) * keyword_overlap
-        confidence = min(1.0, confidence + date_boost)
+    Covers the report itself, its candidate pool (row count plus latest
+    ``updated_at``, so new, edited, closed and deleted candidates all show up)
+    and the matching settings. Equal versions mean a re-match would find
+    nothing new.
+    """
+    config = matching_config()
+    pool = candidate_queryset(report, config["window_days"]).order_by().aggregate(n=Count("id"), latest=Max("updated_at"))
+    state = [report.pk, report.updated_at, report.status, pool["n"], pool["latest"], config]
+    raw = json.dumps(state, sort_keys=True, default=str)
+    return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
 
-        if confidence >= threshold:
-            lost, found = (new_report, candidate) if new_report.report_type == Report.ReportType.LOST else (candidate, new_report)
-            match = Match.objects.create(
-                lost_report=lost,
-                found_report=found,
-                confidence_score=confidence,
+
+def score_report(
+    new_report: Report,
+    only_tokens: set[str] | None = None,
+    use_lsh: bool | None = None,
+    run: MatchingRun | None = None,
+) -> list[tuple[float, Report]]:
+    """Best-first ``(confidence, candidate)`` pairs for ``new_report``; nothing is written.
+
+    Full scans in categories of at least ``MATCHING_LSH_MIN_CATEGORY_SIZE``
+    indexed reports only score candidates sharing an LSH bucket, trading a
+    little recall for work that no longer grows with the category. ``use_lsh``
+    forces the choice either way.
+    """
+    run = run or MatchingRun(report_id=new_report.id)
+    config = matching_config()
+    candidates = candidate_queryset(new_report, config["window_days"])
+
+    with run.stage("tokenize"):
+        tokens_new = report_tokens(new_report)
+    with run.stage("candidates"):
+        lsh = config["lsh"]
+        if use_lsh is None:
+            use_lsh = only_tokens is None and _use_lsh(new_report.category_id, lsh)
+        if use_lsh:
+            candidates = candidates.filter(
+                id__in=ReportBucket.objects.filter(
+                    category_id=new_report.category_id,
+                    bucket__in=lsh_keys(tokens_new, lsh["bands"], lsh["rows"]),
+                ).values("report_id")
             )
-            notify_users_for_match(match)
-            matches.append(match)
+        elif token_index_available():
+            # Only candidates sharing at least one token can score on keywords.
+            candidates = candidates.filter(
+                id__in=ReportToken.objects.filter(
+                    category_id=new_report.category_id,
+                    token__in=_index_terms(tokens_new if only_tokens is None else only_tokens),
+                ).values("report_id")
+            )
+        by_id = {candidate.id: candidate for candidate in candidates}
+    run.count("candidates_scanned", len(by_id))
+
+    # Candidates all share the report's category (see the filter above).
+    with run.stage("tokenize"):
+        block = TokenBlock.build(
+            (candidate.id, report_tokens(candidate), candidate.date_lost_found) for candidate in by_id.values()
+        )
+    with run.stage("scoring"):
+        scorer = get_keyword_scorer(config["weights"].get("scorer", "jaccard"), tokens_new, new_report.category_id)
+        best = TopK(config["max_matches"])
+        for confidence, candidate_id in score_block(scorer, tokens_new, new_report.date_lost_found, block, config):
+            best.push(confidence, candidate_id, by_id[candidate_id])
+    return best.items()
+
+
+def save_matches_for_report(
+    new_report: Report,
+    scored: list[tuple[float, Report]],
+    run: MatchingRun | None = None,
+) -> list[Match]:
+    """Insert matches for ``new_report`` against ``scored`` candidates, skipping pairs that already exist.
+
+    Retired pairs among ``scored`` are reactivated. Returns every match for the
+    scored pairs, best first. Only newly inserted matches notify users, so
+    re-running matching is safe.
+    """
+    if not scored:
+        return []
+    run = run or MatchingRun(report_id=new_report.id)
+    is_lost = new_report.report_type == Report.ReportType.LOST
+    side, other_side = ("lost_report", "found_report") if is_lost else ("found_report", "lost_report")
+    candidates = {candidate.id: candidate for _, candidate in scored}
+    pair_matches = Match.objects.filter(**{side: new_report, f"{other_side}_id__in": list(candidates)})
+
+    with transaction.atomic(), run.stage("insert"):
+        existing_ids = set(pair_matches.values_list("id", flat=True))
+        Match.objects.bulk_create(
+            [
+                Match(
+                    lost_report=new_report if is_lost else candidate,
+                    found_report=candidate if is_lost else new_report,
+                    confidence_score=confidence,
+                )
+                for confidence, candidate in scored
+            ],
+            batch_size=_bulk_batch_size(),
+            ignore_conflicts=True,
+        )
+        # ignore_conflicts leaves primary keys unset, so read the pairs back.
+        matches = list(pair_matches)
+        for match in matches:
+            setattr(match, side, new_report)
+            setattr(match, other_side, candidates[getattr(match, f"{other_side}_id")])
+        created = [match for match in matches if match.id not in existing_ids]
+        # A retired pair that scores above threshold again (e.g. an edit was
+        # reverted) comes back as pending with its new score. Its owners were
+        # already notified when it was first created.
+        scores = {candidate.id: confidence for confidence, candidate in scored}
+        now = timezone.now()
+        reactivated = [match for match in matches if match.id in existing_ids and match.status == Match.Status.RETIRED]
+        for match in reactivated:
+            match.status = Match.Status.PENDING
+            match.confidence_score = scores[getattr(match, f"{other_side}_id")]
+            match.updated_at = now
+        if reactivated:
+            Match.objects.bulk_update(
+                reactivated, ["status", "confidence_score", "updated_at"], batch_size=_bulk_batch_size()
+            )
+            refresh_user_counters({new_report.reported_by_id, *(getattr(m, other_side).reported_by_id for m in reactivated)})
+        run.count("matches_written", len(created) + len(reactivated))
+        if created:
+            with run.stage("notify"):
+                notify_users_for_matches(created)
 
+    matches.sort(key=lambda m: (-m.confidence_score, getattr(m, f"{other_side}_id")))
     return matches
 
 
+def rescore_pending_matches(report: Report) -> tuple[int, int]:
+    """Re-score ``report``'s pending matches; retire those no longer above threshold.
+
+    Returns (updated, retired).
+    """
+    config = matching_config()
+    is_lost = report.report_type == Report.ReportType.LOST
+    side, other_side = ("lost_report", "found_report") if is_lost else ("found_report", "lost_report")
+    pending = list(
+        Match.objects.filter(**{side: report, "status": Match.Status.PENDING}).select_related(other_side)
+    )
+    if not pending:
+        return 0, 0
+
+    tokens = report_tokens(report)
+    scorer = get_keyword_scorer(config["weights"].get("scorer", "jaccard"), tokens, report.category_id)
+    updated: list[Match] = []
+    retired: list[Match] = []
+    for match in pending:
+        other = getattr(match, other_side)
+        in_window = abs((other.date_lost_found - report.date_lost_found).days) <= config["window_days"]
+        confidence = score_pair(
+            scorer,
+            tokens,
+            report.date_lost_found,
+            report_tokens(other),
+            other.date_lost_found,
+            config,
+            same_category=other.category_id == report.category_id,
+        ) if in_window else None
+        if confidence is None:
+            match.status = Match.Status.RETIRED
+            retired.append(match)
+        elif confidence != match.confidence_score:
+            match.confidence_score = confidence
+            updated.append(match)
+
+    # bulk_update skips auto_now, and conditional GETs key on updated_at.
+    now = timezone.now()
+    for match in updated + retired:
+        match.updated_at = now
+    with transaction.atomic():
+        if updated:
+            Match.objects.bulk_update(updated, ["confidence_score", "updated_at"], batch_size=_bulk_batch_size())
+        if retired:
+            Match.objects.bulk_update(retired, ["status", "updated_at"], batch_size=_bulk_batch_size())
+            refresh_user_counters({report.reported_by_id, *(getattr(m, other_side).reported_by_id for m in retired)})
+    return len(updated), len(retired)
+
+
+def rematch_edited_report(report: Report, previous_tokens: set[str] | None = None) -> list[Match]:
+    """Delta matching after an edit.
+
+    Existing pending matches are re-scored (and retired if they fall below
+    threshold). New candidates are only looked up through tokens the edit
+    added; with ``previous_tokens`` of None (category or date changed) the whole
+    candidate window is re-scored instead.
+    """
+    rescore_pending_matches(report)
+    if previous_tokens is None:
+        return run_matching_for_report(report)
+    added = report_tokens(report) - previous_tokens
+    if not added:
+        return []
+    return run_matching_for_report(report, only_tokens=added)
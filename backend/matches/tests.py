@@ -1,8 +1,13 @@
 from __future__ import annotations
+import random
 from datetime import timedelta
+from io import StringIO
 from unittest.mock import patch
 from django.contrib.auth import get_user_model
-from django.test import TestCase, override_settings
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -10,13 +15,37 @@ from rest_framework.test import APITestCase
 from items.models import Category
 from notifications.models import Notification
 from reports.models import Report
-from .models import Match
+from .benchmark import measure_lsh_recall, percentile, run_benchmark
+from .jobs import drain_queue, process_job, requeue_stale_jobs
+from .metrics import registry
+from .minhash import collision_probability, estimate_jaccard, lsh_keys, minhash_signature
+from .rematch import rematch
+from .models import CategoryTokenStats, Match, MatchJob, ReportBucket, ReportToken, TokenDocumentFrequency
 from .serializers import MatchDetailSerializer, MatchSerializer
-from .services import compute_overlap, notify_users_for_match, run_matching_for_report, tokenize
+from .services import (
+    BM25Scorer,
+    CorpusStats,
+    JaccardScorer,
+    TokenBlock,
+    compute_overlap,
+    get_keyword_scorer,
+    notify_users_for_match,
+    notify_users_for_matches,
+    rebuild_token_index,
+    matching_config,
+    run_matching_for_report,
+    score_block,
+    score_pair,
+    score_report,
+    tokenize,
+)
 
 User = get_user_model()
 
 
+# Fixtures create their Match rows explicitly; keep the post_save signal from
+# matching the same pairs first.
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class MatchModelTest(TestCase):
 
     def setUp(self):
@@ -160,6 +189,7 @@ class MatchModelTest(TestCase):
         self.assertIn(match, found_matches)
 
 
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class MatchSerializerTest(TestCase):
     """Test cases for Match serializers."""
 
@@ -258,6 +288,7 @@ class MatchSerializerTest(TestCase):
         self.assertEqual(updated_match.status, Match.Status.CONFIRMED)
 
 
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class MatchAPITest(APITestCase):
     """Test cases for the Match API views."""
 
@@ -492,10 +523,19 @@ class MatchAPITest(APITestCase):
 
     def test_match_ordering(self):
         """Test that matches are ordered by created_at descending."""
-        # Create another match
+        # Create another match (pairs are unique, so against a second found report)
+        found_report2 = Report.objects.create(
+            title="Found Phone",
+            description="Found an iPhone",
+            category=self.category,
+            report_type=Report.ReportType.FOUND,
+            reported_by=self.user2,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
         new_match = Match.objects.create(
             lost_report=self.lost_report1,
-            found_report=self.found_report1,
+            found_report=found_report2,
             confidence_score=0.9
         )
         
@@ -515,6 +555,32 @@ class MatchAPITest(APITestCase):
         if len(data) >= 2:
             self.assertEqual(data[0]['id'], new_match.id)
 
+    def test_match_list_conditional_get(self):
+        """Test that an unchanged match list revalidates to 304 until a match changes."""
+        self.client.force_authenticate(user=self.admin_user)
+        url = reverse("match-list")
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.post(reverse("match-reject", kwargs={"pk": self.match1.pk}))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_match_detail_etag_follows_nested_reports(self):
+        """Test that editing a nested report invalidates the match detail."""
+        self.client.force_authenticate(user=self.user1)
+        url = reverse("match-detail", kwargs={"pk": self.match1.pk})
+        first = self.client.get(url)
+
+        self.found_report1.location = "Cafeteria"
+        self.found_report1.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["found_report"]["location"], "Cafeteria")
+
 
 class MatchServicesTest(TestCase):
     """Test cases for match services."""
@@ -584,6 +650,7 @@ class MatchServicesTest(TestCase):
         overlap = compute_overlap(["apple"], [])
         self.assertEqual(overlap, 0.0)
 
+    @override_settings(MATCHING_QUEUE_MODE="queue")
     def test_notify_users_for_match(self):
         """Test notification creation for matches."""
         lost_report = Report.objects.create(
@@ -801,6 +868,1056 @@ class MatchServicesTest(TestCase):
         self.assertEqual(len(matches), 0)
 
 
+class MatchFanOutTest(TestCase):
+    """Test cases for the per-report top-K match cap."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.category = Category.objects.create(name="Electronics")
+        descriptions = [
+            "Found a phone",
+            "Found a black phone",
+            "Found a black iphone phone",
+            "Found a black iphone 13 phone",
+            "Found a black iphone 13 pro phone",
+        ]
+        self.found_reports = [
+            Report.objects.create(
+                title="Phone",
+                description=description,
+                category=self.category,
+                report_type=Report.ReportType.FOUND,
+                reported_by=self.user2,
+                location="Library",
+                date_lost_found=timezone.now().date()
+            )
+            for description in descriptions
+        ]
+        self.lost_report = Report.objects.create(
+            title="Phone",
+            description="Lost a black iphone 13 pro phone",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            reported_by=self.user1,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+        Match.objects.all().delete()
+        Notification.objects.all().delete()
+
+    @override_settings(MATCHING_MAX_MATCHES_PER_REPORT=2)
+    def test_only_top_k_candidates_are_matched(self):
+        """Test that only the K best-scoring candidates become matches."""
+        matches = run_matching_for_report(self.lost_report)
+
+        self.assertEqual([m.found_report for m in matches], [self.found_reports[4], self.found_reports[3]])
+        self.assertGreater(matches[0].confidence_score, matches[1].confidence_score)
+        self.assertEqual(Match.objects.count(), 2)
+        self.assertEqual(Notification.objects.count(), 4)
+
+    @override_settings(MATCHING_MAX_MATCHES_PER_REPORT=0, MATCHING_MIN_SHARED_TOKENS=0)
+    def test_match_writes_use_constant_queries(self):
+        """Test that writing N matches and 2N notifications is batched."""
+        # index check, candidate query, existing pairs, match INSERT, read-back,
+        # notification INSERT, plus savepoint; then the owners' dashboard
+        # counters: a lock on their user rows, five grouped counts and one
+        # upsert, whatever N is
+        with self.assertNumQueries(15):
+            matches = run_matching_for_report(self.lost_report)
+
+        self.assertEqual(len(matches), 5)
+        self.assertTrue(all(m.pk for m in matches))
+        self.assertEqual(Notification.objects.filter(related_match__in=matches).count(), 10)
+
+    def test_notify_users_for_matches_batch(self):
+        """Test the batch notification variant."""
+        match = Match.objects.create(
+            lost_report=self.lost_report,
+            found_report=self.found_reports[0],
+            confidence_score=0.9
+        )
+
+        # One INSERT, then a user-row lock, five grouped counts and one upsert
+        # for the counters
+        with self.assertNumQueries(8):
+            notifications = notify_users_for_matches([match])
+
+        self.assertEqual({n.user_id for n in notifications}, {self.user1.id, self.user2.id})
+
+    @override_settings(MATCHING_MAX_MATCHES_PER_REPORT=0, MATCHING_MIN_SHARED_TOKENS=4)
+    def test_min_shared_tokens_gate(self):
+        """Test that candidates sharing too few tokens are skipped."""
+        matches = run_matching_for_report(self.lost_report)
+
+        self.assertEqual(
+            {m.found_report for m in matches},
+            {self.found_reports[3], self.found_reports[4]},
+        )
+
+
+class MatchingMetricsTest(TestCase):
+    """Test cases for per-stage matching instrumentation."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.category = Category.objects.create(name="Electronics")
+        for description in ["black iphone", "black iphone case", "silver laptop"]:
+            Report.objects.create(
+                title="Found",
+                description=description,
+                category=self.category,
+                report_type=Report.ReportType.FOUND,
+                reported_by=self.user2,
+                location="Library",
+                date_lost_found=timezone.now().date()
+            )
+        registry.reset()
+
+    def _create_lost_report(self):
+        return Report.objects.create(
+            title="Lost",
+            description="black iphone",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            reported_by=self.user1,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+
+    def test_run_records_stages_and_counters(self):
+        """Test that a matching run lands in the registry."""
+        self._create_lost_report()
+
+        snapshot = registry.snapshot()
+        self.assertEqual(snapshot["runs"], 1)
+        self.assertEqual(set(snapshot["stages"]), {"tokenize", "candidates", "scoring", "insert", "notify"})
+        self.assertEqual(snapshot["counters"], {"candidates_scanned": 2, "matches_written": 2})
+        self.assertEqual(snapshot["stages"]["insert"]["count"], 1)
+
+    def test_run_is_logged_as_structured_record(self):
+        """Test the structured log line for a matching run."""
+        lost_report = self._create_lost_report()
+        Match.objects.all().delete()
+
+        with self.assertLogs("matches.metrics", "INFO") as logs:
+            run_matching_for_report(lost_report)
+        record = logs.records[0].matching
+        self.assertEqual(record["report_id"], lost_report.id)
+        self.assertEqual(record["counters"]["matches_written"], 2)
+        self.assertIn("scoring", record["stages"])
+        self.assertIn(f"report={lost_report.id}", logs.output[0])
+
+
+class ReportTokenIndexTest(TestCase):
+    """Test cases for the inverted token index used by candidate retrieval."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.category = Category.objects.create(name="Electronics")
+
+    def _create_report(self, title, description, report_type, user):
+        return Report.objects.create(
+            title=title,
+            description=description,
+            category=self.category,
+            report_type=report_type,
+            reported_by=user,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+
+    def test_report_indexed_on_create(self):
+        """Test that a new report's tokens are written to the index."""
+        report = self._create_report("Found Kindle", "Black Kindle reader", Report.ReportType.FOUND, self.user2)
+
+        tokens = set(ReportToken.objects.filter(report=report).values_list("token", flat=True))
+        self.assertEqual(tokens, {"found", "kindle", "black", "reader"})
+
+    def test_index_follows_edits_and_status(self):
+        """Test that edits re-index and closed reports leave the index."""
+        report = self._create_report("Found Kindle", "Black reader", Report.ReportType.FOUND, self.user2)
+
+        report.title = "Found Kobo"
+        report.save()
+        tokens = set(ReportToken.objects.filter(report=report).values_list("token", flat=True))
+        self.assertIn("kobo", tokens)
+        self.assertNotIn("kindle", tokens)
+
+        report.status = Report.Status.CLAIMED
+        report.save()
+        self.assertFalse(ReportToken.objects.filter(report=report).exists())
+
+    def test_matching_skips_candidates_without_shared_tokens(self):
+        """Test that indexed retrieval only scores candidates sharing a token."""
+        self._create_report("Wallet", "Brown leather", Report.ReportType.FOUND, self.user2)
+        lost_report = self._create_report("Calculator", "Casio", Report.ReportType.LOST, self.user1)
+
+        Match.objects.all().delete()
+        self.assertEqual(run_matching_for_report(lost_report), [])
+
+    @override_settings(MATCHING_MIN_SHARED_TOKENS=0)
+    def test_matching_falls_back_to_scan_without_index(self):
+        """Test that matching scans the category when the index is empty."""
+        found_report = self._create_report("Wallet", "Brown leather", Report.ReportType.FOUND, self.user2)
+        lost_report = self._create_report("Calculator", "Casio", Report.ReportType.LOST, self.user1)
+
+        Match.objects.all().delete()
+        ReportToken.objects.all().delete()
+        matches = run_matching_for_report(lost_report)
+        self.assertEqual([m.found_report for m in matches], [found_report])
+
+    def test_rebuild_token_index(self):
+        """Test rebuilding the index from scratch."""
+        self._create_report("Found Kindle", "Black reader", Report.ReportType.FOUND, self.user2)
+        closed = self._create_report("Lost Kindle", "Black reader", Report.ReportType.LOST, self.user1)
+        Report.objects.filter(pk=closed.pk).update(status=Report.Status.CLAIMED)
+        ReportToken.objects.all().delete()
+
+        self.assertEqual(rebuild_token_index(), 1)
+        self.assertFalse(ReportToken.objects.filter(report=closed).exists())
+
+
+@override_settings(MATCHING_QUEUE_MODE="queue")
+class MatchJobQueueTest(TestCase):
+    """Test cases for the background matching queue."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.category = Category.objects.create(name="Electronics")
+
+        self.found_report = Report.objects.create(
+            title="Found iPhone",
+            description="Found an iPhone 13 Pro",
+            category=self.category,
+            report_type=Report.ReportType.FOUND,
+            reported_by=self.user2,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+
+    def _create_lost_report(self):
+        return Report.objects.create(
+            title="Lost iPhone",
+            description="Lost my iPhone 13 Pro",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            reported_by=self.user1,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+
+    def test_report_creation_enqueues_job(self):
+        """Test that creating a report queues matching instead of running it."""
+        MatchJob.objects.all().delete()
+        lost_report = self._create_lost_report()
+
+        self.assertEqual(Match.objects.count(), 0)
+        self.assertEqual(MatchJob.objects.filter(report=lost_report, status=MatchJob.Status.QUEUED).count(), 1)
+
+        self.assertEqual(drain_queue(), 1)
+        self.assertEqual(Match.objects.filter(lost_report=lost_report).count(), 1)
+        self.assertFalse(MatchJob.objects.exclude(status=MatchJob.Status.DONE).exists())
+
+    @override_settings(MATCHING_JOB_MAX_ATTEMPTS=2)
+    @patch("matches.jobs.run_matching_for_report", side_effect=RuntimeError("boom"))
+    def test_failed_job_is_retried_then_marked_failed(self, mock_run):
+        """Test retry with backoff and the final failed state."""
+        MatchJob.objects.all().delete()
+        lost_report = self._create_lost_report()
+        job = MatchJob.objects.get(report=lost_report)
+
+        with self.assertLogs("matches.jobs", level="ERROR"):
+            drain_queue()
+        job.refresh_from_db()
+        self.assertEqual(job.status, MatchJob.Status.QUEUED)
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIn("boom", job.last_error)
+
+        MatchJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        with self.assertLogs("matches.jobs", level="ERROR"):
+            drain_queue()
+        job.refresh_from_db()
+        self.assertEqual(job.status, MatchJob.Status.FAILED)
+        self.assertEqual(mock_run.call_count, 2)
+
+    @override_settings(MATCHING_QUEUE_MODE="async")
+    @patch("matches.jobs.run_matching_for_report", side_effect=[RuntimeError("boom"), None])
+    def test_async_failure_is_retried_in_process(self, mock_run):
+        """Test that a failed async job is resubmitted after its backoff without a worker."""
+        class InlineExecutor:
+            def submit(self, fn, job_id):
+                process_job(job_id)
+
+        with patch("matches.jobs._get_executor", return_value=InlineExecutor()), \
+                patch("matches.jobs.Timer") as timer, self.assertLogs("matches.jobs", level="ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                lost_report = self._create_lost_report()
+            job = MatchJob.objects.get(report=lost_report)
+            self.assertEqual((job.status, job.attempts), (MatchJob.Status.QUEUED, 1))
+
+            delay, retry = timer.call_args.args
+            self.assertEqual(delay, 2)
+            MatchJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+            retry(*timer.call_args.kwargs["args"])
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (MatchJob.Status.DONE, 2))
+        self.assertEqual(mock_run.call_count, 2)
+
+    def test_stale_running_job_is_requeued(self):
+        """Test that jobs abandoned by a crashed worker go back to the queue."""
+        lost_report = self._create_lost_report()
+        MatchJob.objects.filter(report=lost_report).update(
+            status=MatchJob.Status.RUNNING,
+            locked_at=timezone.now() - timedelta(hours=1),
+        )
+
+        self.assertEqual(requeue_stale_jobs(), 1)
+        self.assertEqual(MatchJob.objects.get(report=lost_report).status, MatchJob.Status.QUEUED)
+
+
+class IncrementalRematchTest(TestCase):
+    """Test cases for delta matching when a report is edited."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        self.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.found_kindle = self._create("Found Kindle", "Black reader", Report.ReportType.FOUND, self.user2)
+        self.found_phone = self._create("Found Pixel", "Google phone", Report.ReportType.FOUND, self.user2)
+        self.lost_report = self._create("Lost Kindle", "Black reader", Report.ReportType.LOST, self.user1)
+
+    def _create(self, title, description, report_type, user):
+        return Report.objects.create(
+            title=title,
+            description=description,
+            category=self.category,
+            report_type=report_type,
+            reported_by=user,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+
+    def _match(self, found_report):
+        return Match.objects.filter(lost_report=self.lost_report, found_report=found_report).first()
+
+    @override_settings(MATCHING_MIN_SHARED_TOKENS=2)
+    def test_edit_matches_new_candidates_and_retires_stale(self):
+        """Test that an edit finds new pairs and retires pending ones now below threshold."""
+        self.assertEqual(self._match(self.found_kindle).status, Match.Status.PENDING)
+        self.assertIsNone(self._match(self.found_phone))
+
+        self.lost_report.title = "Lost Pixel"
+        self.lost_report.description = "Google phone"
+        self.lost_report.save()
+
+        self.assertEqual(self._match(self.found_kindle).status, Match.Status.RETIRED)
+        self.assertEqual(self._match(self.found_phone).status, Match.Status.PENDING)
+
+    def test_reverted_edit_reactivates_retired_match(self):
+        """Test that a retired pair comes back as pending when it scores again."""
+        original = self._match(self.found_kindle)
+        other_category = Category.objects.create(name="Books")
+
+        self.lost_report.category = other_category
+        self.lost_report.save()
+        self.assertEqual(self._match(self.found_kindle).status, Match.Status.RETIRED)
+
+        self.lost_report.category = self.category
+        self.lost_report.save()
+
+        match = self._match(self.found_kindle)
+        self.assertEqual(match.id, original.id)
+        self.assertEqual(match.status, Match.Status.PENDING)
+        self.assertEqual(match.confidence_score, original.confidence_score)
+        self.assertEqual(Notification.objects.filter(related_match=match).count(), 2)
+
+    @override_settings(MATCHING_WEIGHTS={"category": 0.5, "keyword": 0.5, "date_boost": 0.0})
+    def test_edit_rescores_pending_matches(self):
+        """Test that surviving pending matches get their score refreshed."""
+        before = self._match(self.found_kindle).confidence_score
+
+        self.lost_report.description = "Black reader with scratched cover"
+        self.lost_report.save()
+
+        self.assertLess(self._match(self.found_kindle).confidence_score, before)
+
+    def test_untouched_fields_do_not_trigger_matching(self):
+        """Test that non-matching edits skip the matcher entirely."""
+        with patch("matches.jobs.rematch_edited_report") as mock_rematch:
+            self.lost_report.location = "Cafeteria"
+            self.lost_report.save()
+            self.lost_report.title = "LOST kindle!"
+            self.lost_report.save()
+
+        mock_rematch.assert_not_called()
+
+    @override_settings(MATCHING_QUEUE_MODE="queue")
+    def test_edit_enqueues_delta_job(self):
+        """Test the job kind recorded for each kind of edit."""
+        report = Report.objects.get(pk=self.lost_report.pk)
+        report.description = "Black reader in red case"
+        report.save()
+        job = MatchJob.objects.get(report=report)
+        self.assertEqual(job.kind, MatchJob.Kind.EDIT)
+        self.assertEqual(job.previous_tokens, "black kindle lost reader")
+
+        report.date_lost_found -= timedelta(days=2)
+        report.save()
+        self.assertEqual(MatchJob.objects.filter(report=report).latest("id").kind, MatchJob.Kind.RESCAN)
+
+
+class MatchUniquenessTest(TestCase):
+    """Test cases for match pair uniqueness and idempotent matching."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        self.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.found_report = Report.objects.create(
+            title="Found iPhone",
+            description="Found an iPhone 13 Pro",
+            category=self.category,
+            report_type=Report.ReportType.FOUND,
+            reported_by=self.user2,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+        self.lost_report = Report.objects.create(
+            title="Lost iPhone",
+            description="Lost my iPhone 13 Pro",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            reported_by=self.user1,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+
+    def test_duplicate_pair_rejected(self):
+        """Test that the database refuses a second row for the same pair."""
+        from django.db import IntegrityError, transaction
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Match.objects.create(lost_report=self.lost_report, found_report=self.found_report, confidence_score=0.5)
+
+    def test_rerunning_matching_is_idempotent(self):
+        """Test that re-matching returns the existing match without new notifications."""
+        existing = Match.objects.get(lost_report=self.lost_report, found_report=self.found_report)
+        notifications = Notification.objects.count()
+
+        matches = run_matching_for_report(self.lost_report)
+        matches_from_found_side = run_matching_for_report(self.found_report)
+
+        self.assertEqual(matches, [existing])
+        self.assertEqual(matches_from_found_side, [existing])
+        self.assertEqual(Match.objects.count(), 1)
+        self.assertEqual(Notification.objects.count(), notifications)
+
+
+class UniqueMatchPairMigrationTest(TransactionTestCase):
+    """Test that the unique-pair migration collapses existing duplicates."""
+
+    migrate_from = [
+        ("items", "0002_subcategory"),
+        ("matches", "0004_token_document_frequency"),
+        ("notifications", "0001_initial"),
+        ("reports", "0002_report_search_tokens"),
+    ]
+
+    def setUp(self):
+        """Roll the matches app back to before the constraint."""
+        self.executor = MigrationExecutor(connection)
+        self.migrate_to = [key for key in self.executor.loader.graph.leaf_nodes()]
+        self.executor.migrate(self.migrate_from)
+        self.old_apps = self.executor.loader.project_state(self.migrate_from).apps
+
+    def tearDown(self):
+        """Leave the schema fully migrated for the following tests."""
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+
+    def test_duplicates_collapsed_keeping_resolved_match(self):
+        """Test that the resolved row survives and notifications are re-pointed."""
+        User = self.old_apps.get_model("users", "User")
+        Category = self.old_apps.get_model("items", "Category")
+        Report = self.old_apps.get_model("reports", "Report")
+        Match = self.old_apps.get_model("matches", "Match")
+        Notification = self.old_apps.get_model("notifications", "Notification")
+
+        user = User.objects.create(username="user1", email="user1@example.com")
+        category = Category.objects.create(name="Electronics")
+        lost, found = [
+            Report.objects.create(
+                title=title,
+                description="iPhone",
+                category=category,
+                report_type=report_type,
+                reported_by=user,
+                location="Library",
+                date_lost_found=timezone.now().date()
+            )
+            for title, report_type in [("Lost", "lost"), ("Found", "found")]
+        ]
+        pending = Match.objects.create(lost_report=lost, found_report=found, confidence_score=0.5)
+        confirmed = Match.objects.create(lost_report=lost, found_report=found, confidence_score=0.5, status="confirmed")
+        Match.objects.create(lost_report=lost, found_report=found, confidence_score=0.5)
+        Notification.objects.create(user=user, message="match", related_match=pending)
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+
+        from notifications.models import Notification as CurrentNotification
+        self.assertEqual(list(Match.objects.values_list("id", flat=True)), [confirmed.id])
+        self.assertEqual(CurrentNotification.objects.get().related_match_id, confirmed.id)
+
+
+class ReportTokenBackfillMigrationTest(TransactionTestCase):
+    """Test that adding the token index backfills existing open reports."""
+
+    migrate_from = [
+        ("items", "0002_subcategory"),
+        ("matches", "0001_initial"),
+        ("notifications", "0001_initial"),
+        ("reports", "0001_initial"),
+    ]
+
+    def setUp(self):
+        """Roll the matches app back to before the token index."""
+        self.executor = MigrationExecutor(connection)
+        self.migrate_to = [key for key in self.executor.loader.graph.leaf_nodes()]
+        self.executor.migrate(self.migrate_from)
+        self.old_apps = self.executor.loader.project_state(self.migrate_from).apps
+
+    def tearDown(self):
+        """Leave the schema fully migrated for the following tests."""
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+
+    def test_existing_open_reports_stay_candidates(self):
+        """Test that a pre-index report is still retrieved once new reports are indexed."""
+        User = self.old_apps.get_model("users", "User")
+        Category = self.old_apps.get_model("items", "Category")
+        OldReport = self.old_apps.get_model("reports", "Report")
+
+        user = User.objects.create(username="user1", email="user1@example.com")
+        category = Category.objects.create(name="Electronics")
+        old_found, claimed = [
+            OldReport.objects.create(
+                title="Found Black iPhone",
+                description="iPhone 13 with a cracked case",
+                category=category,
+                report_type="found",
+                status=status,
+                reported_by=user,
+                location="Library",
+                date_lost_found=timezone.now().date()
+            )
+            for status in ["pending", "claimed"]
+        ]
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+
+        self.assertTrue(ReportToken.objects.filter(report_id=old_found.id, token="iphone").exists())
+        self.assertFalse(ReportToken.objects.filter(report_id=claimed.id).exists())
+
+        lost = Report.objects.create(
+            title="Lost Black iPhone",
+            description="iPhone 13 with a cracked case",
+            category_id=category.id,
+            report_type=Report.ReportType.LOST,
+            reported_by_id=user.id,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+        self.assertTrue(Match.objects.filter(lost_report=lost, found_report_id=old_found.id).exists())
+
+
+class KeywordScorerTest(TestCase):
+    """Test cases for the pluggable keyword scorers and document frequencies."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(
+            username="user1",
+            email="user1@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.other_category = Category.objects.create(name="Books")
+        for description in ["black phone", "black phone case", "black charger", "phone SN12345"]:
+            self._create_report(description)
+
+    def _create_report(self, description, category=None):
+        return Report.objects.create(
+            title="Found",
+            description=description,
+            category=category or self.category,
+            report_type=Report.ReportType.FOUND,
+            reported_by=self.user,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+
+    def _df(self, token, category=None):
+        row = TokenDocumentFrequency.objects.filter(category=category or self.category, token=token).first()
+        return row.doc_count if row else 0
+
+    def test_document_frequencies_follow_index(self):
+        """Test incremental document frequency maintenance."""
+        self.assertEqual(self._df("black"), 3)
+        self.assertEqual(self._df("sn12345"), 1)
+        self.assertEqual(CategoryTokenStats.objects.get(category=self.category).document_count, 4)
+
+        report = Report.objects.get(description="black charger")
+        report.category = self.other_category
+        report.save()
+        self.assertEqual(self._df("black"), 2)
+        self.assertEqual(self._df("black", self.other_category), 1)
+
+        report.status = Report.Status.CLAIMED
+        report.save()
+        self.assertEqual(self._df("black", self.other_category), 0)
+        self.assertEqual(CategoryTokenStats.objects.get(category=self.other_category).document_count, 0)
+
+    def test_deleted_reports_leave_frequencies(self):
+        """Test that deleting a report, directly or by cascade, decrements its counts."""
+        Report.objects.get(description="black charger").delete()
+        stats = CategoryTokenStats.objects.get(category=self.category)
+        self.assertEqual(self._df("black"), 2)
+        self.assertEqual(self._df("charger"), 0)
+        self.assertEqual(stats.document_count, 3)
+
+        owner = User.objects.create_user(username="user2", email="user2@example.com", password="testpass123")
+        Report.objects.filter(description="black phone case").update(reported_by=owner)
+        owner.delete()
+        stats.refresh_from_db()
+        self.assertEqual(self._df("black"), 1)
+        self.assertEqual(self._df("case"), 0)
+        self.assertEqual(stats.document_count, 2)
+
+    def test_rebuild_matches_incremental_frequencies(self):
+        """Test that a rebuild reproduces the incrementally maintained table."""
+        before = set(TokenDocumentFrequency.objects.filter(doc_count__gt=0).values_list("token", "doc_count"))
+        rebuild_token_index()
+        after = set(TokenDocumentFrequency.objects.values_list("token", "doc_count"))
+        self.assertEqual(before, after)
+
+    def test_bm25_weights_rare_tokens_higher(self):
+        """Test that a rare token outweighs a common one."""
+        scorer = get_keyword_scorer("bm25", {"black", "sn12345"}, self.category.id)
+        self.assertIsInstance(scorer, BM25Scorer)
+
+        self.assertGreater(scorer.score({"sn12345", "phone"}), scorer.score({"black", "phone"}))
+        self.assertAlmostEqual(scorer.score({"black", "sn12345"}), 1.0)
+        self.assertEqual(scorer.score({"charger"}), 0.0)
+
+    def test_unknown_scorer_rejected(self):
+        """Test that a misconfigured scorer name fails loudly."""
+        from django.core.exceptions import ImproperlyConfigured
+
+        with self.assertRaises(ImproperlyConfigured):
+            get_keyword_scorer("cosine", {"black"}, self.category.id)
+
+    @override_settings(
+        MATCHING_CONF_THRESHOLD=0.0,
+        MATCHING_WEIGHTS={"category": 0.0, "keyword": 1.0, "date_boost": 0.0, "scorer": "bm25"}
+    )
+    def test_run_matching_uses_configured_scorer(self):
+        """Test that MATCHING_WEIGHTS selects BM25 without code changes."""
+        Match.objects.all().delete()
+        lost_report = Report.objects.create(
+            title="Lost",
+            description="black SN12345",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            reported_by=self.user,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+        matches = run_matching_for_report(lost_report)
+
+        self.assertEqual(matches[0].found_report.description, "phone SN12345")
+
+
+class RematchTest(TestCase):
+    """Test cases for bulk re-matching."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        self.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+        self.category = Category.objects.create(name="Electronics")
+        today = timezone.now().date()
+        for offset, title in [(0, "Lost iPhone 13"), (40, "Lost Kindle reader")]:
+            Report.objects.create(
+                title=title,
+                description="Black device",
+                category=self.category,
+                report_type=Report.ReportType.LOST,
+                reported_by=self.user1,
+                location="Library",
+                date_lost_found=today - timedelta(days=offset)
+            )
+        for offset, title in [(1, "Found iPhone"), (41, "Found Kindle"), (90, "Found Kindle case")]:
+            Report.objects.create(
+                title=title,
+                description="Black device",
+                category=self.category,
+                report_type=Report.ReportType.FOUND,
+                reported_by=self.user2,
+                location="Library",
+                date_lost_found=today - timedelta(days=offset)
+            )
+        Match.objects.all().delete()
+        Notification.objects.all().delete()
+
+    def test_rematch_creates_missing_matches(self):
+        """Test that rematch finds every in-window pair across date buckets."""
+        stats = rematch(bucket_days=30)
+
+        self.assertEqual(stats.created, 2)
+        self.assertEqual(Match.objects.count(), 2)
+        self.assertEqual(Notification.objects.count(), 4)
+        self.assertFalse(Match.objects.filter(found_report__title="Found Kindle case").exists())
+
+    def test_rematch_is_idempotent(self):
+        """Test that re-running does not duplicate matches or notifications."""
+        rematch()
+        stats = rematch()
+
+        self.assertEqual(stats.created, 0)
+        self.assertEqual(stats.unchanged, 2)
+        self.assertEqual(Match.objects.count(), 2)
+        self.assertEqual(Notification.objects.count(), 4)
+
+    @override_settings(MATCHING_WEIGHTS={"category": 0.5, "keyword": 0.5, "date_boost": 0.0})
+    def test_rematch_refreshes_pending_scores(self):
+        """Test that changed weights update pending matches in place."""
+        match = Match.objects.create(
+            lost_report=Report.objects.get(title="Lost iPhone 13"),
+            found_report=Report.objects.get(title="Found iPhone"),
+            confidence_score=0.1
+        )
+        stats = rematch()
+
+        match.refresh_from_db()
+        self.assertEqual(stats.updated, 1)
+        self.assertGreater(match.confidence_score, 0.5)
+
+    def test_rematch_dry_run_writes_nothing(self):
+        """Test that a dry run only reports statistics."""
+        stats = rematch(dry_run=True)
+
+        self.assertEqual(stats.created, 2)
+        self.assertGreater(stats.pairs_scored, 0)
+        self.assertEqual(Match.objects.count(), 0)
+
+    def test_rematch_retires_stale_pending_matches(self):
+        """Test that pending pairs no longer scored are retired, and revived when they score again."""
+        lost = Report.objects.get(title="Lost iPhone 13")
+        stale = Match.objects.create(
+            lost_report=lost,
+            found_report=Report.objects.get(title="Found Kindle case"),
+            confidence_score=0.9
+        )
+        retired = Match.objects.create(
+            lost_report=lost,
+            found_report=Report.objects.get(title="Found iPhone"),
+            confidence_score=0.1,
+            status=Match.Status.RETIRED
+        )
+
+        out = StringIO()
+        call_command("rematch", "--dry-run", stdout=out)
+        self.assertIn("1 retired", out.getvalue())
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, Match.Status.PENDING)
+
+        stats = rematch()
+        stale.refresh_from_db()
+        retired.refresh_from_db()
+        self.assertEqual(stats.retired, 1)
+        self.assertEqual(stale.status, Match.Status.RETIRED)
+        self.assertEqual(retired.status, Match.Status.PENDING)
+        self.assertGreater(retired.confidence_score, 0.1)
+
+    def test_rematch_with_process_pool(self):
+        """Test that scoring across worker processes gives the same result."""
+        stats = rematch(workers=2)
+
+        self.assertEqual(stats.created, 2)
+        self.assertEqual(Match.objects.count(), 2)
+
+
+@override_settings(MATCHING_LSH_BANDS=32, MATCHING_LSH_ROWS=2, MATCHING_LSH_MIN_CATEGORY_SIZE=0)
+class LSHCandidatePruningTest(TestCase):
+    """Test cases for MinHash/LSH candidate pruning."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user1 = User.objects.create_user(
+            username="user1",
+            email="user1@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.user2 = User.objects.create_user(
+            username="user2",
+            email="user2@example.com",
+            password="testpass123",
+            role=User.Roles.STUDENT
+        )
+
+        self.category = Category.objects.create(name="Electronics")
+
+    def _create_report(self, title, description, report_type, user):
+        return Report.objects.create(
+            title=title,
+            description=description,
+            category=self.category,
+            report_type=report_type,
+            reported_by=user,
+            location="Library",
+            date_lost_found=timezone.now().date()
+        )
+
+    def test_signature_estimates_jaccard(self):
+        """Test that MinHash agreement tracks exact Jaccard similarity."""
+        a = {f"token{i}" for i in range(40)}
+        b = {f"token{i}" for i in range(20, 60)}
+        estimate = estimate_jaccard(minhash_signature(a, 256), minhash_signature(b, 256))
+
+        self.assertAlmostEqual(estimate, compute_overlap(a, b), delta=0.1)
+        self.assertEqual(minhash_signature(a, 16), minhash_signature(set(a), 16))
+        self.assertEqual(lsh_keys(a, 4, 2), lsh_keys(a, 4, 2))
+        self.assertEqual(lsh_keys(set(), 4, 2), [])
+
+    def test_collision_probability_is_s_curve(self):
+        """Test the banding collision probability around its threshold."""
+        self.assertLess(collision_probability(0.05, 32, 2), 0.1)
+        self.assertGreater(collision_probability(0.5, 32, 2), 0.99)
+
+    def test_buckets_follow_report_lifecycle(self):
+        """Test that buckets are written on create and dropped when a report closes."""
+        report = self._create_report("Found Kindle", "Black reader", Report.ReportType.FOUND, self.user2)
+        self.assertEqual(ReportBucket.objects.filter(report=report).count(), 32)
+
+        report.status = Report.Status.CLAIMED
+        report.save()
+        self.assertFalse(ReportBucket.objects.filter(report=report).exists())
+
+    def test_lsh_prunes_dissimilar_candidates(self):
+        """Test that only colliding candidates are scored when LSH is on."""
+        similar = self._create_report(
+            "Found black kindle", "Kindle paperwhite reader black case", Report.ReportType.FOUND, self.user2
+        )
+        self._create_report(
+            "Found charger", "Laptop charger kindle cable usb adapter brick", Report.ReportType.FOUND, self.user2
+        )
+        lost_report = self._create_report(
+            "Lost black kindle", "Kindle paperwhite reader black case", Report.ReportType.LOST, self.user1
+        )
+
+        exact = [candidate for _, candidate in score_report(lost_report, use_lsh=False)]
+        pruned = [candidate for _, candidate in score_report(lost_report)]
+        self.assertEqual(len(exact), 2)
+        self.assertEqual(pruned, [similar])
+        self.assertEqual(measure_lsh_recall([lost_report.id])["recall"], 0.5)
+
+    @override_settings(MATCHING_LSH_MIN_CATEGORY_SIZE=100)
+    def test_small_categories_use_exact_scan(self):
+        """Test that categories below the size floor skip LSH pruning."""
+        self._create_report("Found charger", "Laptop charger kindle cable usb adapter brick", Report.ReportType.FOUND, self.user2)
+        lost_report = self._create_report("Lost kindle", "Kindle paperwhite", Report.ReportType.LOST, self.user1)
+
+        self.assertEqual(len(score_report(lost_report)), 1)
+
+    def test_rebuild_writes_buckets(self):
+        """Test that rebuilding the index repopulates LSH buckets."""
+        self._create_report("Found Kindle", "Black reader", Report.ReportType.FOUND, self.user2)
+        ReportBucket.objects.all().delete()
+
+        rebuild_token_index()
+        self.assertEqual(ReportBucket.objects.count(), 32)
+
+
+class BlockScoringTest(TestCase):
+    """Test cases for bitset block scoring against the per-pair scorer."""
+
+    def setUp(self):
+        """Set up a random corpus of token sets."""
+        rng = random.Random(7)
+        vocabulary = [f"w{i}" for i in range(60)]
+        today = timezone.now().date()
+        self.rows = sorted(
+            (
+                (i, frozenset(rng.sample(vocabulary, rng.randint(0, 8))), today + timedelta(days=rng.randint(-14, 14)))
+                for i in range(1, 301)
+            ),
+            key=lambda row: (row[2], row[0]),
+        )
+        self.queries = [set(rng.sample(vocabulary, rng.randint(1, 8))) for _ in range(20)] + [set()]
+        self.today = today
+        self.corpus = CorpusStats(
+            document_count=300,
+            average_length=4.0,
+            frequencies={word: rng.randint(1, 300) for word in vocabulary},
+        )
+
+    def _pairwise(self, scorer, query, config, rows):
+        results = []
+        for row_id, tokens, day in rows:
+            confidence = score_pair(scorer, query, self.today, tokens, day, config)
+            if confidence is not None:
+                results.append((confidence, row_id))
+        return results
+
+    def test_block_scores_match_pairwise_scores(self):
+        """Test that both scorers give identical results through a block."""
+        block = TokenBlock.build(self.rows)
+        for scorer_class in (JaccardScorer, BM25Scorer):
+            for min_shared in (0, 1, 2):
+                config = {**matching_config(), "min_shared": min_shared}
+                for query in self.queries:
+                    scorer = scorer_class(query, self.corpus)
+                    with self.subTest(scorer=scorer_class.__name__, min_shared=min_shared, query=sorted(query)):
+                        self.assertEqual(
+                            score_block(scorer, query, self.today, block, config),
+                            self._pairwise(scorer, query, config, self.rows),
+                        )
+
+    def test_block_slices(self):
+        """Test scoring a slice of a shared block."""
+        block = TokenBlock.build(self.rows)
+        config = matching_config()
+        scorer = JaccardScorer(self.queries[0])
+        self.assertEqual(
+            score_block(scorer, self.queries[0], self.today, block, config, start=50, stop=120),
+            self._pairwise(scorer, self.queries[0], config, self.rows[50:120]),
+        )
+
+
+@override_settings(MATCHING_QUEUE_MODE="queue")
+class MatchingBenchmarkTest(TestCase):
+    """Test cases for the synthetic-corpus matching benchmark."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentile helper."""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_benchmark_reports_metrics_and_rolls_back(self):
+        """Test a tiny benchmark run end to end."""
+        result = run_benchmark(200, samples=5, memory_samples=2, seed=1)
+
+        self.assertEqual(result["reports"], 200)
+        self.assertEqual(result["samples"], 5)
+        self.assertLessEqual(result["latency_ms"]["p50"], result["latency_ms"]["p99"])
+        self.assertGreater(result["queries_per_run"], 0)
+        self.assertGreater(result["peak_memory_kb"], 0)
+        self.assertEqual(Report.objects.count(), 0)
+        self.assertEqual(Category.objects.count(), 0)
+
+
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class MatchAdminTest(TestCase):
     """Test cases for the Match admin interface."""
 
@@ -893,7 +2010,7 @@ class MatchIntegrationTest(TestCase):
 
         self.category = Category.objects.create(name="Electronics")
 
-    @patch('matches.services.notify_users_for_match')
+    @patch('matches.services.notify_users_for_matches')
     def test_end_to_end_matching_workflow(self, mock_notify):
         """Test complete matching workflow from report creation to resolution."""
         # Clear all existing reports and matches to ensure clean test
@@ -934,8 +2051,8 @@ class MatchIntegrationTest(TestCase):
         
         # Verify notification function was called at least once
         self.assertGreaterEqual(mock_notify.call_count, 1)
-        # Check that the first call was with our match
-        mock_notify.assert_any_call(match)
+        # Check that the batch notification included our match
+        mock_notify.assert_any_call(matches)
         
         # Test match resolution
         match.status = Match.Status.CONFIRMED
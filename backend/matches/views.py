@@ -1,15 +1,18 @@
 from __future__ import annotations
 from django.utils import timezone
 from rest_framework import permissions, response, viewsets, decorators
+from config.conditional import ConditionalGetMixin
 from users.permissions import IsAdminOrReadOnly
 from .models import Match
 from .serializers import MatchDetailSerializer, MatchSerializer
 
 
-class MatchViewSet(viewsets.ReadOnlyModelViewSet):
+class MatchViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Match.objects.all().order_by("-created_at")
     serializer_class = MatchSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # The detail serializer nests both reports.
+    retrieve_validator_fields = ("updated_at", "lost_report__updated_at", "found_report__updated_at")
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -28,7 +31,7 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
         match = self.get_object()
         match.status = Match.Status.CONFIRMED
         match.resolved_at = timezone.now()
-        match.save(update_fields=["status", "resolved_at"])
+        match.save(update_fields=["status", "resolved_at", "updated_at"])
         return response.Response({"status": match.status})
 
     @decorators.action(detail=True, methods=["post"], permission_classes=[IsAdminOrReadOnly])
@@ -36,7 +39,7 @@ class MatchViewSet(viewsets.ReadOnlyModelViewSet):
         match = self.get_object()
         match.status = Match.Status.REJECTED
         match.resolved_at = timezone.now()
-        match.save(update_fields=["status", "resolved_at"])
+        match.save(update_fields=["status", "resolved_at", "updated_at"])
         return response.Response({"status": match.status})
 
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -17,6 +17,9 @@ from .serializers import NotificationSerializer
 User = get_user_model()
 
 
+# Fixtures create their Match rows explicitly; keep the post_save signal from
+# matching the same pairs first.
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class NotificationModelTest(TestCase):
     """Test cases for the Notification model."""
 
@@ -160,6 +163,7 @@ class NotificationModelTest(TestCase):
         self.assertIsNone(notification.related_match)
 
 
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class NotificationSerializerTest(TestCase):
     """Test cases for the NotificationSerializer."""
 
@@ -264,6 +268,7 @@ class NotificationSerializerTest(TestCase):
         self.assertEqual(updated_notification.message, 'Test message')
 
 
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class NotificationAPITest(APITestCase):
     """Test cases for the Notification API views."""
 
@@ -485,6 +490,7 @@ class NotificationAPITest(APITestCase):
         self.assertEqual(len(data), 0)
 
 
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class NotificationAdminTest(TestCase):
     """Test cases for the Notification admin interface."""
 
@@ -564,6 +570,7 @@ class NotificationAdminTest(TestCase):
         self.assertEqual(admin_instance.search_fields, expected_search_fields)
 
 
+@override_settings(MATCHING_QUEUE_MODE="queue")
 class NotificationIntegrationTest(TestCase):
     """Integration tests for the notifications module."""
 
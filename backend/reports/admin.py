@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Report
+from .models import ArchivedReport, Report
 
 
 @admin.register(Report)
@@ -10,3 +10,10 @@ class ReportAdmin(admin.ModelAdmin):
     search_fields = ("title", "description", "location")
 
 
+
+
+@admin.register(ArchivedReport)
+class ArchivedReportAdmin(admin.ModelAdmin):
+    list_display = ("id", "title", "report_type", "status", "category", "reported_by", "archived_at")
+    list_filter = ("report_type", "status", "archived_at")
+    search_fields = ("title", "description", "location")
@@ -0,0 +1,132 @@
+"""Cold storage for resolved and expired reports.
+
+``archive_reports`` moves claimed reports, and reports left pending too long,
+into ``ArchivedReport`` together with every match that involves them, so
+browse, matching and dashboard queries stop scanning past them. Rows keep
+their primary keys. Owners and admins still read them through the report API.
+Reports with a chat conversation stay live, since deleting them would take
+the conversation and its messages with them.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from matches.models import ArchivedMatch, Match
+from matches.services import unindex_reports
+from .cache import bump_browse_version
+from .counters import refresh_user_counters, report_owner_ids
+from .models import ArchivedReport, Report
+from .signals import defer_bulk_work
+
+
+REPORT_FIELDS = (
+    "id", "title", "description", "category_id", "report_type", "status", "reported_by_id", "image",
+    "location", "date_lost_found", "created_at", "updated_at",
+)
+MATCH_FIELDS = (
+    "id", "lost_report_id", "found_report_id", "confidence_score", "status", "created_at", "updated_at", "resolved_at",
+)
+
+
+@dataclass
+class ArchiveStats:
+    reports: int = 0
+    matches: int = 0
+    batches: int = 0
+
+
+def archivable_reports(pending_days: int | None = None, claimed_days: int | None = None) -> QuerySet:
+    """Claimed reports untouched for ``claimed_days`` and pending ones older than ``pending_days``.
+
+    Reports that have a chat conversation are never archivable.
+    """
+    if pending_days is None:
+        pending_days = getattr(settings, "REPORTS_ARCHIVE_PENDING_DAYS", 180)
+    if claimed_days is None:
+        claimed_days = getattr(settings, "REPORTS_ARCHIVE_CLAIMED_DAYS", 0)
+    now = timezone.now()
+    return _without_conversations(Report.objects.filter(
+        Q(status=Report.Status.CLAIMED, updated_at__lte=now - timedelta(days=claimed_days))
+        | Q(status=Report.Status.PENDING, created_at__lt=now - timedelta(days=pending_days))
+    ))
+
+
+def _without_conversations(reports: QuerySet) -> QuerySet:
+    return reports.filter(lost_conversations=None, found_conversations=None)
+
+
+def archive_batch(report_ids: list[int]) -> tuple[int, int]:
+    """Move ``report_ids`` and their matches to the archive in one transaction.
+
+    Reports that gained a conversation since they were picked are skipped.
+    Owners' counters are refreshed once for the batch; the caller bumps the
+    browse cache. Returns ``(reports, matches)`` moved.
+    """
+    with transaction.atomic():
+        report_rows = list(_without_conversations(Report.objects.filter(id__in=report_ids)).values(*REPORT_FIELDS))
+        report_ids = [row["id"] for row in report_rows]
+        if not report_ids:
+            return 0, 0
+        matches = Match.objects.filter(Q(lost_report_id__in=report_ids) | Q(found_report_id__in=report_ids))
+        match_rows = list(matches.values(*MATCH_FIELDS))
+        owners = report_owner_ids(
+            {row["lost_report_id"] for row in match_rows} | {row["found_report_id"] for row in match_rows}
+        ) | {row["reported_by_id"] for row in report_rows}
+        ArchivedMatch.objects.bulk_create([ArchivedMatch(**row) for row in match_rows], ignore_conflicts=True)
+        ArchivedReport.objects.bulk_create([ArchivedReport(**row) for row in report_rows], ignore_conflicts=True)
+        unindex_reports(report_ids)
+        with defer_bulk_work():
+            Match.objects.filter(id__in=[row["id"] for row in match_rows]).delete()
+            _, deleted = Report.objects.filter(id__in=report_ids).delete()
+        refresh_user_counters(owners)
+    return deleted.get(Report._meta.label, 0), len(match_rows)
+
+
+def archive_reports(
+    batch_size: int = 500,
+    pending_days: int | None = None,
+    claimed_days: int | None = None,
+    limit: int | None = None,
+    progress: Callable[[ArchiveStats], None] | None = None,
+) -> ArchiveStats:
+    """Archive every eligible report in batches of ``batch_size``, at most ``limit`` in total."""
+    stats = ArchiveStats()
+    candidates = archivable_reports(pending_days, claimed_days).order_by("id").values_list("id", flat=True)
+    last_id = 0
+    while limit is None or stats.reports < limit:
+        size = batch_size if limit is None else min(batch_size, limit - stats.reports)
+        report_ids = list(candidates.filter(id__gt=last_id)[:size])
+        if not report_ids:
+            break
+        last_id = report_ids[-1]
+        reports, matches = archive_batch(report_ids)
+        stats.reports += reports
+        stats.matches += matches
+        stats.batches += 1
+        if progress:
+            progress(stats)
+    if stats.reports:
+        bump_browse_version()
+    return stats
+
+
+def archived_reports_for(user) -> QuerySet:
+    """Archived reports ``user`` may read: their own, or all of them for admins."""
+    qs = ArchivedReport.objects.order_by("-created_at")
+    if not user or not user.is_authenticated:
+        return qs.none()
+    if user.is_staff or getattr(user, "role", None) == "admin":
+        return qs
+    return qs.filter(reported_by=user)
+
+
+def archived_matches(report_id: int) -> list[dict]:
+    return list(
+        ArchivedMatch.objects.filter(Q(lost_report_id=report_id) | Q(found_report_id=report_id))
+        .order_by("-confidence_score", "id")
+        .values(*MATCH_FIELDS)
+    )
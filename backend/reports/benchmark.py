@@ -0,0 +1,62 @@
+"""List rendering throughput: DRF serializers versus the values() fast path."""
+from __future__ import annotations
+import time
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from matches.benchmark import generate_corpus
+from .models import Report
+from .serializers import ReportListSerializer, ReportRowSerializer, report_columns
+
+
+def _rows_per_second(render, rows: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render()
+        best = min(best, time.perf_counter() - start)
+    return round(rows / best) if best else 0.0
+
+
+def measure_list_rendering(limit: int = 1000, fields: list[str] | None = None, repeat: int = 5) -> dict:
+    """Rows/sec for fetching and rendering the newest ``limit`` reports.
+
+    ``serializer`` is the previous path (model instances through
+    ``ReportListSerializer``); ``fast`` is ``values()`` plus
+    ``ReportRowSerializer``. Both include the query. Best of ``repeat`` runs.
+    """
+    fields = fields or ReportListSerializer.Meta.fields
+    context = {"request": Request(APIRequestFactory().get("/api/reports/"))}
+    queryset = Report.objects.order_by("-created_at")[:limit]
+    rows = queryset.count()
+
+    def serializer():
+        serializer = ReportListSerializer(list(queryset), many=True, context=context)
+        for name in set(serializer.child.fields) - set(fields):
+            serializer.child.fields.pop(name)
+        return serializer.data
+
+    def fast():
+        return ReportRowSerializer(list(queryset.values(*report_columns(fields))), fields, context=context).data
+
+    before = _rows_per_second(serializer, rows, repeat)
+    after = _rows_per_second(fast, rows, repeat)
+    return {
+        "rows": rows,
+        "fields": list(fields),
+        "serializer_rows_per_sec": before,
+        "fast_rows_per_sec": after,
+        "speedup": round(after / before, 2) if before else None,
+    }
+
+
+def run_list_benchmark(n_reports: int, limit: int = 1000, repeat: int = 5, seed: int = 0) -> list[dict]:
+    """Benchmark full and ``id,title`` list output over a synthetic corpus, rolled back afterwards."""
+    with transaction.atomic():
+        generate_corpus(n_reports, seed=seed)
+        results = [
+            measure_list_rendering(limit, repeat=repeat),
+            measure_list_rendering(limit, ["id", "title"], repeat=repeat),
+        ]
+        transaction.set_rollback(True)
+    return results
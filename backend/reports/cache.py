@@ -0,0 +1,78 @@
+from __future__ import annotations
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from rest_framework.response import Response
+
+
+VERSION_KEY = "reports:browse:version"
+
+
+def browse_version() -> int:
+    return cache.get_or_set(VERSION_KEY, time.time_ns, timeout=None)
+
+
+def bump_browse_version() -> None:
+    """Invalidate every cached browse response at once.
+
+    Old entries are never deleted; they become unreachable and expire.
+    Versions are nanosecond timestamps, so a version key lost to culling never
+    comes back as a value old entries are stored under, and concurrent bumps
+    need no atomic increment.
+    """
+    cache.set(VERSION_KEY, max(time.time_ns(), browse_version() + 1), timeout=None)
+
+
+def normalized_params(request) -> str:
+    """Query string with keys sorted and blank values dropped."""
+    items = sorted(
+        (key, value)
+        for key in request.query_params
+        for value in request.query_params.getlist(key)
+        if value.strip()
+    )
+    return "&".join(f"{key}={value.strip()}" for key, value in items)
+
+
+def browse_cache_key(request, prefix: str = "list") -> str:
+    # The host is part of the key because paginated bodies carry absolute links.
+    raw = f"{request.get_host()}?{normalized_params(request)}"
+    digest = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+    return f"reports:browse:{prefix}:v{browse_version()}:{digest}"
+
+
+def browse_cache_timeout() -> int:
+    return getattr(settings, "REPORTS_BROWSE_CACHE_TIMEOUT", 60)
+
+
+def cached_browse_response(request, render, prefix: str = "list"):
+    """Serve an anonymous GET from the browse cache, filling it on a miss.
+
+    Only 200 responses are stored, together with their validator headers, so
+    a hit can still answer a conditional request with 304 without touching
+    the database.
+    """
+    timeout = browse_cache_timeout()
+    if not timeout or request.method != "GET" or request.user.is_authenticated:
+        return render()
+
+    key = browse_cache_key(request, prefix)
+    cached = cache.get(key)
+    if cached is not None:
+        data, headers = cached
+        etag = headers.get("ETag")
+        not_modified = get_conditional_response(request, etag=etag) if etag else None
+        response = not_modified or Response(data)
+        for name, value in headers.items():
+            response.headers[name] = value
+        response.headers["X-Cache"] = "HIT"
+        return response
+
+    response = render()
+    if response.status_code == 200:
+        headers = {name: response.headers[name] for name in ("ETag", "Last-Modified") if name in response.headers}
+        cache.set(key, (response.data, headers), timeout)
+    response.headers["X-Cache"] = "MISS"
+    return response
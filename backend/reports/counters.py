@@ -0,0 +1,111 @@
+"""Per-user dashboard counters.
+
+Counters are recomputed for the affected users whenever a report, match or
+notification changes, rather than adjusted by deltas: one grouped pass covers
+any number of users, and bulk writes that bypass signals only need to call
+``refresh_user_counters`` with the owners they touched. Each refresh locks the
+owners' user rows before counting, so concurrent refreshes for the same user
+run one after the other and the last write reflects the latest commit.
+"""
+from __future__ import annotations
+from functools import partial
+from typing import Iterable
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+from matches.models import Match
+from notifications.models import Notification
+from users.models import UserCounters
+from .models import Report
+
+
+COUNTER_FIELDS = ("total_reports", "active_matches", "resolved_items", "unread_notifications")
+
+_MATCH_COUNTS = {
+    "active_matches": Count("id", filter=Q(status=Match.Status.PENDING)),
+    "resolved_items": Count("id", filter=Q(status=Match.Status.CONFIRMED)),
+}
+
+
+def _match_counts(user_ids: list[int]) -> dict[int, dict]:
+    """Pending and confirmed matches per owner, counting a match once when a user owns both sides."""
+    counts: dict[int, dict] = {}
+
+    def add(rows, sign: int):
+        for row in rows:
+            totals = counts.setdefault(row["owner"], dict.fromkeys(_MATCH_COUNTS, 0))
+            for key in _MATCH_COUNTS:
+                totals[key] += sign * row[key]
+
+    add(Match.objects.filter(lost_report__reported_by_id__in=user_ids)
+        .values(owner=F("lost_report__reported_by_id")).annotate(**_MATCH_COUNTS).order_by(), 1)
+    add(Match.objects.filter(found_report__reported_by_id__in=user_ids)
+        .values(owner=F("found_report__reported_by_id")).annotate(**_MATCH_COUNTS).order_by(), 1)
+    add(Match.objects.filter(lost_report__reported_by_id__in=user_ids,
+                             found_report__reported_by_id=F("lost_report__reported_by_id"))
+        .values(owner=F("lost_report__reported_by_id")).annotate(**_MATCH_COUNTS).order_by(), -1)
+    return counts
+
+
+def compute_user_counters(user_ids: Iterable[int]) -> dict[int, dict]:
+    """Current counter values for ``user_ids`` from five grouped queries."""
+    user_ids = sorted({user_id for user_id in user_ids if user_id is not None})
+    values = {user_id: dict.fromkeys(COUNTER_FIELDS, 0) for user_id in user_ids}
+    if not user_ids:
+        return values
+    for row in (Report.objects.filter(reported_by_id__in=user_ids)
+                .values("reported_by_id").annotate(n=Count("id")).order_by()):
+        values[row["reported_by_id"]]["total_reports"] = row["n"]
+    for user_id, counts in _match_counts(user_ids).items():
+        values[user_id].update(counts)
+    for row in (Notification.objects.filter(user_id__in=user_ids, is_read=False)
+                .values("user_id").annotate(n=Count("id")).order_by()):
+        values[row["user_id"]]["unread_notifications"] = row["n"]
+    return values
+
+
+def refresh_user_counters(user_ids: Iterable[int]) -> list[UserCounters]:
+    """Recompute and upsert the counters rows of ``user_ids`` under a lock on their user rows.
+
+    Users that no longer exist are skipped.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return []
+    with transaction.atomic(savepoint=False):
+        locked = list(get_user_model().objects.select_for_update()
+                      .filter(pk__in=user_ids).order_by("pk").values_list("pk", flat=True))
+        return save_user_counters(compute_user_counters(locked))
+
+
+def schedule_counter_refresh(user_ids: Iterable[int]) -> None:
+    """Refresh the counters of ``user_ids`` once the current transaction commits."""
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if user_ids:
+        transaction.on_commit(partial(refresh_user_counters, user_ids))
+
+
+def save_user_counters(values: dict[int, dict]) -> list[UserCounters]:
+    """Upsert counters rows from ``compute_user_counters`` output in one query."""
+    if not values:
+        return []
+    now = timezone.now()
+    return UserCounters.objects.bulk_create(
+        [UserCounters(user_id=user_id, updated_at=now, **counts) for user_id, counts in values.items()],
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=[*COUNTER_FIELDS, "updated_at"],
+    )
+
+
+def user_counters(user) -> UserCounters:
+    """The counters row for ``user``: one primary-key lookup, computed on first use."""
+    counters = UserCounters.objects.filter(pk=user.pk).first()
+    if counters is None:
+        counters = refresh_user_counters([user.pk])[0]
+    return counters
+
+
+def report_owner_ids(report_ids: Iterable[int]) -> set[int]:
+    return set(Report.objects.filter(id__in=set(report_ids)).values_list("reported_by_id", flat=True))
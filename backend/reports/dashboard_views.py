@@ -3,49 +3,56 @@ from django.db.models import Count, Q
 from rest_framework import permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from config.conditional import aggregate_validators, conditional, conditional_response
 from matches.models import Match
 from notifications.models import Notification
+from .counters import user_counters
 from .models import Report
 
 
+def _user_matches(user):
+    return Match.objects.filter(Q(lost_report__reported_by=user) | Q(found_report__reported_by=user))
+
+
+def _reports_validators(request):
+    return aggregate_validators(Report.objects.filter(reported_by=request.user), ("updated_at", "category__updated_at"))
+
+
+def _matches_validators(request):
+    return aggregate_validators(
+        _user_matches(request.user), ("updated_at", "lost_report__updated_at", "found_report__updated_at")
+    )
+
+
+def _notifications_validators(request):
+    return aggregate_validators(
+        Notification.objects.filter(user=request.user), ("created_at",), unread=Count("pk", filter=Q(is_read=False))
+    )
+
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def dashboard_stats(request):
-    # Get dashboard statistics for the current user
-    user = request.user
-    
-    # Get user's reports
-    user_reports = Report.objects.filter(reported_by=user)
-    total_reports = user_reports.count()
-    
-    # Get active matches (pending matches for user's reports)
-    active_matches = Match.objects.filter(
-        Q(lost_report__reported_by=user) | Q(found_report__reported_by=user),
-        status=Match.Status.PENDING
-    ).count()
-    
-    # Get resolved items (confirmed matches)
-    resolved_items = Match.objects.filter(
-        Q(lost_report__reported_by=user) | Q(found_report__reported_by=user),
-        status=Match.Status.CONFIRMED
-    ).count()
-    
-    # Get unread notifications
-    unread_notifications = Notification.objects.filter(
-        user=user,
-        is_read=False
-    ).count()
-    
-    return Response({
-        'total_reports': total_reports,
-        'active_matches': active_matches,
-        'resolved_items': resolved_items,
-        'notifications': unread_notifications
-    })
+    # Dashboard statistics for the current user, from the denormalized counters row
+    counters = user_counters(request.user)
+    validators = (
+        counters.total_reports,
+        counters.updated_at,
+        counters.active_matches,
+        counters.resolved_items,
+        counters.unread_notifications,
+    )
+    return conditional_response(request, validators, lambda: Response({
+        'total_reports': counters.total_reports,
+        'active_matches': counters.active_matches,
+        'resolved_items': counters.resolved_items,
+        'notifications': counters.unread_notifications
+    }))
 
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
+@conditional(_reports_validators)
 def user_reports(request):
     # Get current user's reports
     user = request.user
@@ -74,6 +81,7 @@ def user_reports(request):
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
+@conditional(_matches_validators)
 def user_matches(request):
     # Get matches for current user's reports
     user = request.user
@@ -116,6 +124,7 @@ def user_matches(request):
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
+@conditional(_notifications_validators)
 def user_notifications(request):
     # Get notifications for current user
     user = request.user
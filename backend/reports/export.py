@@ -0,0 +1,99 @@
+"""Streaming CSV/NDJSON export of reports and matches.
+
+Rows are read with ``values().iterator(chunk_size=...)`` and encoded one at a
+time, so memory stays flat however many rows are exported: no model
+instances, no pagination and no COUNT query.
+"""
+from __future__ import annotations
+import csv
+import json
+from typing import Iterable, Iterator
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from matches.models import Match
+from .filters import filter_reports
+from .models import Report
+
+
+FORMATS = ("ndjson", "csv")
+CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+REPORT_FIELDS = (
+    "id", "title", "description", "category_id", "report_type", "status", "reported_by_id",
+    "location", "date_lost_found", "created_at", "updated_at",
+)
+MATCH_FIELDS = (
+    "id", "lost_report_id", "found_report_id", "confidence_score", "status",
+    "created_at", "updated_at", "resolved_at",
+)
+
+
+def export_chunk_size() -> int:
+    return getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+
+
+def report_export_queryset(params) -> QuerySet:
+    """Reports filtered exactly like the browse API, oldest first."""
+    return filter_reports(Report.objects.order_by("id"), params)
+
+
+def match_export_queryset(params) -> QuerySet:
+    """Matches narrowed by ``status``, lost report ``category``, ``min_confidence`` and created date range."""
+    qs = Match.objects.order_by("id")
+    if params.get("status"):
+        qs = qs.filter(status=params["status"])
+    if params.get("category"):
+        qs = qs.filter(lost_report__category_id=params["category"])
+    if params.get("min_confidence"):
+        qs = qs.filter(confidence_score__gte=float(params["min_confidence"]))
+    if params.get("created_at__date__gte"):
+        qs = qs.filter(created_at__date__gte=params["created_at__date__gte"])
+    if params.get("created_at__date__lte"):
+        qs = qs.filter(created_at__date__lte=params["created_at__date__lte"])
+    return qs
+
+
+EXPORTS = {
+    "reports": (report_export_queryset, REPORT_FIELDS),
+    "matches": (match_export_queryset, MATCH_FIELDS),
+}
+
+
+class _Echo:
+    """File-like object whose ``write`` hands the line back to the csv writer's caller."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_rows(queryset: QuerySet, fields: tuple[str, ...], chunk_size: int | None = None) -> Iterator[dict]:
+    # values() keeps the search_rank ordering of ?q= exports without selecting it.
+    return queryset.values(*fields).iterator(chunk_size=chunk_size or export_chunk_size())
+
+
+def encode_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+    for row in rows:
+        yield encoder.encode(row) + "\n"
+
+
+def encode_csv(rows: Iterable[dict], fields: tuple[str, ...]) -> Iterator[str]:
+    writer = csv.DictWriter(_Echo(), fieldnames=fields)
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def export_lines(kind: str, params, fmt: str, chunk_size: int | None = None) -> Iterator[str]:
+    """Encoded lines for exporting ``kind`` (``reports`` or ``matches``) filtered by ``params``.
+
+    Raises ValueError for an unknown kind or format before any query runs.
+    """
+    if kind not in EXPORTS:
+        raise ValueError(f"Unknown export {kind!r}; expected one of {', '.join(EXPORTS)}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    build_queryset, fields = EXPORTS[kind]
+    rows = iter_rows(build_queryset(params), fields, chunk_size)
+    return encode_csv(rows, fields) if fmt == "csv" else encode_ndjson(rows)
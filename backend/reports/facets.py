@@ -0,0 +1,52 @@
+from __future__ import annotations
+from collections import Counter
+from django.db.models import Count, QuerySet
+from .models import Report
+
+
+def report_facets(queryset: QuerySet, params) -> dict:
+    """Counts per category, report type and status in one grouped query.
+
+    ``queryset`` carries every filter except the three facet ones. Rows are
+    grouped by (category, type, status), and each facet then applies the
+    *other* two selections in Python, so a chip shows how many results picking
+    it would give. ``total`` applies all three.
+    """
+    selected_type = params.get("type") if params.get("type") in Report.ReportType.values else None
+    selected_category = params.get("category") or None
+    selected_status = params.get("status") or None
+
+    rows = (
+        queryset.order_by()
+        .values("category_id", "category__name", "report_type", "status")
+        .annotate(n=Count("id"))
+    )
+
+    categories: Counter = Counter()
+    category_names: dict[int, str] = {}
+    types: Counter = Counter({value: 0 for value in Report.ReportType.values})
+    statuses: Counter = Counter({value: 0 for value in Report.Status.values})
+    total = 0
+    for row in rows:
+        type_ok = selected_type is None or row["report_type"] == selected_type
+        category_ok = selected_category is None or str(row["category_id"]) == selected_category
+        status_ok = selected_status is None or row["status"] == selected_status
+        if type_ok and status_ok:
+            categories[row["category_id"]] += row["n"]
+            category_names[row["category_id"]] = row["category__name"]
+        if category_ok and status_ok:
+            types[row["report_type"]] += row["n"]
+        if type_ok and category_ok:
+            statuses[row["status"]] += row["n"]
+        if type_ok and category_ok and status_ok:
+            total += row["n"]
+
+    return {
+        "total": total,
+        "category": [
+            {"id": category_id, "name": category_names[category_id], "count": n}
+            for category_id, n in sorted(categories.items(), key=lambda item: (-item[1], category_names[item[0]]))
+        ],
+        "report_type": [{"value": value, "count": types[value]} for value in Report.ReportType.values],
+        "status": [{"value": value, "count": statuses[value]} for value in Report.Status.values],
+    }
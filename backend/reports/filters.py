@@ -0,0 +1,38 @@
+from __future__ import annotations
+from django.db.models import QuerySet
+from .search import search_reports
+
+
+def filter_reports(qs: QuerySet, params, apply_facets: bool = True) -> QuerySet:
+    """Apply the browse query parameters (``type``, ``category``, ``status``, ``q`` and date range) to ``qs``.
+
+    Shared by the report API and exports so both accept the same filters.
+    ``apply_facets=False`` leaves out type, category and status, which the
+    facet counts apply themselves.
+    """
+    report_type = params.get("type")
+    category = params.get("category")
+    status_param = params.get("status")
+    q = params.get("q")
+
+    # Date range filtering
+    date_from = params.get("created_at__date__gte")
+    date_to = params.get("created_at__date__lte")
+
+    if apply_facets:
+        if report_type in {"lost", "found"}:
+            qs = qs.filter(report_type=report_type)
+        if category:
+            qs = qs.filter(category_id=category)
+        if status_param:
+            qs = qs.filter(status=status_param)
+    if q:
+        qs = search_reports(qs, q)
+
+    # Apply date range filters
+    if date_from:
+        qs = qs.filter(created_at__date__gte=date_from)
+    if date_to:
+        qs = qs.filter(created_at__date__lte=date_to)
+
+    return qs
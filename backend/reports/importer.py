@@ -0,0 +1,160 @@
+"""Bulk report import from CSV or NDJSON.
+
+Rows are parsed one at a time from the stream, validated, and inserted with
+``bulk_create`` in batches. ``bulk_create`` skips ``save()`` and ``post_save``,
+so each batch does by hand what those would have done per row: compute search
+tokens, index the reports for matching, schedule matching once for the whole
+batch, refresh the owners' dashboard counters and invalidate the browse cache.
+"""
+from __future__ import annotations
+import codecs
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+from django.db import transaction
+from matches.jobs import enqueue_matching_batch
+from matches.services import index_new_reports
+from .cache import bump_browse_version
+from .counters import refresh_user_counters
+from .models import Report
+from .serializers import ReportImportSerializer
+
+
+FORMATS = ("csv", "ndjson")
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    created: int = 0
+    batches: int = 0
+    # (line number, {field: [messages]})
+    errors: list[tuple[int, dict]] = field(default_factory=list)
+
+
+def detect_format(name: str = "", content_type: str = "") -> str | None:
+    name = name.lower()
+    if name.endswith(".csv") or "csv" in content_type:
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")) or "ndjson" in content_type or "jsonl" in content_type:
+        return "ndjson"
+    return None
+
+
+def _text_lines(stream) -> Iterable[str]:
+    """Decode a binary stream lazily; text streams pass through."""
+    if isinstance(stream, io.TextIOBase):
+        return stream
+    return codecs.iterdecode(stream, "utf-8-sig")
+
+
+def iter_rows(stream, fmt: str) -> Iterator[tuple[int, dict | None, str]]:
+    """Yield ``(line, row, error)`` without reading the whole stream into memory.
+
+    ``row`` is None and ``error`` set for lines that cannot be parsed. Malformed
+    CSV records are skipped; bytes that are not UTF-8 end the import at that
+    line, since nothing after them can be decoded reliably.
+    """
+    read = 0
+
+    def counted(lines: Iterable[str]) -> Iterator[str]:
+        nonlocal read
+        for line in lines:
+            read += 1
+            yield line
+
+    lines = counted(_text_lines(stream))
+    try:
+        if fmt == "csv":
+            yield from _csv_rows(lines)
+        else:
+            yield from _ndjson_rows(lines)
+    except UnicodeDecodeError as exc:
+        yield read + 1, None, f"Invalid UTF-8: {exc.reason}"
+
+
+def _csv_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict | None, str]]:
+    reader = csv.DictReader(lines)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as exc:
+            yield reader.line_num, None, f"Invalid CSV: {exc}"
+            continue
+        yield reader.line_num, {key: value for key, value in row.items() if key is not None}, ""
+
+
+def _ndjson_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict | None, str]]:
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_no, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(row, dict):
+            yield line_no, None, "Expected a JSON object"
+            continue
+        yield line_no, row, ""
+
+
+def _insert_batch(reports: list[Report]) -> list[Report]:
+    for report in reports:
+        report.search_tokens = report.compute_search_tokens()
+    with transaction.atomic():
+        created = Report.objects.bulk_create(reports)
+        for report in created:
+            report._remember_matching_state()
+        index_new_reports(created)
+        enqueue_matching_batch(created)
+        refresh_user_counters({report.reported_by_id for report in created})
+    bump_browse_version()
+    return created
+
+
+def import_reports(
+    stream,
+    fmt: str,
+    reported_by,
+    batch_size: int = 500,
+    progress: Callable[[ImportResult], None] | None = None,
+) -> ImportResult:
+    """Import reports from ``stream`` on behalf of ``reported_by``.
+
+    Invalid rows are skipped and listed in ``result.errors``; valid rows are
+    still imported. ``progress`` is called with the running result after
+    every batch.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    result = ImportResult()
+    context = ReportImportSerializer.build_context()
+    pending: list[Report] = []
+
+    def flush():
+        result.created += len(_insert_batch(pending))
+        result.batches += 1
+        pending.clear()
+        if progress:
+            progress(result)
+
+    for line_no, row, error in iter_rows(stream, fmt):
+        result.rows += 1
+        if row is None:
+            result.errors.append((line_no, {"non_field_errors": [error]}))
+            continue
+        serializer = ReportImportSerializer(data=row, context=context)
+        if not serializer.is_valid():
+            result.errors.append((line_no, serializer.errors))
+            continue
+        pending.append(Report(reported_by=reported_by, **serializer.validated_data))
+        if len(pending) >= batch_size:
+            flush()
+    if pending:
+        flush()
+    return result
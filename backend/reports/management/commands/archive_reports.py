@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from reports.archive import archivable_reports, archive_reports
+
+
+class Command(BaseCommand):
+    help = 'Move claimed and long-pending reports, with their matches, into the archive tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Reports moved per transaction')
+        parser.add_argument('--pending-days', type=int, help='Archive pending reports older than this (default: REPORTS_ARCHIVE_PENDING_DAYS)')
+        parser.add_argument('--claimed-days', type=int, help='Archive claimed reports untouched this long (default: REPORTS_ARCHIVE_CLAIMED_DAYS)')
+        parser.add_argument('--limit', type=int, help='Stop after this many reports')
+        parser.add_argument('--dry-run', action='store_true', help='Only count eligible reports')
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            count = archivable_reports(options['pending_days'], options['claimed_days']).count()
+            self.stdout.write(f'[dry run] {count} reports would be archived')
+            return
+
+        def progress(stats):
+            self.stdout.write(f'Batch {stats.batches}: {stats.reports} reports, {stats.matches} matches archived')
+
+        stats = archive_reports(
+            batch_size=options['batch_size'],
+            pending_days=options['pending_days'],
+            claimed_days=options['claimed_days'],
+            limit=options['limit'],
+            progress=progress,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {stats.reports} reports and {stats.matches} matches in {stats.batches} batches'
+        ))
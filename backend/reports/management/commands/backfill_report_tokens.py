@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from reports.models import Report
+
+
+class Command(BaseCommand):
+    help = 'Compute the normalized search_tokens column for existing reports'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--all', action='store_true', help='Recompute rows that already have tokens')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        reports = Report.objects.only('id', 'title', 'description', 'search_tokens').order_by('id')
+        if not options['all']:
+            reports = reports.filter(search_tokens='')
+
+        updated = 0
+        last_id = 0
+        while True:
+            # Walk the table by primary key so each chunk is a fresh, bounded query.
+            chunk = list(reports.filter(id__gt=last_id)[:batch_size])
+            if not chunk:
+                break
+            last_id = chunk[-1].id
+
+            changed = []
+            for report in chunk:
+                tokens = report.compute_search_tokens()
+                if tokens != report.search_tokens:
+                    report.search_tokens = tokens
+                    changed.append(report)
+            if changed:
+                Report.objects.bulk_update(changed, ['search_tokens'])
+                updated += len(changed)
+            self.stdout.write(f'Processed reports up to id {last_id} ({updated} updated)')
+
+        self.stdout.write(self.style.SUCCESS(f'Backfilled search tokens for {updated} reports'))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from reports.benchmark import run_list_benchmark
+
+
+class Command(BaseCommand):
+    help = 'Compare report list rendering rows/sec: DRF serializer vs the values() fast path'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reports', type=int, default=5000, help='Synthetic reports to generate')
+        parser.add_argument('--rows', type=int, default=1000, help='Rows rendered per run')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per path; the best is kept')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        results = run_list_benchmark(options['reports'], options['rows'], options['repeat'], options['seed'])
+        for result in results:
+            self.stdout.write(
+                f"{','.join(result['fields'])}: {result['rows']} rows, "
+                f"serializer {result['serializer_rows_per_sec']} rows/s, "
+                f"fast path {result['fast_rows_per_sec']} rows/s ({result['speedup']}x)"
+            )
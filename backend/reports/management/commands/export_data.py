@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+from reports.export import EXPORTS, FORMATS, export_lines
+
+
+class Command(BaseCommand):
+    help = 'Stream reports or matches as NDJSON or CSV to a file or stdout'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=EXPORTS)
+        parser.add_argument('--format', choices=FORMATS, default='ndjson')
+        parser.add_argument('--output', help='File to write; defaults to stdout')
+        parser.add_argument('--chunk-size', type=int, help='Rows fetched per database round trip')
+        parser.add_argument('--type', help='Reports only: lost or found')
+        parser.add_argument('--category', help='Category id')
+        parser.add_argument('--status')
+        parser.add_argument('--q', help='Reports only: search text')
+        parser.add_argument('--min-confidence', help='Matches only')
+        parser.add_argument('--since', help='Created on or after YYYY-MM-DD')
+        parser.add_argument('--until', help='Created on or before YYYY-MM-DD')
+
+    def handle(self, *args, **options):
+        params = {
+            'type': options['type'],
+            'category': options['category'],
+            'status': options['status'],
+            'q': options['q'],
+            'min_confidence': options['min_confidence'],
+            'created_at__date__gte': options['since'],
+            'created_at__date__lte': options['until'],
+        }
+        params = {key: value for key, value in params.items() if value}
+        try:
+            lines = export_lines(options['kind'], params, options['format'], options['chunk_size'])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        if options['output']:
+            with open(options['output'], 'w', newline='') as handle:
+                written = 0
+                for line in lines:
+                    handle.write(line)
+                    written += 1
+            # The CSV header is a line but not a row.
+            rows = written - 1 if options['format'] == 'csv' else written
+            self.stderr.write(self.style.SUCCESS(f"Exported {rows} {options['kind']} to {options['output']}"))
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
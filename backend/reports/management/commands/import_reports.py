@@ -0,0 +1,42 @@
+import sys
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from reports.importer import FORMATS, detect_format, import_reports
+
+
+class Command(BaseCommand):
+    help = 'Import reports from a CSV or NDJSON file ("-" for stdin) in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to import, or - for stdin')
+        parser.add_argument('--user', required=True, help='Username recorded as reporter of every row')
+        parser.add_argument('--format', choices=FORMATS, help='Defaults to the file extension')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        try:
+            user = get_user_model().objects.get(username=options['user'])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"Unknown user {options['user']!r}")
+        path = options['path']
+        fmt = options['format'] or detect_format(path)
+        if fmt is None:
+            raise CommandError('Cannot tell the format from the file name; pass --format')
+
+        def progress(result):
+            self.stdout.write(
+                f'Batch {result.batches}: {result.created} created, {len(result.errors)} rejected, {result.rows} rows read'
+            )
+
+        if path == '-':
+            result = import_reports(sys.stdin, fmt, user, options['batch_size'], progress)
+        else:
+            with open(path, 'rb') as stream:
+                result = import_reports(stream, fmt, user, options['batch_size'], progress)
+
+        for line, errors in result.errors:
+            messages = '; '.join(f'{field}: {" ".join(map(str, msgs))}' for field, msgs in errors.items())
+            self.stderr.write(f'  line {line}: {messages}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {result.created} of {result.rows} rows in {result.batches} batches ({len(result.errors)} rejected)'
+        ))
@@ -0,0 +1,13 @@
+from django.db import connection
+from django.core.management.base import BaseCommand
+from reports.search import install_fts
+
+
+class Command(BaseCommand):
+    help = 'Create or repair the SQLite FTS5 search index for reports and re-index every row'
+
+    def handle(self, *args, **options):
+        if install_fts(connection):
+            self.stdout.write(self.style.SUCCESS('Rebuilt the report full-text index'))
+        else:
+            self.stdout.write(self.style.WARNING('FTS5 is not available on this database; ?q= uses the token filter'))
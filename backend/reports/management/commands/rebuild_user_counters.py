@@ -0,0 +1,34 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from reports.counters import COUNTER_FIELDS, compute_user_counters, save_user_counters
+from users.models import UserCounters
+
+
+class Command(BaseCommand):
+    help = 'Recompute every per-user dashboard counters row and report the ones that had drifted'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Users recomputed per pass')
+        parser.add_argument('--dry-run', action='store_true', help='Only report drift')
+
+    def handle(self, *args, **options):
+        user_ids = get_user_model().objects.order_by('id').values_list('id', flat=True)
+        users = drifted = 0
+        last_id = 0
+        while True:
+            batch = list(user_ids.filter(id__gt=last_id)[:options['batch_size']])
+            if not batch:
+                break
+            last_id = batch[-1]
+            stored = {row['user_id']: row for row in UserCounters.objects.filter(user_id__in=batch).values('user_id', *COUNTER_FIELDS)}
+            values = compute_user_counters(batch)
+            for user_id, counts in values.items():
+                row = stored.get(user_id)
+                if row is None or any(row[name] != counts[name] for name in COUNTER_FIELDS):
+                    drifted += 1
+            if not options['dry_run']:
+                save_user_counters(values)
+            users += len(batch)
+
+        prefix = '[dry run] ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(f'{prefix}Checked {users} users, {drifted} counters rows missing or drifted'))
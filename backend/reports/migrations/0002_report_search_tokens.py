@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:56
+
+from django.db import migrations, models
+from reports.tokens import serialize_tokens, tokenize
+
+
+def fill_search_tokens(apps, schema_editor):
+    # The token search fallback only sees reports with search_tokens set.
+    Report = apps.get_model('reports', 'Report')
+    batch = []
+    for report in Report.objects.only('id', 'title', 'description').iterator(chunk_size=500):
+        report.search_tokens = serialize_tokens(tokenize(f'{report.title} {report.description}'))
+        batch.append(report)
+        if len(batch) >= 500:
+            Report.objects.bulk_update(batch, ['search_tokens'])
+            batch = []
+    Report.objects.bulk_update(batch, ['search_tokens'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='report',
+            name='search_tokens',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(fill_search_tokens, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+from reports.search import drop_fts, install_fts
+
+
+def install(apps, schema_editor):
+    install_fts(schema_editor.connection)
+
+
+def uninstall(apps, schema_editor):
+    drop_fts(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0003_report_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
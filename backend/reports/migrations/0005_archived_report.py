@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 05:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0003_category_updated_at'),
+        ('reports', '0004_report_fts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedReport',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('report_type', models.CharField(choices=[('lost', 'Lost'), ('found', 'Found')], max_length=8)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('matched', 'Matched'), ('claimed', 'Claimed'), ('unclaimed', 'Unclaimed')], max_length=16)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='reports/')),
+                ('location', models.TextField()),
+                ('date_lost_found', models.DateField()),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='items.category')),
+                ('reported_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_reports', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['reported_by', 'created_at'], name='archived_owner_created_idx')],
+            },
+        ),
+    ]
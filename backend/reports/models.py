@@ -2,9 +2,13 @@ from __future__ import annotations
 from django.conf import settings
 from django.db import models
 from items.models import Category
+from .tokens import serialize_tokens, tokenize
 
 
 class Report(models.Model):
+    # Fields whose edits can change which reports this one matches.
+    MATCHING_FIELDS = ("title", "description", "category_id", "date_lost_found", "search_tokens")
+
     class ReportType(models.TextChoices):
         LOST = "lost", "Lost"
         FOUND = "found", "Found"
@@ -26,8 +30,79 @@ class Report(models.Model):
     date_lost_found = models.DateField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Normalized title/description tokens, space separated and sorted.
+    search_tokens = models.TextField(blank=True, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            # Matching: equality on category/type/status, range on the date.
+            models.Index(fields=["category", "report_type", "status", "date_lost_found"], name="report_match_lookup_idx"),
+            # Browsing: newest first, optionally narrowed by one filter.
+            models.Index(fields=["created_at", "id"], name="report_created_idx"),
+            models.Index(fields=["report_type", "created_at"], name="report_type_created_idx"),
+            models.Index(fields=["status", "created_at"], name="report_status_created_idx"),
+            models.Index(fields=["category", "created_at"], name="report_category_created_idx"),
+            models.Index(fields=["reported_by", "created_at"], name="report_owner_created_idx"),
+        ]
+
+    def compute_search_tokens(self) -> str:
+        return serialize_tokens(tokenize(f"{self.title} {self.description}"))
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_matching_state()
+        return instance
+
+    def _remember_matching_state(self) -> None:
+        # Read __dict__ directly so deferred fields are skipped, not fetched.
+        self._matching_state = {f: self.__dict__[f] for f in self.MATCHING_FIELDS if f in self.__dict__}
+
+    def matching_changes(self) -> dict:
+        """Previous values of matching-relevant fields changed since load or last save."""
+        state = getattr(self, "_matching_state", None)
+        if state is None:
+            return {}
+        return {f: old for f, old in state.items() if getattr(self, f) != old}
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.search_tokens = self.compute_search_tokens()
+        elif {"title", "description"} & set(update_fields):
+            self.search_tokens = self.compute_search_tokens()
+            kwargs["update_fields"] = {*update_fields, "search_tokens"}
+        super().save(*args, **kwargs)
+        self._remember_matching_state()
 
     def __str__(self) -> str:  
         return f"{self.report_type}: {self.title}"
 
 
+class ArchivedReport(models.Model):
+    """A resolved or expired report moved out of the hot table by ``manage.py archive_reports``.
+
+    Keeps the original primary key so old links and archived matches still resolve.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=255)
+    description = models.TextField()
+    category = models.ForeignKey(Category, on_delete=models.PROTECT, related_name="+")
+    report_type = models.CharField(max_length=8, choices=Report.ReportType.choices)
+    status = models.CharField(max_length=16, choices=Report.Status.choices)
+    reported_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="archived_reports")
+    image = models.ImageField(upload_to="reports/", null=True, blank=True)
+    location = models.TextField()
+    date_lost_found = models.DateField()
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["reported_by", "created_at"], name="archived_owner_created_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.report_type}: {self.title} (archived)"
@@ -0,0 +1,100 @@
+from __future__ import annotations
+import base64
+import json
+from datetime import datetime
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class ReportPagination(PageNumberPagination):
+    """Page numbers by default; keyset pages on (created_at, id) when asked for.
+
+    ``?pagination=cursor`` starts keyset browsing and every response carries
+    ``next``/``previous`` links with an opaque ``cursor``. Keyset pages skip
+    the COUNT query and seek past the cursor instead of using OFFSET, so deep
+    pages cost the same as the first. Results are always newest first.
+    """
+
+    mode_query_param = "pagination"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = (
+            request.query_params.get(self.mode_query_param) == "cursor"
+            or self.cursor_query_param in request.query_params
+        )
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+
+        if cursor is None:
+            reverse = False
+        else:
+            created_at, pk, reverse = cursor
+            if reverse:
+                seek = Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+            else:
+                seek = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            queryset = queryset.filter(seek)
+        ordering = ("created_at", "id") if reverse else ("-created_at", "-id")
+        rows = list(queryset.order_by(*ordering)[:page_size + 1])
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+        self.page_rows = rows
+        # Walking backwards, "more" lies before the page and we came from after it.
+        self.has_next = cursor is not None if reverse else has_more
+        self.has_previous = has_more if reverse else cursor is not None
+        return rows
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if not self.has_next or not self.page_rows:
+            return None
+        return self.encode_cursor(self.page_rows[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        if not self.has_previous or not self.page_rows:
+            return None
+        return self.encode_cursor(self.page_rows[0], reverse=True)
+
+    def encode_cursor(self, report, reverse: bool) -> str:
+        # Pages hold model instances or, for the fast list path, values() dicts.
+        created_at, pk = (report["created_at"], report["id"]) if isinstance(report, dict) else (report.created_at, report.pk)
+        payload = {"c": created_at.isoformat(), "i": pk, "r": int(reverse)}
+        token = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        url = remove_query_param(self.base_url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+            return datetime.fromisoformat(payload["c"]), int(payload["i"]), bool(payload["r"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
@@ -0,0 +1,117 @@
+from __future__ import annotations
+from django.conf import settings
+from django.db import OperationalError, connections
+from django.db.models import Q, QuerySet
+from .tokens import tokenize
+
+
+FTS_TABLE = "reports_report_fts"
+
+# External-content FTS5 table over reports_report, kept in sync by triggers so
+# bulk_create and queryset.update() are covered too.
+INSTALL_SQL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description, location,
+        content='reports_report', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON reports_report BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description, location)
+        VALUES (new.id, new.title, new.description, new.location);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON reports_report BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description, location)
+        VALUES ('delete', old.id, old.title, old.description, old.location);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description, location ON reports_report BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description, location)
+        VALUES ('delete', old.id, old.title, old.description, old.location);
+        INSERT INTO {FTS_TABLE}(rowid, title, description, location)
+        VALUES (new.id, new.title, new.description, new.location);
+    END""",
+]
+REBUILD_SQL = f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+# bm25() column weights for title, description and location.
+RANK_WEIGHTS = (10.0, 4.0, 1.0)
+
+
+def install_fts(connection) -> bool:
+    """Create the FTS table and triggers, then index existing rows.
+
+    Idempotent, so it also restores triggers lost when a migration rebuilds
+    reports_report. Returns False where FTS5 is not available.
+    """
+    if connection.vendor != "sqlite":
+        return False
+    try:
+        with connection.cursor() as cursor:
+            for statement in INSTALL_SQL:
+                cursor.execute(statement)
+            cursor.execute(REBUILD_SQL)
+    except OperationalError:
+        # SQLite built without FTS5.
+        return False
+    return True
+
+
+def drop_fts(connection) -> None:
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        for statement in DROP_SQL:
+            cursor.execute(statement)
+
+
+def fts_enabled(using: str = "default") -> bool:
+    if getattr(settings, "REPORTS_SEARCH_BACKEND", "fts5") != "fts5":
+        return False
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        return cursor.fetchone() is not None
+
+
+def fts_query(q: str) -> str:
+    """AND of quoted prefix terms, e.g. ``"mac"* "pro"*``; empty if ``q`` has no terms."""
+    return " ".join(f'"{term}"*' for term in sorted(tokenize(q)))
+
+
+def token_filter(q: str) -> Q:
+    terms = tokenize(q)
+    if not terms:
+        return Q(title__icontains=q) | Q(description__icontains=q) | Q(location__icontains=q)
+    # Every term must appear in the precomputed token column; substring
+    # containment keeps partial words like "lap" matching "laptop".
+    token_match = Q()
+    for term in terms:
+        token_match &= Q(search_tokens__contains=term)
+    return token_match | Q(location__icontains=q)
+
+
+def search_reports(qs: QuerySet, q: str) -> QuerySet:
+    """Filter ``qs`` by ``q``, best matches first when the FTS5 index is in use.
+
+    Falls back to the token-column filter on other databases, when the
+    setting says so, or when ``q`` has no searchable terms.
+    """
+    match = fts_query(q)
+    if not match or not fts_enabled(qs.db):
+        return qs.filter(token_filter(q))
+    weights = ", ".join(str(w) for w in RANK_WEIGHTS)
+    # Join the FTS table so MATCH runs once and bm25() ranks the rows it
+    # returns; a correlated subquery would re-run MATCH per candidate row.
+    return qs.extra(
+        tables=[FTS_TABLE],
+        where=[f"{FTS_TABLE}.rowid = reports_report.id", f"{FTS_TABLE} MATCH %s"],
+        params=[match],
+        select={"search_rank": f"bm25({FTS_TABLE}, {weights})"},
+    ).order_by("search_rank", *qs.query.order_by)
@@ -1,9 +1,36 @@
 from __future__ import annotations
 from rest_framework import serializers
-from .models import Report
+from items.models import Category
+from .models import ArchivedReport, Report
 
 
-class ReportSerializer(serializers.ModelSerializer):
+def parse_fields(value: str | None, allowed) -> list[str] | None:
+    """Field names from a ``?fields=a,b`` sparse fieldset, in ``allowed`` order; None when absent."""
+    if not value:
+        return None
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = sorted(names - set(allowed))
+    if unknown:
+        raise serializers.ValidationError({"fields": f"Unknown field(s): {', '.join(unknown)}."})
+    return [name for name in allowed if name in names]
+
+
+def report_columns(fields) -> list[str]:
+    """``values()`` columns for serializer field names, e.g. ``category`` -> ``category_id``."""
+    return [Report._meta.get_field(name).attname for name in fields]
+
+
+class SparseFieldsMixin:
+    """Accept a ``fields`` argument that drops every other serializer field."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class ReportSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Report
         fields = [
@@ -23,9 +50,91 @@ class ReportSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "reported_by", "status", "created_at", "updated_at"]
 
 
+class ArchivedReportSerializer(serializers.ModelSerializer):
+    """Read-only view of an archived report, shaped like ``ReportSerializer`` plus ``archived``."""
+
+    archived = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArchivedReport
+        fields = [*ReportSerializer.Meta.fields, "archived", "archived_at"]
+        read_only_fields = fields
+
+    def get_archived(self, obj) -> bool:
+        return True
+
+
 class ReportListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Report
         fields = ["id", "title", "category", "report_type", "image", "location", "created_at"]
 
 
+# Fields whose values() column already is their representation.
+_PASSTHROUGH_FIELDS = (serializers.RelatedField, serializers.CharField, serializers.ChoiceField, serializers.IntegerField)
+
+
+def _row_converter(field):
+    if isinstance(field, _PASSTHROUGH_FIELDS):
+        return None
+    if isinstance(field, serializers.FileField):
+        model_field = Report._meta.get_field(field.source)
+        return lambda name: field.to_representation(model_field.attr_class(None, model_field, name))
+    return field.to_representation
+
+
+class ReportRowSerializer:
+    """List output built from ``values()`` rows without per-row serializer machinery.
+
+    Produces the same representation as ``ReportSerializer`` for ``fields``:
+    the field objects are bound once and only the ones that actually change a
+    value (dates, file URLs) are called per row.
+    """
+
+    def __init__(self, rows, fields, context=None):
+        template = ReportSerializer(context=context or {})
+        self.rows = rows
+        self.columns = [
+            (name, Report._meta.get_field(name).attname, _row_converter(template.fields[name])) for name in fields
+        ]
+
+    @property
+    def data(self) -> list[dict]:
+        columns = self.columns
+        return [
+            {
+                name: convert(row[column]) if convert is not None and row[column] is not None else row[column]
+                for name, column, convert in columns
+            }
+            for row in self.rows
+        ]
+
+
+class ReportImportSerializer(serializers.Serializer):
+    """One row of a bulk import.
+
+    ``category`` may be an id or a name. Categories are looked up once per
+    import through ``build_context`` rather than once per row.
+    """
+
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField()
+    category = serializers.CharField()
+    report_type = serializers.ChoiceField(choices=Report.ReportType.choices)
+    status = serializers.ChoiceField(choices=Report.Status.choices, required=False)
+    location = serializers.CharField()
+    date_lost_found = serializers.DateField()
+
+    @staticmethod
+    def build_context() -> dict:
+        categories = {}
+        for category in Category.objects.only("id", "name"):
+            categories[str(category.id)] = category
+            categories.setdefault(category.name.strip().lower(), category)
+        return {"categories": categories}
+
+    def validate_category(self, value):
+        category = self.context["categories"].get(value.strip().lower())
+        if category is None:
+            raise serializers.ValidationError(f"Unknown category {value!r}.")
+        return category
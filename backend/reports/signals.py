@@ -1,13 +1,94 @@
 from __future__ import annotations
-from django.db.models.signals import post_save
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
-from matches.services import run_matching_for_report
+from matches.jobs import enqueue_matching
+from matches.models import Match, MatchJob
+from matches.services import index_report, unindex_reports
+from notifications.models import Notification
+from .cache import bump_browse_version
+from .counters import report_owner_ids, schedule_counter_refresh
 from .models import Report
 
 
+_bulk_work_deferred = ContextVar("reports_bulk_work_deferred", default=False)
+
+
+@contextmanager
+def defer_bulk_work():
+    """Skip the per-row unindexing, browse cache bump and counter refresh on delete inside the block.
+
+    For bulk deletes whose caller does all three once for the whole batch.
+    """
+    token = _bulk_work_deferred.set(True)
+    try:
+        yield
+    finally:
+        _bulk_work_deferred.reset(token)
+
+
 @receiver(post_save, sender=Report)
 def trigger_matching(sender, instance: Report, created: bool, **kwargs):
+    index_report(instance)
     if created:
-        run_matching_for_report(instance)
+        enqueue_matching(instance)
+        return
+
+    changes = instance.matching_changes()
+    if "category_id" in changes or "date_lost_found" in changes:
+        enqueue_matching(instance, kind=MatchJob.Kind.RESCAN)
+    elif "search_tokens" in changes:
+        enqueue_matching(instance, kind=MatchJob.Kind.EDIT, previous_tokens=changes["search_tokens"])
+
+
+@receiver(pre_delete, sender=Report)
+def drop_from_token_index(sender, instance: Report, **kwargs):
+    # Cascades would drop the tokens but leave the document frequencies counting them.
+    if not _bulk_work_deferred.get():
+        unindex_reports([instance.pk])
+
+
+@receiver(post_save, sender=Report)
+@receiver(post_delete, sender=Report)
+def invalidate_browse_cache(sender, instance: Report, **kwargs):
+    if not _bulk_work_deferred.get():
+        bump_browse_version()
+
+
+def _deleted_user_ids(origin) -> set[int]:
+    """Users whose deletion caused this cascade; their counters rows are already gone."""
+    User = get_user_model()
+    if isinstance(origin, User):
+        return {origin.pk}
+    if getattr(origin, "model", None) is User:
+        return set(origin.values_list("pk", flat=True))
+    return set()
+
+
+@receiver(post_save, sender=Report)
+@receiver(post_delete, sender=Report)
+def update_report_owner_counters(sender, instance: Report, created: bool = False, **kwargs):
+    # Edits leave the report count alone.
+    if _bulk_work_deferred.get():
+        return
+    if created or kwargs["signal"] is post_delete:
+        schedule_counter_refresh({instance.reported_by_id} - _deleted_user_ids(kwargs.get("origin")))
+
+
+@receiver(post_save, sender=Match)
+@receiver(post_delete, sender=Match)
+def update_match_owner_counters(sender, instance: Match, **kwargs):
+    if _bulk_work_deferred.get():
+        return
+    owners = report_owner_ids([instance.lost_report_id, instance.found_report_id])
+    schedule_counter_refresh(owners - _deleted_user_ids(kwargs.get("origin")))
 
 
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def update_notification_counters(sender, instance: Notification, **kwargs):
+    if _bulk_work_deferred.get():
+        return
+    schedule_counter_refresh({instance.user_id} - _deleted_user_ids(kwargs.get("origin")))
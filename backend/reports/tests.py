@@ -1,13 +1,41 @@
 from __future__ import annotations
-from datetime import date
+from datetime import date, timedelta
 from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.contrib.auth import get_user_model
-from django.test import TransactionTestCase
+import csv
+import io
+import json
+import os
+import tempfile
+from unittest import skipUnless
+from unittest.mock import patch
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.test import TestCase, TransactionTestCase, override_settings
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from chat.models import Conversation, Message
 from items.models import Category
-from .models import Report
+from matches.models import ArchivedMatch, CategoryTokenStats, Match, MatchJob, ReportToken, TokenDocumentFrequency
+from notifications.models import Notification
+from users.models import UserCounters
+from matches.services import candidate_queryset, rebuild_token_index
+from .archive import archive_reports
+from .benchmark import run_list_benchmark
+from .cache import VERSION_KEY, browse_version
+from .counters import COUNTER_FIELDS, refresh_user_counters
+from .export import export_lines
+from .importer import import_reports
+from .models import ArchivedReport, Report
+from .search import drop_fts, fts_enabled, fts_query, search_reports
+from .serializers import ReportListSerializer, ReportSerializer
+from .views import ReportViewSet
 
 
 User = get_user_model()
@@ -295,3 +323,1177 @@ class ReportTests(APITestCase):
         self.assertEqual(Report.Status.MATCHED, "matched")
         self.assertEqual(Report.Status.CLAIMED, "claimed")
         self.assertEqual(Report.Status.UNCLAIMED, "unclaimed")
+
+
+class ReportSearchTokensTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.report = Report.objects.create(
+            title="Lost Laptop",
+            description="MacBook Pro lost in the library",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+
+    def test_tokens_computed_on_save(self):
+        # Tokens are normalized, de-duplicated and sorted
+        self.assertEqual(self.report.search_tokens, "laptop library lost macbook pro")
+
+        self.report.description = "Dell XPS"
+        self.report.save(update_fields=["description"])
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.search_tokens, "dell laptop lost xps")
+
+    def test_backfill_command(self):
+        from django.core.management import call_command
+        from io import StringIO
+
+        Report.objects.filter(pk=self.report.pk).update(search_tokens="")
+        out = StringIO()
+        call_command("backfill_report_tokens", "--batch-size", "1", stdout=out)
+
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.search_tokens, "laptop library lost macbook pro")
+        self.assertIn("Backfilled search tokens for 1 reports", out.getvalue())
+
+    def test_search_uses_token_column(self):
+        # Every term must match, in any order, including partial words
+        url = reverse("report-list")
+        response = self.client.get(f"{url}?q=pro macbook")
+        self.assertEqual(response.data["count"], 1)
+
+        response = self.client.get(f"{url}?q=mac")
+        self.assertEqual(response.data["count"], 1)
+
+        response = self.client.get(f"{url}?q=macbook dell")
+        self.assertEqual(response.data["count"], 0)
+
+
+class ReportSearchTokensMigrationTest(TransactionTestCase):
+    """Test that adding the search_tokens column fills it for existing reports."""
+
+    migrate_from = [
+        ("items", "0002_subcategory"),
+        ("matches", "0001_initial"),
+        ("notifications", "0001_initial"),
+        ("reports", "0001_initial"),
+    ]
+
+    def setUp(self):
+        self.executor = MigrationExecutor(connection)
+        self.migrate_to = [key for key in self.executor.loader.graph.leaf_nodes()]
+        self.executor.migrate(self.migrate_from)
+        self.old_apps = self.executor.loader.project_state(self.migrate_from).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+
+    def test_existing_reports_are_searchable(self):
+        user = self.old_apps.get_model("users", "User").objects.create(username="user1", email="user1@example.com")
+        category = self.old_apps.get_model("items", "Category").objects.create(name="Electronics")
+        report = self.old_apps.get_model("reports", "Report").objects.create(
+            title="Lost Laptop",
+            description="MacBook Pro lost in the library",
+            category=category,
+            report_type="lost",
+            reported_by=user,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4)
+        )
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+
+        self.assertEqual(Report.objects.get(pk=report.pk).search_tokens, "laptop library lost macbook pro")
+
+
+class ReportCursorPaginationTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.url = reverse("report-list")
+        for i in range(25):
+            Report.objects.create(
+                title=f"Report {i}",
+                description="Black umbrella",
+                category=self.category,
+                report_type=Report.ReportType.LOST if i % 2 else Report.ReportType.FOUND,
+                location="University Library",
+                date_lost_found=date(2025, 11, 4),
+                reported_by=self.user
+            )
+        # Ties on created_at must still page deterministically by id.
+        Report.objects.filter(title__in=["Report 10", "Report 11", "Report 12"]).update(created_at=timezone.now())
+        self.expected = list(Report.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+    def walk(self, url):
+        ids, pages = [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data)
+            ids.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+        return ids, pages
+
+    def test_walks_every_report_once(self):
+        ids, pages = self.walk(f"{self.url}?pagination=cursor")
+        self.assertEqual(ids, self.expected)
+        self.assertEqual([len(page["results"]) for page in pages], [10, 10, 5])
+        self.assertNotIn("count", pages[0])
+        self.assertIsNone(pages[0]["previous"])
+
+    def test_previous_link_returns_prior_page(self):
+        first = self.client.get(f"{self.url}?pagination=cursor").data
+        second = self.client.get(first["next"]).data
+        back = self.client.get(second["previous"]).data
+        self.assertEqual(back["results"], first["results"])
+        self.assertIsNone(back["previous"])
+        self.assertIsNotNone(back["next"])
+
+    def test_no_count_or_offset_queries(self):
+        first = self.client.get(f"{self.url}?pagination=cursor").data
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(first["next"])
+        # The conditional-GET validator aggregate is the only COUNT allowed.
+        sql = " ".join(q["sql"] for q in ctx.captured_queries if "validator_count" not in q["sql"]).upper()
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_filters_apply_to_cursor_pages(self):
+        ids, _ = self.walk(f"{self.url}?pagination=cursor&type=lost")
+        lost = set(Report.objects.filter(report_type=Report.ReportType.LOST).values_list("id", flat=True))
+        self.assertEqual(ids, [pk for pk in self.expected if pk in lost])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f"{self.url}?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_numbers_remain_default(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 25)
+        self.assertEqual(len(response.data["results"]), 10)
+
+
+class ReportConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.report = Report.objects.create(
+            title="Lost Laptop",
+            description="MacBook Pro lost in the library",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+        self.list_url = reverse("report-list")
+        self.detail_url = reverse("report-detail", kwargs={"pk": self.report.pk})
+
+    def revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_unchanged_list_returns_304_without_serializing(self):
+        first = self.client.get(self.list_url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn("Last-Modified", first)
+
+        # Only the validator aggregate runs; no page query, count or serialization.
+        with self.assertNumQueries(1):
+            second = self.revalidate(self.list_url, first)
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_if_modified_since(self):
+        first = self.client.get(self.detail_url)
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_edits_and_deletes_change_validators(self):
+        first = self.client.get(self.list_url)
+        self.report.title = "Lost Chromebook"
+        self.report.save()
+        edited = self.revalidate(self.list_url, first)
+        self.assertEqual(edited.status_code, status.HTTP_200_OK)
+
+        other = Report.objects.create(
+            title="Found Keys",
+            description="Car keys",
+            category=self.category,
+            report_type=Report.ReportType.FOUND,
+            location="Gym",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+        before_delete = self.client.get(self.list_url)
+        Report.objects.filter(pk=other.pk).delete()
+        self.assertEqual(self.revalidate(self.list_url, before_delete).status_code, status.HTTP_200_OK)
+
+    def test_malformed_pk_is_not_found(self):
+        self.client.force_authenticate(user=self.user)
+        for name in ["report-detail", "match-detail", "category-detail"]:
+            response = self.client.get(reverse(name, kwargs={"pk": "abc"}))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, name)
+
+    def test_query_string_and_user_are_part_of_etag(self):
+        first = self.client.get(self.list_url)
+        filtered = self.client.get(self.list_url, {"type": "lost"}, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(filtered.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.revalidate(self.list_url, first).status_code, status.HTTP_200_OK)
+
+    def test_dashboard_endpoints(self):
+        self.client.force_authenticate(user=self.user)
+        for name in ["dashboard-stats", "user-reports", "user-matches", "user-notifications"]:
+            url = reverse(name)
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, status.HTTP_200_OK, name)
+            self.assertEqual(self.revalidate(url, first).status_code, status.HTTP_304_NOT_MODIFIED, name)
+
+    def test_dashboard_notifications_follow_read_state(self):
+        self.client.force_authenticate(user=self.user)
+        notification = Notification.objects.create(user=self.user, message="Hello")
+        url = reverse("user-notifications")
+        first = self.client.get(url)
+
+        Notification.objects.filter(pk=notification.pk).update(is_read=True)
+        self.assertEqual(self.revalidate(url, first).status_code, status.HTTP_200_OK)
+
+    def test_dashboard_matches_follow_nested_reports(self):
+        self.client.force_authenticate(user=self.user)
+        found = Report.objects.create(
+            title="Found Laptop",
+            description="MacBook Pro",
+            category=self.category,
+            report_type=Report.ReportType.FOUND,
+            location="Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+        self.assertTrue(Match.objects.filter(lost_report=self.report, found_report=found).exists())
+        url = reverse("user-matches")
+        first = self.client.get(url)
+
+        found.title = "Found MacBook"
+        found.save()
+        self.assertEqual(self.revalidate(url, first).status_code, status.HTTP_200_OK)
+
+
+@override_settings(REPORTS_BROWSE_CACHE_TIMEOUT=60)
+class ReportBrowseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.report = self.create_report("Lost Laptop")
+        self.url = reverse("report-list")
+
+    def create_report(self, title):
+        return Report.objects.create(
+            title=title,
+            description="MacBook Pro lost in the library",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+
+    def test_anonymous_hit_skips_database(self):
+        first = self.client.get(self.url, {"type": "lost"})
+        self.assertEqual(first["X-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, {"type": "lost"})
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.data, first.data)
+
+    def test_key_uses_normalized_params(self):
+        self.client.get(f"{self.url}?type=lost&category={self.category.id}&q=")
+        response = self.client.get(f"{self.url}?category={self.category.id}&type=lost")
+        self.assertEqual(response["X-Cache"], "HIT")
+
+        response = self.client.get(f"{self.url}?type=found")
+        self.assertEqual(response["X-Cache"], "MISS")
+
+    def test_writes_invalidate(self):
+        self.client.get(self.url)
+        self.create_report("Found Keys")
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["count"], 2)
+
+        self.report.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["count"], 1)
+
+    def test_lost_version_key_does_not_revive_old_pages(self):
+        cache.delete(VERSION_KEY)
+        self.client.get(self.url)
+        self.create_report("Found Keys")
+        self.client.get(self.url)
+        # Culling or eviction drops the version key; a reseeded version must
+        # not land on one that pages were cached under before the write.
+        cache.delete(VERSION_KEY)
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["count"], 2)
+
+    def test_hit_answers_conditional_request(self):
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_authenticated_requests_bypass_cache(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+        self.assertNotIn("X-Cache", response)
+
+    @override_settings(REPORTS_BROWSE_CACHE_TIMEOUT=0)
+    def test_timeout_zero_disables(self):
+        self.client.get(self.url)
+        self.assertNotIn("X-Cache", self.client.get(self.url))
+
+    def test_file_backend(self):
+        with tempfile.TemporaryDirectory() as location:
+            caches = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location}}
+            with override_settings(CACHES=caches):
+                self.client.get(self.url)
+                self.assertEqual(self.client.get(self.url)["X-Cache"], "HIT")
+                self.create_report("Found Keys")
+                self.assertEqual(self.client.get(self.url)["X-Cache"], "MISS")
+
+
+@skipUnless(connection.vendor == "sqlite", "FTS5 search is SQLite specific")
+class ReportFullTextSearchTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.url = reverse("report-list")
+        self.description_hit = self.create_report("Lost bag", "Black backpack with a MacBook inside")
+        self.title_hit = self.create_report("Lost MacBook Pro", "Silver laptop")
+        self.create_report("Found Dell", "Dell laptop near the gym")
+
+    def create_report(self, title, description, location="University Library"):
+        return Report.objects.create(
+            title=title,
+            description=description,
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            location=location,
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+
+    def titles(self, q):
+        response = self.client.get(self.url, {"q": q})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [row["title"] for row in response.data["results"]]
+
+    def test_fts_query(self):
+        self.assertEqual(fts_query("MacBook, pro!"), '"macbook"* "pro"*')
+        self.assertEqual(fts_query("a"), "")
+
+    def test_results_ranked_by_relevance(self):
+        self.assertTrue(fts_enabled())
+        self.assertEqual(self.titles("macbook"), ["Lost MacBook Pro", "Lost bag"])
+
+    def test_match_runs_once_per_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.titles("macbook"), ["Lost MacBook Pro", "Lost bag"])
+        searches = [query["sql"] for query in ctx.captured_queries if "MATCH" in query["sql"]]
+        self.assertTrue(searches)
+        for sql in searches:
+            self.assertEqual(sql.count("MATCH"), 1, sql)
+
+        plan = search_reports(Report.objects.order_by("-created_at"), "macbook").explain()
+        self.assertIn("VIRTUAL TABLE INDEX", plan)
+        self.assertNotIn("CORRELATED", plan)
+
+    def test_prefix_and_all_terms(self):
+        self.assertEqual(self.titles("mac"), ["Lost MacBook Pro", "Lost bag"])
+        self.assertEqual(self.titles("laptop dell"), ["Found Dell"])
+        self.assertEqual(self.titles("macbook dell"), [])
+
+    def test_location_is_searchable(self):
+        self.create_report("Found keys", "Car keys", location="Chapel steps")
+        self.assertEqual(self.titles("chapel"), ["Found keys"])
+
+    def test_index_follows_updates_and_deletes(self):
+        Report.objects.filter(pk=self.title_hit.pk).update(title="Lost Chromebook")
+        self.assertEqual(self.titles("chromebook"), ["Lost Chromebook"])
+        self.assertEqual(self.titles("macbook"), ["Lost bag"])
+
+        self.description_hit.delete()
+        self.assertEqual(self.titles("macbook"), [])
+
+    @override_settings(REPORTS_SEARCH_BACKEND="tokens")
+    def test_setting_selects_token_filter(self):
+        self.assertFalse(fts_enabled())
+        # Substring matching only exists in the token filter.
+        self.assertEqual(self.titles("acbook"), ["Lost MacBook Pro", "Lost bag"])
+
+    def test_falls_back_without_fts_table(self):
+        drop_fts(connection)
+        self.assertFalse(fts_enabled())
+        self.assertEqual(sorted(self.titles("macbook")), ["Lost MacBook Pro", "Lost bag"])
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN output is SQLite specific")
+class ReportQueryPlanTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.report = Report.objects.create(
+            title="Lost Laptop",
+            description="MacBook Pro lost in the library",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+
+    def browse_queryset(self, **params):
+        view = ReportViewSet()
+        view.request = Request(APIRequestFactory().get("/api/reports/", params))
+        view.action = "list"
+        view.format_kwarg = None
+        return view.get_queryset()[:10]
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(f"USING INDEX {index_name}", plan)
+        self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plan)
+        for line in plan.splitlines():
+            if "SCAN reports_report" in line:
+                self.assertIn("USING", line, f"full table scan in plan:\n{plan}")
+
+    def test_matching_candidates_use_lookup_index(self):
+        self.assertUsesIndex(candidate_queryset(self.report, 14), "report_match_lookup_idx")
+
+    def test_indexed_matching_candidates_avoid_full_scan(self):
+        queryset = candidate_queryset(self.report, 14).filter(
+            id__in=ReportToken.objects.filter(category_id=self.category.id, token__in=["laptop"]).values("report_id")
+        )
+        self.assertUsesIndex(queryset, "report_match_lookup_idx")
+
+    def test_browse_newest_first(self):
+        self.assertUsesIndex(self.browse_queryset(), "report_created_idx")
+
+    def test_browse_by_type(self):
+        self.assertUsesIndex(self.browse_queryset(type="lost"), "report_type_created_idx")
+
+    def test_browse_by_status(self):
+        self.assertUsesIndex(self.browse_queryset(status="pending"), "report_status_created_idx")
+
+    def test_browse_by_category(self):
+        self.assertUsesIndex(self.browse_queryset(category=self.category.id), "report_category_created_idx")
+
+    def test_owner_reports(self):
+        queryset = Report.objects.filter(reported_by=self.user).order_by("-created_at")
+        self.assertUsesIndex(queryset, "report_owner_created_idx")
+
+
+class ReportFacetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.electronics = Category.objects.create(name="Electronics")
+        self.books = Category.objects.create(name="Books")
+        self.create_report("Lost Laptop", self.electronics, Report.ReportType.LOST)
+        self.create_report("Found Phone", self.electronics, Report.ReportType.FOUND)
+        self.create_report("Lost Textbook", self.books, Report.ReportType.LOST, Report.Status.CLAIMED)
+        self.url = reverse("report-facets")
+
+    def create_report(self, title, category, report_type, status=Report.Status.PENDING):
+        return Report.objects.create(
+            title=title,
+            description="Left behind in the library",
+            category=category,
+            report_type=report_type,
+            status=status,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+
+    def counts(self, facet):
+        return {entry.get("value", entry.get("id")): entry["count"] for entry in facet}
+
+    def test_facets_unfiltered(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total"], 3)
+        self.assertEqual(self.counts(response.data["category"]), {self.electronics.id: 2, self.books.id: 1})
+        self.assertEqual(self.counts(response.data["report_type"]), {"lost": 2, "found": 1})
+        self.assertEqual(self.counts(response.data["status"])["pending"], 2)
+        self.assertEqual(self.counts(response.data["status"])["matched"], 0)
+
+    def test_facet_ignores_its_own_selection(self):
+        response = self.client.get(self.url, {"type": "lost"})
+        self.assertEqual(response.data["total"], 2)
+        # Type counts still show the other option; categories only count lost reports.
+        self.assertEqual(self.counts(response.data["report_type"]), {"lost": 2, "found": 1})
+        self.assertEqual(self.counts(response.data["category"]), {self.electronics.id: 1, self.books.id: 1})
+
+    def test_facets_respect_search(self):
+        response = self.client.get(self.url, {"q": "laptop"})
+        self.assertEqual(response.data["total"], 1)
+        self.assertEqual(self.counts(response.data["category"]), {self.electronics.id: 1})
+
+    def test_facets_single_query(self):
+        with self.assertNumQueries(1):
+            self.client.get(self.url, {"category": self.electronics.id})
+
+    @override_settings(REPORTS_FACETS_CACHE_TIMEOUT=30)
+    def test_cached_until_report_write(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        self.create_report("Found Charger", self.books, Report.ReportType.FOUND)
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["total"], 4)
+
+
+class ReportImportTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="security",
+            email="security@example.com",
+            password="testpass123",
+            role="admin"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.lost = Report.objects.create(
+            title="Lost Black Laptop",
+            description="Black laptop with stickers",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+
+    def ndjson(self, *rows):
+        return io.BytesIO("".join(json.dumps(row) + "\n" for row in rows).encode())
+
+    def row(self, title, **extra):
+        return {
+            "title": title,
+            "description": "Black laptop with stickers",
+            "category": str(self.category.id),
+            "report_type": "found",
+            "location": "Security Office",
+            "date_lost_found": "2025-11-05",
+            **extra,
+        }
+
+    def test_imports_in_batches_and_matches(self):
+        stream = self.ndjson(self.row("Found Black Laptop"), self.row("Found Laptop Bag"), self.row("Found Charger"))
+        batches = []
+        result = import_reports(stream, "ndjson", self.user, batch_size=2, progress=lambda r: batches.append(r.created))
+
+        self.assertEqual((result.rows, result.created, result.batches), (3, 3, 2))
+        self.assertEqual(batches, [2, 3])
+        found = Report.objects.get(title="Found Black Laptop")
+        self.assertTrue(found.search_tokens)
+        self.assertTrue(ReportToken.objects.filter(report=found).exists())
+        self.assertTrue(Match.objects.filter(lost_report=self.lost, found_report=found).exists())
+
+    def test_bad_rows_are_reported_and_skipped(self):
+        stream = io.BytesIO(
+            (json.dumps(self.row("Found Black Laptop")) + "\nnot json\n"
+             + json.dumps(self.row("Found Phone", report_type="stolen")) + "\n").encode()
+        )
+        result = import_reports(stream, "ndjson", self.user)
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual([line for line, _ in result.errors], [2, 3])
+        self.assertIn("report_type", result.errors[1][1])
+
+    def test_malformed_csv_and_encoding_become_line_errors(self):
+        stream = io.BytesIO(
+            b"title,description,category,report_type,location,date_lost_found\n"
+            b"Found Phone,Cracked screen,electronics,found,Gym,2025-11-05\n"
+            b"Found Mug,Blue \0mug,electronics,found,Gym,2025-11-05\n"
+            b"Found Keys,Car keys,electronics,found,Gym,2025-11-05\n"
+            b"Found Caf\xe9 Card,Loyalty card,electronics,found,Gym,2025-11-05\n"
+            b"Found Wallet,Brown,electronics,found,Gym,2025-11-05\n"
+        )
+        result = import_reports(stream, "csv", self.user)
+
+        self.assertEqual(result.created, 2)
+        self.assertEqual([line for line, _ in result.errors], [3, 5])
+        self.assertIn("Invalid UTF-8", result.errors[1][1]["non_field_errors"][0])
+
+        stream = io.BytesIO(json.dumps(self.row("Found Phone")).encode() + b"\n\xff\n")
+        result = import_reports(stream, "ndjson", self.user)
+        self.assertEqual(result.created, 1)
+        self.assertEqual([line for line, _ in result.errors], [2])
+
+    @override_settings(MATCHING_QUEUE_MODE="queue")
+    def test_index_work_is_batched(self):
+        def queries(rows):
+            stream = self.ndjson(*(self.row(f"Found Laptop {i}") for i in range(rows)))
+            with CaptureQueriesContext(connection) as ctx:
+                import_reports(stream, "ndjson", self.user)
+            return len(ctx)
+
+        self.assertEqual(queries(3), queries(6))
+        frequencies = set(TokenDocumentFrequency.objects.values_list("category_id", "token", "doc_count"))
+        stats = list(CategoryTokenStats.objects.values_list("category_id", "document_count", "total_tokens"))
+        rebuild_token_index()
+        self.assertEqual(set(TokenDocumentFrequency.objects.values_list("category_id", "token", "doc_count")), frequencies)
+        self.assertEqual(list(CategoryTokenStats.objects.values_list("category_id", "document_count", "total_tokens")), stats)
+
+    def test_csv_category_by_name(self):
+        stream = io.BytesIO(
+            b"title,description,category,report_type,location,date_lost_found\n"
+            b"Found Phone,Cracked screen,electronics,found,Gym,2025-11-05\n"
+        )
+        result = import_reports(stream, "csv", self.user)
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual(Report.objects.get(title="Found Phone").category, self.category)
+
+    @override_settings(MATCHING_QUEUE_MODE="queue")
+    def test_queue_mode_writes_one_job_per_report(self):
+        import_reports(self.ndjson(self.row("Found Phone"), self.row("Found Charger")), "ndjson", self.user)
+        self.assertEqual(MatchJob.objects.filter(report__title__startswith="Found").count(), 2)
+        self.assertFalse(Match.objects.exists())
+
+    def test_import_invalidates_browse_cache(self):
+        version = browse_version()
+        import_reports(self.ndjson(self.row("Found Phone")), "ndjson", self.user)
+        self.assertGreater(browse_version(), version)
+
+    def test_command(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".ndjson", delete=False) as handle:
+            handle.write(json.dumps(self.row("Found Phone")) + "\n")
+        self.addCleanup(os.remove, handle.name)
+        out = io.StringIO()
+        call_command("import_reports", handle.name, user="security", stdout=out, stderr=io.StringIO())
+
+        self.assertIn("Imported 1 of 1 rows", out.getvalue())
+        self.assertTrue(Report.objects.filter(title="Found Phone", reported_by=self.user).exists())
+
+
+@override_settings(MATCHING_QUEUE_MODE="queue")
+class ReportExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.laptop = self.create_report("Lost Laptop", Report.ReportType.LOST)
+        self.phone = self.create_report("Found Phone", Report.ReportType.FOUND)
+
+    def create_report(self, title, report_type):
+        return Report.objects.create(
+            title=title,
+            description="Left in the library",
+            category=self.category,
+            report_type=report_type,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+
+    def test_search_filter_and_small_chunks(self):
+        lines = list(export_lines("reports", {"q": "laptop"}, "ndjson", chunk_size=1))
+        self.assertEqual([json.loads(line)["id"] for line in lines], [self.laptop.id])
+
+        lines = list(export_lines("reports", {}, "ndjson", chunk_size=1))
+        self.assertEqual([json.loads(line)["id"] for line in lines], [self.laptop.id, self.phone.id])
+
+    def test_rows_are_not_model_instances(self):
+        with CaptureQueriesContext(connection) as queries:
+            list(export_lines("reports", {}, "csv"))
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("COUNT", queries[0]["sql"].upper())
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            export_lines("users", {}, "csv")
+
+    def test_command_csv(self):
+        out = io.StringIO()
+        call_command("export_data", "reports", format="csv", type="found", stdout=out)
+
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual([row["title"] for row in rows], ["Found Phone"])
+
+
+@override_settings(MATCHING_QUEUE_MODE="queue")
+class ReportSparseFieldsTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.report = Report.objects.create(
+            title="Lost Laptop",
+            description="MacBook Pro lost in the library",
+            category=self.category,
+            report_type=Report.ReportType.LOST,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+        Report.objects.filter(pk=self.report.pk).update(image="reports/laptop.png")
+        self.url = reverse("report-list")
+
+    def test_fast_list_matches_serializer(self):
+        response = self.client.get(self.url)
+        request = response.wsgi_request
+        expected = ReportListSerializer(
+            Report.objects.order_by("-created_at"), many=True, context={"request": Request(request)}
+        ).data
+        self.assertEqual(response.data["results"], [dict(row) for row in expected])
+        self.assertTrue(response.data["results"][0]["image"].startswith("http://testserver/"))
+
+    def test_all_fields_match_detail_serializer(self):
+        fields = ",".join(ReportSerializer.Meta.fields)
+        response = self.client.get(self.url, {"fields": fields})
+        expected = ReportSerializer(
+            Report.objects.get(pk=self.report.pk), context={"request": Request(response.wsgi_request)}
+        ).data
+        self.assertEqual(response.data["results"][0], dict(expected))
+
+    def test_list_fields_narrow_output_and_sql(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {"fields": "title,id"})
+        self.assertEqual(response.data["results"], [{"id": self.report.id, "title": "Lost Laptop"}])
+        page_sql = [q["sql"] for q in queries if "LIMIT" in q["sql"]][-1]
+        self.assertNotIn('"description"', page_sql)
+        self.assertNotIn('"location"', page_sql)
+
+    def test_fields_with_cursor_pagination(self):
+        response = self.client.get(self.url, {"fields": "title", "pagination": "cursor"})
+        self.assertEqual(response.data["results"], [{"title": "Lost Laptop"}])
+        self.assertIsNone(response.data["next"])
+
+    def test_retrieve_fields(self):
+        response = self.client.get(reverse("report-detail", args=[self.report.id]), {"fields": "id,status"})
+        self.assertEqual(response.data, {"id": self.report.id, "status": "pending"})
+
+    def test_unknown_field_rejected(self):
+        response = self.client.get(self.url, {"fields": "title,password"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("password", str(response.data["fields"]))
+
+    def test_list_benchmark_rolls_back(self):
+        before = Report.objects.count()
+        results = run_list_benchmark(50, limit=20, repeat=1)
+        self.assertEqual([result["rows"] for result in results], [20, 20])
+        self.assertGreater(results[1]["fast_rows_per_sec"], 0)
+        self.assertEqual(Report.objects.count(), before)
+
+
+class ReportFindMatchesTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.lost = self.create_report("Lost Black Laptop", Report.ReportType.LOST)
+        self.url = reverse("report-find-matches", kwargs={"pk": self.lost.pk})
+        self.client.force_authenticate(user=self.user)
+
+    def create_report(self, title, report_type):
+        return Report.objects.create(
+            title=title,
+            description="Black laptop with stickers",
+            category=self.category,
+            report_type=report_type,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+
+    def test_runs_rematch_and_returns_matches(self):
+        found = self.create_report("Found Black Laptop", Report.ReportType.FOUND)
+        Match.objects.all().delete()
+
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["triggered"])
+        self.assertFalse(response.data["queued"])
+        self.assertEqual([m["found_report"] for m in response.data["matches"]], [found.id])
+
+    def test_repeat_click_is_memoized(self):
+        self.client.post(self.url)
+        with patch("matches.jobs.rematch_edited_report") as rematch:
+            response = self.client.post(self.url)
+        rematch.assert_not_called()
+        self.assertFalse(response.data["triggered"])
+
+    def test_candidate_pool_change_reruns(self):
+        self.client.post(self.url)
+        self.create_report("Found Laptop Charger", Report.ReportType.FOUND)
+        response = self.client.post(self.url)
+        self.assertTrue(response.data["triggered"])
+
+    @override_settings(REPORTS_FIND_MATCHES_RATE="1/hour")
+    def test_rate_limit_counts_only_runs(self):
+        self.assertTrue(self.client.post(self.url).data["triggered"])
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_200_OK)
+
+        self.create_report("Found Laptop Charger", Report.ReportType.FOUND)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @override_settings(MATCHING_QUEUE_MODE="queue")
+    def test_queue_mode_enqueues_one_rescan(self):
+        response = self.client.post(self.url)
+        self.assertTrue(response.data["queued"])
+        self.client.post(self.url)
+        self.assertEqual(MatchJob.objects.filter(report=self.lost, kind=MatchJob.Kind.RESCAN).count(), 1)
+
+    @override_settings(MATCHING_QUEUE_MODE="queue")
+    def test_failed_or_stuck_job_is_rerun(self):
+        self.client.post(self.url)
+        MatchJob.objects.filter(report=self.lost).update(status=MatchJob.Status.FAILED)
+        response = self.client.post(self.url)
+        self.assertTrue(response.data["triggered"])
+        self.assertTrue(response.data["queued"])
+
+        MatchJob.objects.filter(report=self.lost, status=MatchJob.Status.QUEUED).update(
+            status=MatchJob.Status.RUNNING, locked_at=timezone.now() - timedelta(hours=1)
+        )
+        self.assertTrue(self.client.post(self.url).data["triggered"])
+        self.assertFalse(self.client.post(self.url).data["triggered"])
+        self.assertEqual(MatchJob.objects.filter(report=self.lost, kind=MatchJob.Kind.RESCAN).count(), 3)
+
+    def test_non_owner_is_forbidden(self):
+        self.create_report("Found Black Laptop", Report.ReportType.FOUND)
+        other = User.objects.create_user(
+            username="other",
+            email="other@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.client.force_authenticate(user=other)
+        with patch("matches.jobs.rematch_edited_report") as rematch:
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertNotIn("matches", response.data)
+        rematch.assert_not_called()
+
+        admin = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="testpass123",
+            role="admin"
+        )
+        self.client.force_authenticate(user=admin)
+        self.assertEqual(self.client.post(self.url).status_code, status.HTTP_200_OK)
+
+
+class ReportArchiveTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.other = User.objects.create_user(
+            username="other",
+            email="other@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.lost = self.create_report("Lost Black Laptop", Report.ReportType.LOST)
+        self.found = self.create_report("Found Black Laptop", Report.ReportType.FOUND)
+        self.match = Match.objects.get(lost_report=self.lost, found_report=self.found)
+
+    def create_report(self, title, report_type):
+        return Report.objects.create(
+            title=title,
+            description="Black laptop with stickers",
+            category=self.category,
+            report_type=report_type,
+            location="University Library",
+            date_lost_found=date(2025, 11, 4),
+            reported_by=self.user
+        )
+
+    def test_claimed_report_moves_with_its_matches(self):
+        Report.objects.filter(pk=self.lost.pk).update(status=Report.Status.CLAIMED)
+        notifications = Notification.objects.filter(related_match=self.match)
+        notification_ids = list(notifications.values_list("id", flat=True))
+        self.assertTrue(notification_ids)
+
+        stats = archive_reports(batch_size=1)
+
+        self.assertEqual((stats.reports, stats.matches), (1, 1))
+        self.assertFalse(Report.objects.filter(pk=self.lost.pk).exists())
+        self.assertTrue(Report.objects.filter(pk=self.found.pk).exists())
+        archived = ArchivedReport.objects.get(pk=self.lost.pk)
+        self.assertEqual((archived.title, archived.status), ("Lost Black Laptop", Report.Status.CLAIMED))
+        self.assertEqual(ArchivedMatch.objects.get(pk=self.match.pk).found_report_id, self.found.pk)
+        self.assertFalse(Match.objects.exists())
+        # Notifications outlive the match they pointed at.
+        self.assertEqual(Notification.objects.filter(id__in=notification_ids, related_match=None).count(), len(notification_ids))
+
+    def test_expired_pending_reports_leave_the_token_index(self):
+        Report.objects.filter(pk=self.found.pk).update(created_at=timezone.now() - timedelta(days=200))
+        stats_before = CategoryTokenStats.objects.get(category=self.category).document_count
+
+        stats = archive_reports(pending_days=180)
+
+        self.assertEqual(stats.reports, 1)
+        self.assertFalse(ReportToken.objects.filter(report_id=self.found.pk).exists())
+        self.assertEqual(CategoryTokenStats.objects.get(category=self.category).document_count, stats_before - 1)
+        self.assertTrue(Report.objects.filter(pk=self.lost.pk).exists())
+
+    def test_command_dry_run_and_limit(self):
+        Report.objects.update(status=Report.Status.CLAIMED)
+        out = io.StringIO()
+        call_command("archive_reports", dry_run=True, stdout=out)
+        self.assertIn("2 reports would be archived", out.getvalue())
+        self.assertEqual(Report.objects.count(), 2)
+
+        call_command("archive_reports", limit=1, stdout=out)
+        self.assertEqual(ArchivedReport.objects.count(), 1)
+
+    def test_reports_with_conversations_stay_live(self):
+        Report.objects.update(status=Report.Status.CLAIMED)
+        conversation = Conversation.objects.create(
+            lost_report=self.lost, lost_user=self.user, found_user=self.other
+        )
+        Message.objects.create(conversation=conversation, sender=self.other, content="Is this yours?")
+
+        stats = archive_reports()
+
+        self.assertEqual(stats.reports, 1)
+        self.assertTrue(Report.objects.filter(pk=self.lost.pk).exists())
+        self.assertTrue(ArchivedReport.objects.filter(pk=self.found.pk).exists())
+        self.assertEqual(Message.objects.filter(conversation=conversation).count(), 1)
+
+    def test_batch_bumps_cache_and_refreshes_counters_once(self):
+        Report.objects.update(status=Report.Status.CLAIMED)
+        with patch("reports.archive.bump_browse_version") as bump, \
+                patch("reports.signals.bump_browse_version") as row_bump, \
+                patch("reports.archive.refresh_user_counters", wraps=refresh_user_counters) as refresh, \
+                patch("reports.signals.schedule_counter_refresh") as row_refresh:
+            stats = archive_reports()
+
+        self.assertEqual((stats.reports, stats.batches), (2, 1))
+        bump.assert_called_once()
+        row_bump.assert_not_called()
+        refresh.assert_called_once()
+        row_refresh.assert_not_called()
+        counters = UserCounters.objects.get(user=self.user)
+        self.assertEqual((counters.total_reports, counters.active_matches), (0, 0))
+
+    def test_owner_reads_archived_report(self):
+        Report.objects.filter(pk=self.lost.pk).update(status=Report.Status.CLAIMED)
+        archive_reports()
+        url = reverse("report-detail", args=[self.lost.pk])
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["archived"])
+        self.assertEqual([m["id"] for m in response.data["matches"]], [self.match.pk])
+
+        response = self.client.get(reverse("report-archived"))
+        self.assertEqual([r["id"] for r in response.data["results"]], [self.lost.pk])
+
+        self.client.force_authenticate(user=self.other)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.get(reverse("report-archived")).data["results"], [])
+
+
+class UserCountersTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.other = User.objects.create_user(
+            username="other",
+            email="other@example.com",
+            password="testpass123",
+            role="student"
+        )
+        self.category = Category.objects.create(name="Electronics")
+        self.url = reverse("dashboard-stats")
+
+    def create_report(self, title, report_type, user):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Report.objects.create(
+                title=title,
+                description="Black laptop with stickers",
+                category=self.category,
+                report_type=report_type,
+                location="University Library",
+                date_lost_found=date(2025, 11, 4),
+                reported_by=user
+            )
+
+    def counters(self, user):
+        return UserCounters.objects.values(*COUNTER_FIELDS).get(user=user)
+
+    def test_counters_follow_reports_matches_and_notifications(self):
+        lost = self.create_report("Lost Black Laptop", Report.ReportType.LOST, self.user)
+        self.create_report("Found Black Laptop", Report.ReportType.FOUND, self.other)
+        self.assertEqual(
+            self.counters(self.user),
+            {"total_reports": 1, "active_matches": 1, "resolved_items": 0, "unread_notifications": 1},
+        )
+
+        match = Match.objects.get(lost_report=lost)
+        with self.captureOnCommitCallbacks(execute=True):
+            match.status = Match.Status.CONFIRMED
+            match.save()
+            # update() bypasses signals; the next refresh for the user picks it up.
+            Notification.objects.filter(user=self.user).update(is_read=True)
+            notification = Notification.objects.create(user=self.user, message="hello")
+        self.assertEqual(
+            self.counters(self.other),
+            {"total_reports": 1, "active_matches": 0, "resolved_items": 1, "unread_notifications": 1},
+        )
+        self.assertEqual(self.counters(self.user)["unread_notifications"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            notification.delete()
+            lost.delete()
+        self.assertEqual(self.counters(self.user), dict.fromkeys(COUNTER_FIELDS, 0))
+
+    def test_match_between_own_reports_counts_once(self):
+        self.create_report("Lost Black Laptop", Report.ReportType.LOST, self.user)
+        self.create_report("Found Black Laptop", Report.ReportType.FOUND, self.user)
+        self.assertEqual(self.counters(self.user)["active_matches"], 1)
+        self.assertEqual(self.counters(self.user)["total_reports"], 2)
+
+    def test_dashboard_stats_is_one_lookup(self):
+        self.create_report("Lost Black Laptop", Report.ReportType.LOST, self.user)
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data, {
+            "total_reports": 1, "active_matches": 0, "resolved_items": 0, "notifications": 0
+        })
+
+    def test_dashboard_stats_creates_missing_row(self):
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["total_reports"], 0)
+        self.assertTrue(UserCounters.objects.filter(user=self.other).exists())
+
+    def test_import_updates_counters(self):
+        row = {
+            "title": "Found Phone", "description": "Cracked screen", "category": str(self.category.id),
+            "report_type": "found", "location": "Gym", "date_lost_found": "2025-11-05",
+        }
+        import_reports(io.BytesIO((json.dumps(row) + "\n").encode()), "ndjson", self.other)
+        self.assertEqual(self.counters(self.other)["total_reports"], 1)
+
+    def test_rebuild_command_repairs_drift(self):
+        self.create_report("Lost Black Laptop", Report.ReportType.LOST, self.user)
+        UserCounters.objects.filter(user=self.user).update(total_reports=7)
+        UserCounters.objects.filter(user=self.other).delete()
+
+        out = io.StringIO()
+        call_command("rebuild_user_counters", dry_run=True, stdout=out)
+        self.assertIn("2 counters rows missing or drifted", out.getvalue())
+        self.assertEqual(self.counters(self.user)["total_reports"], 7)
+
+        call_command("rebuild_user_counters", stdout=out)
+        self.assertEqual(self.counters(self.user)["total_reports"], 1)
+        self.assertEqual(self.counters(self.other), dict.fromkeys(COUNTER_FIELDS, 0))
+
+    def test_deleting_user_refreshes_the_other_owner(self):
+        self.create_report("Lost Black Laptop", Report.ReportType.LOST, self.user)
+        self.create_report("Found Black Laptop", Report.ReportType.FOUND, self.other)
+        self.assertEqual(self.counters(self.other)["active_matches"], 1)
+
+        user_id = self.user.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        self.assertEqual(self.counters(self.other)["active_matches"], 0)
+        self.assertFalse(UserCounters.objects.filter(user_id=user_id).exists())
+
+    def test_signal_refresh_waits_for_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            Notification.objects.create(user=self.user, message="hello")
+            self.assertFalse(UserCounters.objects.filter(user=self.user).exists())
+        self.assertEqual(len(callbacks), 1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            callbacks[0]()
+        self.assertEqual(self.counters(self.user)["unread_notifications"], 1)
+        if connection.features.has_select_for_update:
+            self.assertIn("FOR UPDATE", ctx.captured_queries[0]["sql"])
+
+    def test_refresh_skips_deleted_users(self):
+        user_id = self.user.pk
+        self.user.delete()
+        self.assertEqual([row.user_id for row in refresh_user_counters([user_id, self.other.pk])], [self.other.pk])
@@ -0,0 +1,16 @@
+from __future__ import annotations
+from django.conf import settings
+from rest_framework.throttling import UserRateThrottle
+
+
+class FindMatchesThrottle(UserRateThrottle):
+    """Per-user limit on on-demand re-match runs.
+
+    Checked by hand only when a re-match would actually run, so memoized
+    answers never use up the allowance.
+    """
+
+    scope = "find_matches"
+
+    def get_rate(self):
+        return getattr(settings, "REPORTS_FIND_MATCHES_RATE", "10/hour")
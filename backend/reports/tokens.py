@@ -0,0 +1,14 @@
+from __future__ import annotations
+import re
+
+
+STOPWORDS = {"the", "a", "an", "and", "or", "with", "of", "in", "on", "for", "to"}
+
+
+def tokenize(text: str) -> set[str]:
+    tokens = set(re.findall(r"[a-z0-9]+", (text or "").lower()))
+    return {t for t in tokens if t not in STOPWORDS and len(t) > 1}
+
+
+def serialize_tokens(tokens: set[str]) -> str:
+    return " ".join(sorted(tokens))
@@ -1,15 +1,30 @@
 from __future__ import annotations
+from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
-from rest_framework import permissions, viewsets, decorators, response
+from django.http import Http404
+from rest_framework import exceptions, permissions, viewsets, decorators, response
+from config.conditional import ConditionalGetMixin
+from matches.jobs import enqueue_matching, job_failed_or_stuck
+from matches.models import Match, MatchJob
+from matches.serializers import MatchSerializer
+from matches.services import OPEN_STATUSES, matching_state_version
 from users.permissions import IsOwnerOrAdmin
+from .archive import archived_matches, archived_reports_for
+from .cache import browse_cache_key, cached_browse_response
+from .facets import report_facets
+from .filters import filter_reports
 from .models import Report
-from .serializers import ReportListSerializer, ReportSerializer
+from .pagination import ReportPagination
+from .serializers import ArchivedReportSerializer, ReportListSerializer, ReportRowSerializer, ReportSerializer, parse_fields, report_columns
+from .throttling import FindMatchesThrottle
 
 
-class ReportViewSet(viewsets.ModelViewSet):
+class ReportViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Report.objects.all().order_by("-created_at")
     serializer_class = ReportSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = ReportPagination
 
     def get_permissions(self):
         if self.action in ["update", "partial_update", "destroy"]:
@@ -21,40 +36,106 @@ class ReportViewSet(viewsets.ModelViewSet):
             return ReportListSerializer
         return ReportSerializer
 
+    def list(self, request, *args, **kwargs):
+        return cached_browse_response(request, lambda: super(ReportViewSet, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            # Archived reports stay readable at their old URL for owners and admins.
+            pk = str(kwargs.get(self.lookup_url_kwarg or self.lookup_field, ""))
+            archived = archived_reports_for(request.user).filter(pk=pk).first() if pk.isdigit() else None
+            if archived is None:
+                raise
+        data = ArchivedReportSerializer(archived, context=self.get_serializer_context()).data
+        data["matches"] = archived_matches(archived.pk)
+        return response.Response(data)
+
+    @decorators.action(detail=False, methods=["get"], permission_classes=[permissions.IsAuthenticated])
+    def archived(self, request):
+        """The current user's archived reports (every archived report for admins), newest first."""
+        page = self.paginate_queryset(archived_reports_for(request.user))
+        serializer = ArchivedReportSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
+
     def perform_create(self, serializer):
         instance = serializer.save(reported_by=self.request.user)
         return instance
 
-    def get_queryset(self):
-        qs = super().get_queryset()
-        report_type = self.request.query_params.get("type")
-        category = self.request.query_params.get("category")
-        status_param = self.request.query_params.get("status")
-        q = self.request.query_params.get("q")
-        
-        # Date range filtering
-        date_from = self.request.query_params.get("created_at__date__gte")
-        date_to = self.request.query_params.get("created_at__date__lte")
-        
-        if report_type in {"lost", "found"}:
-            qs = qs.filter(report_type=report_type)
-        if category:
-            qs = qs.filter(category_id=category)
-        if status_param:
-            qs = qs.filter(status=status_param)
-        if q:
-            qs = qs.filter(Q(title__icontains=q) | Q(description__icontains=q) | Q(location__icontains=q))
-        
-        # Apply date range filters
-        if date_from:
-            qs = qs.filter(created_at__date__gte=date_from)
-        if date_to:
-            qs = qs.filter(created_at__date__lte=date_to)
-            
+    def requested_fields(self) -> list[str] | None:
+        return parse_fields(self.request.query_params.get("fields"), ReportSerializer.Meta.fields)
+
+    def get_serializer(self, *args, **kwargs):
+        # Lists are rendered from values() rows, see paginate_queryset.
+        if self.action == "list" and kwargs.get("many"):
+            fields = self.requested_fields() or ReportListSerializer.Meta.fields
+            return ReportRowSerializer(args[0], fields, context=self.get_serializer_context())
+        if self.action == "retrieve":
+            kwargs.setdefault("fields", self.requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def paginate_queryset(self, queryset):
+        if self.action == "list":
+            fields = self.requested_fields() or ReportListSerializer.Meta.fields
+            # id and created_at are what keyset cursors are made of.
+            queryset = queryset.values(*dict.fromkeys([*report_columns(fields), "id", "created_at"]))
+        return super().paginate_queryset(queryset)
+
+    def get_queryset(self, apply_facets: bool = True):
+        qs = filter_reports(super().get_queryset(), self.request.query_params, apply_facets)
+        if self.action == "retrieve" and (fields := self.requested_fields()):
+            qs = qs.only(*fields)
         return qs
 
-    @decorators.action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated])
+    @decorators.action(detail=False, methods=["get"])
+    def facets(self, request):
+        """Filter-chip counts for the current filter set, cached until the next report write."""
+        timeout = getattr(settings, "REPORTS_FACETS_CACHE_TIMEOUT", 30)
+        key = browse_cache_key(request, "facets")
+        data = cache.get(key) if timeout else None
+        if data is None:
+            data = report_facets(self.get_queryset(apply_facets=False), request.query_params)
+            if timeout:
+                cache.set(key, data, timeout)
+        return response.Response(data)
+
+    @decorators.action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated, IsOwnerOrAdmin])
     def find_matches(self, request, pk=None):
-        return response.Response({"triggered": True})
+        """Re-match this report on demand and return its current matches.
+
+        The re-match is memoized against ``matching_state_version``: while the
+        report, its candidate pool and the settings are unchanged, repeat
+        requests skip it (``triggered`` is false) and are not rate limited.
+        Actual runs count against ``FindMatchesThrottle``. Outside ``sync``
+        mode the re-match is queued and ``queued`` stays true until it ran; if
+        that job fails or gets stuck, the next request runs it again.
+        Only the report's owner and admins may call it.
+        """
+        report = self.get_object()
+        key = f"reports:find-matches:{report.pk}:{matching_state_version(report)}"
+        memo = cache.get(key)
+        job = None
+        if memo and memo.get("job"):
+            job = MatchJob.objects.filter(pk=memo["job"]).only("status", "locked_at", "run_after").first()
+            # A queued run only counts once it finished; a failed or stuck one is retried.
+            if job is None or job_failed_or_stuck(job):
+                memo = job = None
+        triggered = memo is None and report.status in OPEN_STATUSES
+        if triggered:
+            throttle = FindMatchesThrottle()
+            if not throttle.allow_request(request, self):
+                raise exceptions.Throttled(throttle.wait())
+            job = enqueue_matching(report, kind=MatchJob.Kind.RESCAN)
+            memo = {"job": job.pk if job else None}
+            cache.set(key, memo, getattr(settings, "REPORTS_FIND_MATCHES_CACHE_TIMEOUT", 86400))
+
+        queued = job is not None and job.status in (MatchJob.Status.QUEUED, MatchJob.Status.RUNNING)
+        matches = Match.objects.filter(Q(lost_report=report) | Q(found_report=report)).order_by("-confidence_score", "id")
+        return response.Response({
+            "triggered": triggered,
+            "queued": queued,
+            "matches": MatchSerializer(matches, many=True).data,
+        })
 
 
@@ -19,3 +19,21 @@ class User(AbstractUser):
         return self.username
 
 
+
+
+class UserCounters(models.Model):
+    """Denormalized dashboard counts for one user.
+
+    Kept in step with reports, matches and notifications by
+    ``reports.counters``; ``manage.py rebuild_user_counters`` repairs drift.
+    """
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="counters")
+    total_reports = models.PositiveIntegerField(default=0)
+    active_matches = models.PositiveIntegerField(default=0)
+    resolved_items = models.PositiveIntegerField(default=0)
+    unread_notifications = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Counters for {self.user_id}"